@@ -226,6 +226,11 @@ def main():
     
     main_window.agregar_tab(ayuda_frame, "❓", "Ayuda")
     
+    def al_cerrar():
+        storage.cerrar()
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", al_cerrar)
+    
     root.mainloop()
 
 if __name__ == '__main__':
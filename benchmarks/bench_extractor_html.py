@@ -0,0 +1,91 @@
+"""
+Benchmark: extracción de definiciones de WordReference
+
+Compara, sobre las páginas guardadas en benchmarks/fixtures/, el método
+anterior (árbol completo con BeautifulSoup + html.parser) con el extractor
+incremental de src/integrations/extractor_html.py. Mide tiempo por página
+y memoria máxima (tracemalloc).
+
+Las páginas se entregan en fragmentos de 8 KB, como llegan con
+response.iter_content(8192); el método anterior recibe la página entera.
+
+Uso:
+    python benchmarks/bench_extractor_html.py [repeticiones]
+
+Requiere beautifulsoup4 solo para medir el método anterior.
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.integrations import extractor_html
+from src.integrations.extractor_html import extraer_definiciones
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+FRAGMENTO = 8192
+
+
+def arbol_completo(contenido):
+    """Método anterior de SpanishDictionary._lookup_alternative"""
+    soup = BeautifulSoup(contenido, 'html.parser')
+    definiciones = []
+    for ol in soup.find_all('ol'):
+        for li in ol.find_all('li')[:5]:
+            text = li.get_text(strip=True)
+            if text and len(text) > 10:
+                definiciones.append(text)
+    return definiciones
+
+
+def incremental(contenido):
+    fragmentos = (contenido[i:i + FRAGMENTO] for i in range(0, len(contenido), FRAGMENTO))
+    return extraer_definiciones(fragmentos, 'utf-8')
+
+
+def medir(funcion, contenido, repeticiones):
+    """Tiempo medio (ms), memoria máxima (KB) y resultado"""
+    funcion(contenido)   # Calentamiento
+
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion(contenido)
+    tiempo = (time.perf_counter() - inicio) / repeticiones * 1000
+
+    tracemalloc.start()
+    funcion(contenido)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tiempo, pico / 1024, resultado
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    metodos = [('incremental (' + extractor_html.BACKEND + ')', incremental)]
+    if BeautifulSoup is not None:
+        metodos.insert(0, ('BeautifulSoup html.parser', arbol_completo))
+    else:
+        print("beautifulsoup4 no instalado: solo se mide el extractor incremental\n")
+
+    print(f"{'Página':<46}{'Método':<30}{'ms':>9}{'KB pico':>11}{'Defs':>6}")
+    print('-' * 102)
+    for pagina in sorted(FIXTURES.glob('*.html')):
+        contenido = pagina.read_bytes()
+        nombre = f"{pagina.name} ({len(contenido) // 1024} KB)"
+        for metodo, funcion in metodos:
+            tiempo, pico, resultado = medir(funcion, contenido, repeticiones)
+            print(f"{nombre:<46}{metodo:<30}{tiempo:>9.2f}{pico:>11.0f}{len(resultado):>6}")
+            nombre = ''
+    print()
+
+
+if __name__ == '__main__':
+    main()
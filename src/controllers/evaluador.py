@@ -0,0 +1,154 @@
+"""Evaluador de Respuestas - Corrección con alternativas y tolerancia a erratas"""
+import re
+from src.utils import normalizar_texto
+
+_SEPARADORES = re.compile(r'[/,;]')
+_PARENTESIS = re.compile(r'\([^)]*\)')
+_ESPACIOS = re.compile(r'\s+')
+
+
+class EvaluadorRespuestas:
+    """
+    Corrige respuestas contra el conjunto de alternativas aceptadas.
+
+    Cada significado se separa una sola vez en alternativas normalizadas
+    ("ser/estar" -> {"ser", "estar"}) y se guarda en caché por palabra;
+    la caché se invalida cuando el storage notifica un cambio. Una
+    respuesta exacta se resuelve con una búsqueda en un conjunto y las
+    erratas se toleran con una distancia de edición acotada.
+    """
+
+    def __init__(self, storage, tolerancia=True):
+        """
+        Args:
+            storage: HybridStorage con el vocabulario
+            tolerancia: Aceptar respuestas con pocas erratas
+        """
+        self.storage = storage
+        self.tolerancia = tolerancia
+        self._cache = {}   # palabra -> (alternativas de la palabra, alternativas del significado)
+
+        storage.suscribir(self._on_cambio_vocabulario)
+
+    def aceptadas(self, palabra, modo):
+        """
+        Conjunto de respuestas aceptadas para una palabra
+
+        Args:
+            palabra: Palabra del vocabulario
+            modo: 'ingles' (se responde el significado) o 'espanol' (la palabra)
+        """
+        entrada = self._cache.get(palabra)
+        if entrada is None:
+            formas = self.storage.obtener_normalizado(palabra)
+            if formas is None:
+                datos = self.storage.obtener_palabra(palabra)
+                if datos is None:
+                    return frozenset()
+                formas = (normalizar_texto(palabra), normalizar_texto(datos.get('significado', '')))
+            entrada = (separar_alternativas(formas[0]), separar_alternativas(formas[1]))
+            self._cache[palabra] = entrada
+        return entrada[1] if modo == 'ingles' else entrada[0]
+
+    def evaluar(self, palabra, modo, respuesta):
+        """Verificar una respuesta del usuario para una palabra"""
+        return self.comparar(self.aceptadas(palabra, modo), respuesta)
+
+    def comparar(self, aceptadas, respuesta):
+        """
+        Verificar una respuesta contra un conjunto de alternativas aceptadas
+
+        Si el usuario escribe varias alternativas ("ser, estar") todas
+        deben ser válidas.
+        """
+        if not aceptadas:
+            return False
+        respuesta = normalizar_texto(respuesta)
+        if not respuesta:
+            return False
+        if respuesta in aceptadas:
+            return True
+
+        partes = separar_alternativas(respuesta)
+        if not partes:
+            return False
+        return all(self._acepta(aceptadas, parte) for parte in partes)
+
+    def _acepta(self, aceptadas, parte):
+        if parte in aceptadas:
+            return True
+        if not self.tolerancia:
+            return False
+        limite = erratas_permitidas(parte)
+        if limite == 0:
+            return False
+        return any(distancia_acotada(parte, alternativa, limite) <= limite
+                   for alternativa in aceptadas)
+
+    def _on_cambio_vocabulario(self, palabra, existe):
+        self._cache.pop(palabra, None)
+
+
+def separar_alternativas(texto):
+    """
+    Separar un texto normalizado en alternativas: 'tomar (algo), llevar'
+    -> {'tomar (algo)', 'tomar', 'llevar'}
+    """
+    alternativas = set()
+    for parte in _SEPARADORES.split(texto):
+        parte = _ESPACIOS.sub(' ', parte).strip()
+        if not parte:
+            continue
+        alternativas.add(parte)
+        # Las aclaraciones entre paréntesis son opcionales
+        sin_parentesis = _ESPACIOS.sub(' ', _PARENTESIS.sub('', parte)).strip()
+        if sin_parentesis:
+            alternativas.add(sin_parentesis)
+    return frozenset(alternativas)
+
+
+def erratas_permitidas(texto):
+    """Erratas toleradas según la longitud de la respuesta"""
+    if len(texto) <= 3:
+        return 0
+    if len(texto) <= 7:
+        return 1
+    return 2
+
+
+def distancia_acotada(a, b, limite):
+    """
+    Distancia de Levenshtein limitada a una banda de ancho 2*limite+1.
+
+    Devuelve limite + 1 en cuanto se sabe que la distancia supera el
+    límite, sin terminar de recorrer las cadenas.
+    """
+    if abs(len(a) - len(b)) > limite:
+        return limite + 1
+    if len(a) > len(b):
+        a, b = b, a
+
+    fuera = limite + 1
+    previa = [j if j <= limite else fuera for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        desde = max(1, i - limite)
+        hasta = min(len(b), i + limite)
+        actual = [fuera] * (len(b) + 1)
+        if i <= limite:
+            actual[0] = i
+        minimo = actual[0]
+        ca = a[i - 1]
+        for j in range(desde, hasta + 1):
+            costo = previa[j - 1] + (ca != b[j - 1])
+            if previa[j] + 1 < costo:
+                costo = previa[j] + 1
+            if actual[j - 1] + 1 < costo:
+                costo = actual[j - 1] + 1
+            actual[j] = costo if costo < fuera else fuera
+            if actual[j] < minimo:
+                minimo = actual[j]
+        # Toda la banda supera el límite: no puede mejorar
+        if minimo > limite:
+            return fuera
+        previa = actual
+    return previa[len(b)]
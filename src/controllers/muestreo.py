@@ -0,0 +1,200 @@
+"""Muestreo por Dificultad - Selección ponderada de palabras para práctica"""
+import random
+import time
+from src.utils import a_timestamp
+
+SEGUNDOS_DIA = 86400
+
+class MuestreoDificultad:
+    """
+    Elige palabras al azar con probabilidad proporcional a su dificultad.
+
+    El peso de cada palabra combina su tasa de error y el tiempo desde la
+    última práctica (datos de progreso_palabras). Los pesos viven en un
+    árbol de Fenwick: sortear una palabra y actualizar el peso de la palabra
+    respondida cuestan O(log n), sin reconstruir la estructura.
+    """
+
+    DIAS_RECENCIA = 7          # Días sin practicar que duplican el peso
+    FACTOR_RECENCIA_MAX = 3.0
+    PESO_MINIMO = 0.05         # Ninguna palabra deja de aparecer del todo
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.conteos = {}      # palabra -> [vistas, incorrectas, ultima_practica]
+        self._slot = {}        # palabra -> posición en el árbol (1..capacidad)
+        self._palabras = [None]
+        self._pesos = [0.0]
+        self._arbol = [0.0]
+        self._libres = []
+
+        self.cargar()
+        storage.suscribir(self._on_cambio_vocabulario, self._on_renombrar)
+
+    def cargar(self):
+        """Construir los pesos desde el vocabulario y el progreso guardado"""
+        progreso = {p['palabra']: p for p in self.storage.obtener_todo_progreso()}
+
+        self.conteos.clear()
+        self._slot.clear()
+        self._libres = []
+        self._palabras = [None]
+        self._pesos = [0.0]
+
+        for palabra in self.storage.obtener_todas_palabras():
+            fila = progreso.get(palabra)
+            if fila:
+                self.conteos[palabra] = [
+                    fila['veces_vista'] or 0,
+                    fila['veces_incorrecta'] or 0,
+                    a_timestamp(fila['ultima_practica'])
+                ]
+            else:
+                self.conteos[palabra] = [0, 0, 0]
+            self._slot[palabra] = len(self._palabras)
+            self._palabras.append(palabra)
+            self._pesos.append(self._peso(palabra))
+
+        self._reconstruir(max(16, len(self._palabras)))
+
+    def siguiente(self, evitar=None):
+        """
+        Sortear una palabra según su peso
+
+        Args:
+            evitar: Palabra a no repetir (la anterior) si hay alternativas
+
+        Returns:
+            Palabra o None si no hay vocabulario disponible
+        """
+        slot_evitado = self._slot.get(evitar)
+        peso_evitado = 0.0
+        if slot_evitado is not None and len(self._slot) > 1:
+            peso_evitado = self._pesos[slot_evitado]
+            self._actualizar(slot_evitado, 0.0)
+
+        try:
+            total = self._suma(len(self._arbol) - 1)
+            if total <= 0:
+                return None
+            return self._palabras[self._buscar(random.random() * total)]
+        finally:
+            if peso_evitado:
+                self._actualizar(slot_evitado, peso_evitado)
+
+    def devolver(self, palabra, aplazar=True):
+        """Las palabras no salen del árbol al sortearlas: nada que devolver"""
+
+    def registrar_respuesta(self, palabra, correcta):
+        """Actualizar los conteos de una palabra respondida y su peso"""
+        conteo = self.conteos.get(palabra)
+        if conteo is None:
+            return
+        conteo[0] += 1
+        if not correcta:
+            conteo[1] += 1
+        conteo[2] = time.time()
+        self._actualizar(self._slot[palabra], self._peso(palabra))
+
+    def probabilidad(self, palabra):
+        """Probabilidad actual de sortear una palabra"""
+        slot = self._slot.get(palabra)
+        total = self._suma(len(self._arbol) - 1)
+        if slot is None or total <= 0:
+            return 0.0
+        return self._pesos[slot] / total
+
+    # ========== INTERNOS ==========
+
+    def _peso(self, palabra, ahora=None):
+        """Tasa de error suavizada por la recencia de la última práctica"""
+        vistas, incorrectas, ultima = self.conteos[palabra]
+        tasa_error = (incorrectas + 1) / (vistas + 2)
+        if ultima:
+            dias = max(0.0, ((ahora or time.time()) - ultima) / SEGUNDOS_DIA)
+            recencia = min(self.FACTOR_RECENCIA_MAX, 1 + dias / self.DIAS_RECENCIA)
+        else:
+            recencia = self.FACTOR_RECENCIA_MAX
+        return max(self.PESO_MINIMO, tasa_error * recencia)
+
+    def _reconstruir(self, capacidad):
+        """Reconstruir el árbol en O(n) con la capacidad indicada"""
+        faltan = capacidad + 1 - len(self._pesos)
+        self._pesos.extend([0.0] * faltan)
+        self._palabras.extend([None] * faltan)
+
+        self._arbol = list(self._pesos)
+        self._arbol[0] = 0.0
+        for i in range(1, len(self._arbol)):
+            padre = i + (i & -i)
+            if padre < len(self._arbol):
+                self._arbol[padre] += self._arbol[i]
+
+        self._libres = [i for i in range(len(self._pesos) - 1, 0, -1) if self._palabras[i] is None]
+
+    def _actualizar(self, slot, peso):
+        """Cambiar el peso de un slot en O(log n)"""
+        delta = peso - self._pesos[slot]
+        self._pesos[slot] = peso
+        i = slot
+        while i < len(self._arbol):
+            self._arbol[i] += delta
+            i += i & -i
+
+    def _suma(self, slot):
+        """Suma de pesos de los slots 1..slot"""
+        total = 0.0
+        i = slot
+        while i > 0:
+            total += self._arbol[i]
+            i -= i & -i
+        return total
+
+    def _buscar(self, objetivo):
+        """Primer slot cuya suma acumulada supera 'objetivo' (descenso en O(log n))"""
+        slot = 0
+        paso = 1 << (len(self._arbol) - 1).bit_length()
+        while paso:
+            siguiente = slot + paso
+            if siguiente < len(self._arbol) and self._arbol[siguiente] <= objetivo:
+                slot = siguiente
+                objetivo -= self._arbol[siguiente]
+            paso >>= 1
+        slot += 1
+
+        # Protección ante errores de redondeo: caer en un slot con peso
+        if slot >= len(self._pesos) or self._pesos[slot] <= 0:
+            candidatos = [i for i in self._slot.values() if self._pesos[i] > 0]
+            slot = max(candidatos) if candidatos else 1
+        return slot
+
+    def _on_cambio_vocabulario(self, palabra, existe):
+        """Mantener los pesos sincronizados con altas y bajas del vocabulario"""
+        if existe:
+            if palabra in self._slot:
+                return
+            if not self._libres:
+                self._reconstruir(2 * (len(self._pesos) - 1))
+            slot = self._libres.pop()
+            self.conteos[palabra] = [0, 0, 0]
+            self._slot[palabra] = slot
+            self._palabras[slot] = palabra
+            self._actualizar(slot, self._peso(palabra))
+        else:
+            slot = self._slot.pop(palabra, None)
+            self.conteos.pop(palabra, None)
+            if slot is not None:
+                self._actualizar(slot, 0.0)
+                self._palabras[slot] = None
+                self._libres.append(slot)
+
+    def _on_renombrar(self, antigua, nueva):
+        """Conservar los conteos y el peso de una palabra renombrada"""
+        slot = self._slot.pop(antigua, None)
+        if slot is None:
+            return
+        if nueva in self._slot:
+            self._on_cambio_vocabulario(nueva, False)
+        self.conteos[nueva] = self.conteos.pop(antigua)
+        self._slot[nueva] = slot
+        self._palabras[slot] = nueva
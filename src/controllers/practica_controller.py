@@ -1,19 +1,33 @@
 """Controlador de Práctica - Lógica de quiz"""
-import random
+from src.utils import normalizar_texto
+from .programador_repaso import ProgramadorRepaso
+from .muestreo import MuestreoDificultad
+from .sesion_practica import SesionPractica
+from .evaluador import EvaluadorRespuestas
 
 class PracticaController:
     def __init__(self, storage):
         self.storage = storage
         self.palabra_actual = None
+        self.respondida = False
         self.modo = 'ingles'  # 'ingles' o 'espanol'
+        self.estrategia = 'repaso'  # 'repaso' o 'dificultad'
+        self.programador = ProgramadorRepaso(storage)
+        self.muestreo = MuestreoDificultad(storage)
+        self.evaluador = EvaluadorRespuestas(storage)
+        self.pregunta_actual = None
+        self.sesion = SesionPractica(self._sortear, self._construir_pregunta, self._devolver_sin_mostrar)
+        
+        storage.suscribir(self._on_cambio_vocabulario)
     
-    def obtener_palabra_aleatoria(self):
-        """Obtener palabra aleatoria para práctica"""
-        palabras = self.storage.obtener_todas_palabras()
-        if not palabras:
-            return None
+    def obtener_siguiente_palabra(self):
+        """Obtener la siguiente palabra según la estrategia activa"""
+        if self.palabra_actual and not self.respondida:
+            self.programador.devolver(self.palabra_actual)
         
-        self.palabra_actual = random.choice(list(palabras.keys()))
+        self.pregunta_actual = self.sesion.siguiente()
+        self.palabra_actual = self.pregunta_actual['palabra'] if self.pregunta_actual else None
+        self.respondida = False
         return self.palabra_actual
     
     def obtener_pregunta(self):
@@ -21,23 +35,11 @@ class PracticaController:
         if not self.palabra_actual:
             return None
         
-        palabras = self.storage.obtener_todas_palabras()
-        datos = palabras.get(self.palabra_actual, {})
-        
-        if self.modo == 'ingles':
-            return {
-                'pregunta': self.palabra_actual,
-                'respuesta_correcta': datos.get('significado', ''),
-                'pronunciacion': datos.get('pronunciacion', ''),
-                'notas': datos.get('notas', '')
-            }
-        else:
-            return {
-                'pregunta': datos.get('significado', ''),
-                'respuesta_correcta': self.palabra_actual,
-                'pronunciacion': datos.get('pronunciacion', ''),
-                'notas': datos.get('notas', '')
-            }
+        registro = self.pregunta_actual
+        if not registro or registro['palabra'] != self.palabra_actual or registro['modo'] != self.modo:
+            registro = self._construir_pregunta(self.palabra_actual)
+            self.pregunta_actual = registro
+        return registro
     
     def verificar_respuesta(self, respuesta_usuario):
         """Verificar si la respuesta es correcta"""
@@ -48,15 +50,20 @@ class PracticaController:
         if not pregunta:
             return False
         
-        respuesta_usuario = respuesta_usuario.strip().lower()
-        respuesta_correcta = pregunta['respuesta_correcta'].lower()
+        # Se compara normalizada, pero el historial guarda lo que se escribió
+        respuesta_usuario = respuesta_usuario.strip()
+        normalizada = normalizar_texto(respuesta_usuario)
+        if not normalizada:
+            return False
         
-        # Permitir variaciones
-        es_correcta = (
-            respuesta_usuario == respuesta_correcta or
-            respuesta_usuario in respuesta_correcta or
-            respuesta_correcta in respuesta_usuario
-        )
+        es_correcta = self.evaluador.comparar(pregunta['aceptadas'], normalizada)
+        
+        # Solo la primera respuesta a cada palabra reprograma el repaso
+        repaso = None
+        if not self.respondida:
+            repaso = self.programador.registrar_respuesta(self.palabra_actual, es_correcta)
+            self.muestreo.registrar_respuesta(self.palabra_actual, es_correcta)
+            self.respondida = True
         
         # Registrar práctica
         modo_practica = 'ingles_espanol' if self.modo == 'ingles' else 'espanol_ingles'
@@ -64,16 +71,63 @@ class PracticaController:
             self.palabra_actual,
             modo_practica,
             es_correcta,
-            respuesta_usuario
+            respuesta_usuario,
+            repaso=repaso
         )
         
         return es_correcta
     
     def cambiar_modo(self, modo):
         """Cambiar modo de práctica"""
-        if modo in ['ingles', 'espanol']:
+        if modo in ['ingles', 'espanol'] and modo != self.modo:
             self.modo = modo
+            self.sesion.invalidar()
+    
+    def cambiar_estrategia(self, estrategia):
+        """Cambiar cómo se elige la siguiente palabra"""
+        if estrategia in ['repaso', 'dificultad'] and estrategia != self.estrategia:
+            self.estrategia = estrategia
+            self.sesion.invalidar()
     
     def obtener_palabras_erroneas(self):
         """Obtener palabras con más errores"""
         return self.storage.obtener_palabras_dificiles(50)
+    
+    # ========== SESIÓN ==========
+    
+    def _sortear(self, evitar=None):
+        """Elegir la próxima palabra con la estrategia activa"""
+        if self.estrategia == 'dificultad':
+            return self.muestreo.siguiente(evitar=evitar)
+        return self.programador.siguiente(evitar=evitar)
+    
+    def _devolver_sin_mostrar(self, palabra):
+        """Reintegrar una palabra preparada que nunca se mostró"""
+        self.programador.devolver(palabra, aplazar=False)
+    
+    def _construir_pregunta(self, palabra):
+        """Precalcular el registro completo de una pregunta"""
+        datos = self.storage.obtener_palabra(palabra)
+        if datos is None:
+            return None
+        
+        if self.modo == 'ingles':
+            pregunta, respuesta = palabra, datos.get('significado', '')
+        else:
+            pregunta, respuesta = datos.get('significado', ''), palabra
+        
+        return {
+            'palabra': palabra,
+            'modo': self.modo,
+            'pregunta': pregunta,
+            'respuesta_correcta': respuesta,
+            'aceptadas': self.evaluador.aceptadas(palabra, self.modo),
+            'pronunciacion': datos.get('pronunciacion', ''),
+            'notas': datos.get('notas', '')
+        }
+    
+    def _on_cambio_vocabulario(self, palabra, existe):
+        """Las preguntas preparadas quedan obsoletas al cambiar el vocabulario"""
+        self.sesion.invalidar()
+        if palabra == self.palabra_actual and existe:
+            self.pregunta_actual = self._construir_pregunta(palabra)
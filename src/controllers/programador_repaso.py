@@ -0,0 +1,210 @@
+"""Programador de Repaso - Repetición espaciada estilo SM-2"""
+import heapq
+import itertools
+import random
+import time
+from datetime import datetime
+from src.utils import a_timestamp
+
+SEGUNDOS_DIA = 86400
+
+class ProgramadorRepaso:
+    """
+    Cola de prioridad de palabras ordenada por próxima revisión.
+
+    El estado SM-2 de cada palabra (repeticiones, intervalo en días,
+    facilidad y próxima revisión) se persiste en la tabla repaso_palabras.
+    Elegir la siguiente palabra cuesta O(log n) y cada respuesta solo
+    reprograma la palabra respondida.
+    """
+
+    FACILIDAD_INICIAL = 2.5
+    FACILIDAD_MINIMA = 1.3
+    REINTENTO_FALLO = 10 * 60   # Segundos hasta volver a mostrar una palabra fallada
+    APLAZAMIENTO = 60           # Segundos que se aplaza una palabra saltada
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.estados = {}         # palabra -> estado SM-2
+        self._heap = []           # (proxima, orden, palabra)
+        self._vigente = {}        # palabra -> orden de su entrada válida en el heap
+        self._orden = itertools.count()
+        self._en_curso = set()    # Palabras entregadas y aún no respondidas
+
+        self.cargar()
+        storage.suscribir(self._on_cambio_vocabulario, self._on_renombrar)
+
+    def cargar(self):
+        """Construir la cola desde el vocabulario y la programación guardada"""
+        guardados = {r['palabra']: r for r in self.storage.obtener_repasos()}
+
+        self.estados.clear()
+        self._vigente.clear()
+        self._en_curso.clear()
+        self._heap = []
+
+        nuevas = []
+        for palabra in self.storage.obtener_todas_palabras():
+            fila = guardados.get(palabra)
+            if fila:
+                self.estados[palabra] = {
+                    'repeticiones': fila['repeticiones'] or 0,
+                    'intervalo': fila['intervalo'] or 0,
+                    'facilidad': fila['facilidad'] or self.FACILIDAD_INICIAL,
+                    'proxima': a_timestamp(fila['proxima_revision'])
+                }
+                self._agregar_entrada(palabra, self.estados[palabra]['proxima'])
+            else:
+                nuevas.append(palabra)
+
+        # Las palabras nunca practicadas vencen ya, en orden aleatorio
+        random.shuffle(nuevas)
+        for palabra in nuevas:
+            self.estados[palabra] = self._estado_nuevo()
+            self._agregar_entrada(palabra, 0)
+
+        heapq.heapify(self._heap)
+
+    def siguiente(self, evitar=None):
+        """
+        Entregar la palabra con la revisión más próxima
+
+        Args:
+            evitar: Palabra a no repetir (la anterior) si hay alternativas
+
+        Returns:
+            Palabra o None si no hay vocabulario disponible
+        """
+        entrada = self._extraer()
+        if entrada is not None and entrada[2] == evitar:
+            alternativa = self._extraer()
+            if alternativa is not None:
+                heapq.heappush(self._heap, entrada)
+                self._vigente[entrada[2]] = entrada[1]
+                entrada = alternativa
+
+        if entrada is None:
+            return None
+        self._en_curso.add(entrada[2])
+        return entrada[2]
+
+    def _extraer(self):
+        """Sacar la entrada válida más próxima del heap"""
+        while self._heap:
+            entrada = heapq.heappop(self._heap)
+            if self._vigente.get(entrada[2]) == entrada[1]:
+                del self._vigente[entrada[2]]
+                return entrada
+        return None
+
+    def devolver(self, palabra, aplazar=True):
+        """
+        Reinsertar una palabra entregada que no se respondió
+
+        Args:
+            palabra: Palabra a reinsertar
+            aplazar: False si la palabra ni siquiera llegó a mostrarse
+        """
+        if palabra not in self._en_curso:
+            return
+        self._en_curso.discard(palabra)
+        estado = self.estados.get(palabra)
+        if estado:
+            proxima = estado['proxima']
+            if aplazar:
+                proxima = max(proxima, time.time() + self.APLAZAMIENTO)
+            self._programar(palabra, proxima)
+
+    def registrar_respuesta(self, palabra, correcta):
+        """
+        Actualizar el estado SM-2 de una palabra respondida
+
+        Returns:
+            dict listo para persistir en repaso_palabras (o None)
+        """
+        estado = self.estados.get(palabra)
+        if estado is None:
+            return None
+        self._en_curso.discard(palabra)
+
+        calidad = 4 if correcta else 1
+        ahora = time.time()
+
+        if calidad >= 3:
+            if estado['repeticiones'] == 0:
+                estado['intervalo'] = 1
+            elif estado['repeticiones'] == 1:
+                estado['intervalo'] = 6
+            else:
+                estado['intervalo'] = round(estado['intervalo'] * estado['facilidad'], 2)
+            estado['repeticiones'] += 1
+            estado['proxima'] = ahora + estado['intervalo'] * SEGUNDOS_DIA
+        else:
+            estado['repeticiones'] = 0
+            estado['intervalo'] = 0
+            estado['proxima'] = ahora + self.REINTENTO_FALLO
+
+        estado['facilidad'] = max(
+            self.FACILIDAD_MINIMA,
+            estado['facilidad'] + 0.1 - (5 - calidad) * (0.08 + (5 - calidad) * 0.02)
+        )
+        self._programar(palabra, estado['proxima'])
+
+        return {
+            'repeticiones': estado['repeticiones'],
+            'intervalo': estado['intervalo'],
+            'facilidad': round(estado['facilidad'], 4),
+            'proxima_revision': datetime.fromtimestamp(estado['proxima'])
+        }
+
+    def pendientes(self):
+        """Cantidad de palabras cuya revisión ya venció"""
+        ahora = time.time()
+        return sum(1 for estado in self.estados.values() if estado['proxima'] <= ahora)
+
+    # ========== INTERNOS ==========
+
+    def _estado_nuevo(self):
+        return {
+            'repeticiones': 0,
+            'intervalo': 0,
+            'facilidad': self.FACILIDAD_INICIAL,
+            'proxima': 0
+        }
+
+    def _agregar_entrada(self, palabra, proxima):
+        """Agregar entrada al heap sin reordenar (usado al cargar)"""
+        orden = next(self._orden)
+        self._vigente[palabra] = orden
+        self._heap.append((proxima, orden, palabra))
+
+    def _programar(self, palabra, proxima):
+        """Insertar (o reemplazar) la entrada de una palabra en O(log n)"""
+        orden = next(self._orden)
+        self._vigente[palabra] = orden
+        heapq.heappush(self._heap, (proxima, orden, palabra))
+
+        # Purgar entradas obsoletas si el heap creció demasiado
+        if len(self._heap) > 2 * len(self._vigente) + 64:
+            self._heap = [e for e in self._heap if self._vigente.get(e[2]) == e[1]]
+            heapq.heapify(self._heap)
+
+    def _on_cambio_vocabulario(self, palabra, existe):
+        """Mantener la cola sincronizada con altas y bajas del vocabulario"""
+        if existe:
+            if palabra not in self.estados:
+                self.estados[palabra] = self._estado_nuevo()
+                self._programar(palabra, 0)
+        else:
+            self.estados.pop(palabra, None)
+            self._vigente.pop(palabra, None)
+            self._en_curso.discard(palabra)
+
+    def _on_renombrar(self, antigua, nueva):
+        """Conservar el estado SM-2 de una palabra renombrada"""
+        estado = self.estados.pop(antigua, None)
+        self._vigente.pop(antigua, None)
+        self._en_curso.discard(antigua)
+        if estado is not None:
+            self.estados[nueva] = estado
+            self._programar(nueva, estado['proxima'])
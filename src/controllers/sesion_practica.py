@@ -0,0 +1,71 @@
+"""Sesión de Práctica - Cola de preguntas precalculadas"""
+from collections import deque
+
+class SesionPractica:
+    """
+    Mantiene por adelantado un lote de preguntas listas para mostrar.
+
+    Cada registro incluye el texto de la pregunta, la respuesta, la
+    pronunciación, las notas y la respuesta normalizada, de modo que pasar
+    a la siguiente tarjeta es un popleft() y la corrección reutiliza el
+    mismo registro. La cola se rellena en segundo plano con la función
+    `programar` (por ejemplo after_idle de la vista).
+    """
+
+    def __init__(self, sortear, construir, devolver, tamanio=5):
+        """
+        Args:
+            sortear: Función evitar -> palabra siguiente (o None)
+            construir: Función palabra -> registro de pregunta (o None)
+            devolver: Función palabra que reintegra una palabra no mostrada
+            tamanio: Preguntas a mantener preparadas
+        """
+        self.sortear = sortear
+        self.construir = construir
+        self.devolver = devolver
+        self.tamanio = tamanio
+        self.programar = None      # Función callback -> programa un relleno diferido
+
+        self.cola = deque()
+        self._ultima = None        # Última palabra sorteada (para no repetirla)
+        self._entregada = None     # Última palabra entregada a la vista
+        self._relleno_programado = False
+
+    def siguiente(self):
+        """Sacar el siguiente registro de la cola (o None si no hay palabras)"""
+        if not self.cola:
+            self.rellenar()
+        if not self.cola:
+            return None
+
+        registro = self.cola.popleft()
+        self._entregada = registro['palabra']
+        self._programar_relleno()
+        return registro
+
+    def rellenar(self):
+        """Completar la cola hasta el tamaño configurado"""
+        self._relleno_programado = False
+        while len(self.cola) < self.tamanio:
+            palabra = self.sortear(self._ultima)
+            if palabra is None:
+                break
+            registro = self.construir(palabra)
+            if registro is None:
+                self.devolver(palabra)
+                break
+            self.cola.append(registro)
+            self._ultima = palabra
+
+    def invalidar(self):
+        """Descartar las preguntas preparadas (cambió el modo o el vocabulario)"""
+        while self.cola:
+            self.devolver(self.cola.popleft()['palabra'])
+        self._ultima = self._entregada
+
+    def _programar_relleno(self):
+        if self.programar is None:
+            self.rellenar()
+        elif not self._relleno_programado:
+            self._relleno_programado = True
+            self.programar(self.rellenar)
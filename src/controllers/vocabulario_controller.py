@@ -1,4 +1,5 @@
 """Controlador de Vocabulario - Lógica de negocio"""
+import csv
 from src.utils import Validator
 
 class VocabularioController:
@@ -35,27 +36,54 @@ class VocabularioController:
         if nuevas_notas:
             nuevas_notas = Validator.validar_traduccion(nuevas_notas, max_length=1000)
         
-        # Eliminar palabra anterior y agregar actualizada
-        self.storage.eliminar_palabra(palabra_actual)
-        return self.storage.agregar_palabra(nueva_palabra, nuevo_significado, nueva_pronunciacion, nuevas_notas)
+        # Una sola mutación: conserva el progreso de la palabra
+        return self.storage.editar_palabra(palabra_actual, nueva_palabra, nuevo_significado,
+                                           nueva_pronunciacion, nuevas_notas)
     
     def eliminar_palabra(self, palabra):
         """Eliminar palabra"""
         return self.storage.eliminar_palabra(palabra)
     
+    def importar_csv(self, archivo):
+        """
+        Importar palabras desde CSV en un único lote
+        
+        Cada fila se valida como en agregar_palabra(); las filas inválidas o
+        duplicadas se omiten. Todo el archivo se guarda con una sola escritura
+        y, si ocurre un error de lectura o de guardado, no se importa nada.
+        
+        Returns:
+            Número de palabras importadas
+        """
+        count = 0
+        with self.storage.lote(), open(archivo, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                palabra = (row.get('Inglés') or '').strip()
+                significado = (row.get('Español') or '').strip()
+                
+                if palabra and significado:
+                    try:
+                        self.agregar_palabra(
+                            palabra, significado,
+                            (row.get('Pronunciación') or '').strip() or None,
+                            (row.get('Notas') or '').strip() or None
+                        )
+                        count += 1
+                    except ValueError:
+                        pass  # Fila inválida o duplicada
+        return count
+    
     def buscar_palabras(self, query):
         """Buscar palabras por término"""
         if not query:
             return self.storage.obtener_todas_palabras()
         
-        query = query.lower()
-        todas = self.storage.obtener_todas_palabras()
-        
-        return {
-            palabra: datos
-            for palabra, datos in todas.items()
-            if query in palabra.lower() or query in datos.get('significado', '').lower()
-        }
+        return self.storage.buscar_palabras(query)
+    
+    def coincide_palabra(self, palabra, consulta):
+        """Verificar si una palabra sigue coincidiendo con una consulta normalizada"""
+        return self.storage.coincide_palabra(palabra, consulta)
     
     def obtener_todas(self):
         """Obtener todas las palabras"""
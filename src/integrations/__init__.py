@@ -1,3 +1,3 @@
 """Integraciones con APIs externas - Traductor y Diccionarios"""
 
-__all__ = ['translator', 'dictionary_en', 'dictionary_es']
+__all__ = ['translator', 'dictionary_en', 'dictionary_es', 'cache', 'http_client', 'bundle', 'memoria_traduccion', 'resiliencia', 'extractor_html']
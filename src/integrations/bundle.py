@@ -0,0 +1,215 @@
+"""
+Diccionario offline en un archivo compacto de solo lectura
+
+Formato (enteros little-endian):
+    cabecera   MAGIC (4 bytes) | versión (u32) | número de entradas (u32)
+    índice     una fila fija por entrada, ordenada por clave:
+               offset clave (u32) | largo clave (u16) | offset valor (u32) | largo valor (u32)
+    claves     palabras en minúsculas (UTF-8) concatenadas
+    valores    JSON comprimido con zlib (formato de EnglishDictionary._parse_response)
+
+El archivo se abre con mmap y cada búsqueda es una búsqueda binaria sobre
+el índice: solo se leen de disco las páginas que se tocan, así que abrir
+un bundle de decenas de MB no lo carga en memoria.
+
+Construir un bundle a partir de un volcado (JSON o JSON Lines):
+    python -m src.integrations.bundle dump.jsonl diccionario_en.bundle
+
+Uso:
+    from src.integrations.bundle import DiccionarioOffline
+
+    bundle = DiccionarioOffline('diccionario_en.bundle')
+    result = bundle.obtener('hello')   # dict o None
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from pathlib import Path
+
+MAGIC = b'EMDB'
+VERSION = 1
+
+_CABECERA = struct.Struct('<4sII')
+_FILA = struct.Struct('<IHII')
+
+
+class DiccionarioOffline:
+    """Búsqueda por clave en un bundle mapeado en memoria"""
+
+    def __init__(self, ruta):
+        """
+        Args:
+            ruta: Archivo del bundle (puede no existir todavía)
+        """
+        self.ruta = Path(ruta) if ruta else None
+        self._archivo = None
+        self._mapa = None
+        self._total = 0
+        self._abierto = False
+        self._lock = threading.Lock()
+
+    def obtener(self, palabra):
+        """Entrada de la palabra (o None si no está en el bundle)"""
+        mapa = self._abrir()
+        if mapa is None:
+            return None
+        indice = self._buscar(mapa, palabra.strip().lower().encode('utf-8'))
+        if indice is None:
+            return None
+        _, _, offset, largo = _FILA.unpack_from(mapa, _CABECERA.size + indice * _FILA.size)
+        return json.loads(zlib.decompress(mapa[offset:offset + largo]))
+
+    def disponible(self):
+        """Verificar si hay un bundle válido"""
+        return self._abrir() is not None
+
+    def __contains__(self, palabra):
+        mapa = self._abrir()
+        return mapa is not None and self._buscar(mapa, palabra.strip().lower().encode('utf-8')) is not None
+
+    def __len__(self):
+        return self._total if self._abrir() is not None else 0
+
+    def cerrar(self):
+        with self._lock:
+            if self._mapa is not None:
+                self._mapa.close()
+                self._archivo.close()
+            self._mapa = None
+            self._archivo = None
+            self._total = 0
+            self._abierto = False
+
+    # ========== INTERNOS ==========
+
+    def _abrir(self):
+        """Mapear el archivo la primera vez que se consulta"""
+        if self._abierto:
+            return self._mapa
+        with self._lock:
+            if self._abierto:
+                return self._mapa
+            self._abierto = True
+            if self.ruta is None or not self.ruta.exists():
+                return None
+            try:
+                archivo = open(self.ruta, 'rb')
+                mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                print(f"Error al abrir diccionario offline: {e}")
+                return None
+
+            magic, version, total = _CABECERA.unpack_from(mapa, 0) if len(mapa) >= _CABECERA.size else (b'', 0, 0)
+            if magic != MAGIC or version != VERSION:
+                print(f"Diccionario offline no válido: {self.ruta}")
+                mapa.close()
+                archivo.close()
+                return None
+
+            self._archivo = archivo
+            self._mapa = mapa
+            self._total = total
+            return mapa
+
+    def _clave(self, mapa, indice):
+        offset, largo, _, _ = _FILA.unpack_from(mapa, _CABECERA.size + indice * _FILA.size)
+        return mapa[offset:offset + largo]
+
+    def _buscar(self, mapa, clave):
+        """Búsqueda binaria de la clave en el índice"""
+        bajo, alto = 0, self._total
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            actual = self._clave(mapa, medio)
+            if actual < clave:
+                bajo = medio + 1
+            elif actual > clave:
+                alto = medio
+            else:
+                return medio
+        return None
+
+
+def _fusionar(entrada, otra):
+    """Juntar dos entradas de la misma palabra (la API devuelve varias)"""
+    if not entrada.get('phonetic'):
+        entrada['phonetic'] = otra.get('phonetic', '')
+    for campo in ('phonetics', 'meanings'):
+        entrada.setdefault(campo, []).extend(otra.get(campo, []))
+    for campo in ('synonyms', 'antonyms'):
+        entrada[campo] = list(dict.fromkeys(entrada.get(campo, []) + otra.get(campo, [])))
+
+
+def construir_bundle(entradas, ruta):
+    """
+    Escribir un bundle a partir de entradas ya parseadas
+
+    Args:
+        entradas: Iterable de dicts con el formato de _parse_response
+        ruta: Archivo de salida (se reemplaza de forma atómica)
+
+    Returns:
+        Número de palabras escritas
+    """
+    palabras = {}
+    for entrada in entradas:
+        clave = entrada.get('word', '').strip().lower()
+        if not clave:
+            continue
+        if clave in palabras:
+            _fusionar(palabras[clave], entrada)
+        else:
+            palabras[clave] = dict(entrada)
+
+    claves = sorted(k.encode('utf-8') for k in palabras)
+    valores = [zlib.compress(json.dumps(palabras[k.decode('utf-8')], ensure_ascii=False,
+                                        separators=(',', ':')).encode('utf-8'), 9)
+               for k in claves]
+
+    inicio_claves = _CABECERA.size + len(claves) * _FILA.size
+    inicio_valores = inicio_claves + sum(len(k) for k in claves)
+
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_name(ruta.name + '.tmp')
+    with open(temporal, 'wb') as f:
+        f.write(_CABECERA.pack(MAGIC, VERSION, len(claves)))
+        offset_clave, offset_valor = inicio_claves, inicio_valores
+        for clave, valor in zip(claves, valores):
+            f.write(_FILA.pack(offset_clave, len(clave), offset_valor, len(valor)))
+            offset_clave += len(clave)
+            offset_valor += len(valor)
+        for clave in claves:
+            f.write(clave)
+        for valor in valores:
+            f.write(valor)
+    os.replace(temporal, ruta)
+    return len(claves)
+
+
+def leer_volcado(ruta):
+    """Entradas de un volcado JSON (lista) o JSON Lines"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        primero = f.read(1)
+        while primero.isspace():
+            primero = f.read(1)
+        f.seek(0)
+        if primero == '[':
+            yield from json.load(f)
+            return
+        for linea in f:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Uso: python -m src.integrations.bundle <volcado.json|jsonl> <salida.bundle>")
+        sys.exit(1)
+    total = construir_bundle(leer_volcado(sys.argv[1]), sys.argv[2])
+    print(f"✅ {total} palabras escritas en {sys.argv[2]}")
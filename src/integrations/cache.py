@@ -0,0 +1,183 @@
+"""
+Caché de respuestas de APIs externas
+
+Dos niveles:
+    - Memoria: LRU (OrderedDict) con las entradas más recientes
+    - Disco: SQLite con fecha de expiración (TTL) por entrada
+
+Uso:
+    from src.integrations.cache import CacheRespuestas
+
+    cache = CacheRespuestas('cache.db', ttl=7 * 86400)
+    resultado = cache.obtener('hello')
+    if resultado is None:
+        resultado = consultar_api('hello')
+        cache.guardar('hello', resultado)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DIA = 86400
+
+
+class CacheRespuestas:
+    """Caché LRU en memoria respaldada por SQLite con TTL"""
+
+    def __init__(self, ruta=None, capacidad=256, ttl=30 * DIA, ttl_negativo=DIA):
+        """
+        Args:
+            ruta: Archivo SQLite (None = solo memoria)
+            capacidad: Entradas máximas en memoria
+            ttl: Segundos de validez de un resultado
+            ttl_negativo: Segundos de validez de un "no encontrado"
+        """
+        self.ruta = Path(ruta) if ruta else None
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self.ttl_negativo = ttl_negativo
+
+        self._memoria = OrderedDict()   # clave -> (expira, valor)
+        self._lock = threading.Lock()
+        self._conn = None
+
+        self.aciertos_memoria = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        """Valor guardado y vigente para la clave (o None)"""
+        ahora = time.time()
+        with self._lock:
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                if entrada[0] > ahora:
+                    self._memoria.move_to_end(clave)
+                    self.aciertos_memoria += 1
+                    return entrada[1]
+                del self._memoria[clave]
+
+            entrada = self._leer_disco(clave, ahora)
+            if entrada is not None:
+                self._recordar(clave, entrada)
+                self.aciertos_disco += 1
+                return entrada[1]
+
+            self.fallos += 1
+            return None
+
+    def guardar(self, clave, valor, negativo=False):
+        """
+        Guardar un valor
+
+        Args:
+            clave: Clave de la consulta
+            valor: Resultado serializable a JSON
+            negativo: True si el resultado es un "no encontrado" (TTL corto)
+        """
+        expira = time.time() + (self.ttl_negativo if negativo else self.ttl)
+        with self._lock:
+            self._recordar(clave, (expira, valor))
+            conn = self._conexion()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO respuestas (clave, valor, expira) VALUES (?, ?, ?)",
+                    (clave, json.dumps(valor, ensure_ascii=False), expira)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error al guardar en caché: {e}")
+
+    def invalidar(self, clave):
+        """Eliminar una clave de ambos niveles"""
+        with self._lock:
+            self._memoria.pop(clave, None)
+            conn = self._conexion()
+            if conn is not None:
+                conn.execute("DELETE FROM respuestas WHERE clave = ?", (clave,))
+                conn.commit()
+
+    def limpiar_expirados(self):
+        """Borrar del disco las entradas vencidas (también se hace al abrir)"""
+        with self._lock:
+            conn = self._conexion()
+            if conn is None:
+                return 0
+            return self._purgar(conn)
+
+    def estadisticas(self):
+        """Contadores de aciertos y fallos"""
+        with self._lock:
+            consultas = self.aciertos_memoria + self.aciertos_disco + self.fallos
+            return {
+                'aciertos_memoria': self.aciertos_memoria,
+                'aciertos_disco': self.aciertos_disco,
+                'fallos': self.fallos,
+                'tasa_aciertos': (self.aciertos_memoria + self.aciertos_disco) / consultas if consultas else 0.0,
+                'en_memoria': len(self._memoria)
+            }
+
+    def cerrar(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ========== INTERNOS ==========
+
+    def _recordar(self, clave, entrada):
+        """Insertar en el LRU de memoria, expulsando la entrada más antigua"""
+        self._memoria[clave] = entrada
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.capacidad:
+            self._memoria.popitem(last=False)
+
+    def _leer_disco(self, clave, ahora):
+        conn = self._conexion()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT valor, expira FROM respuestas WHERE clave = ?", (clave,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error al leer caché: {e}")
+            return None
+        if row is None or row[1] <= ahora:
+            return None
+        return (row[1], json.loads(row[0]))
+
+    @staticmethod
+    def _purgar(conn):
+        cursor = conn.execute("DELETE FROM respuestas WHERE expira <= ?", (time.time(),))
+        conn.commit()
+        return cursor.rowcount
+
+    def _conexion(self):
+        """Abrir la base de datos la primera vez que se necesita"""
+        if self._conn is None and self.ruta is not None:
+            try:
+                self.ruta.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.ruta, timeout=5, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS respuestas (
+                        clave TEXT PRIMARY KEY,
+                        valor TEXT NOT NULL,
+                        expira REAL NOT NULL
+                    )
+                """)
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_respuestas_expira ON respuestas(expira)")
+                # Sin esto los "no encontrado" vencidos se acumularían para siempre
+                self._purgar(self._conn)
+            except sqlite3.Error as e:
+                print(f"Error al abrir caché en disco: {e}")
+                self.ruta = None
+                self._conn = None
+        return self._conn
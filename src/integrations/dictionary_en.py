@@ -21,33 +21,75 @@ Uso:
 
 import requests
 
+try:
+    from .bundle import DiccionarioOffline
+    from .cache import CacheRespuestas
+    from .http_client import cliente
+except ImportError:  # Ejecutado como script
+    from bundle import DiccionarioOffline
+    from cache import CacheRespuestas
+    from http_client import cliente
+
+try:
+    from src.utils import AppConfig
+    CACHE_PATH = AppConfig.APP_DIR / 'cache_dictionary_en.db'
+    BUNDLE_PATH = AppConfig.APP_DIR / 'diccionario_en.bundle'
+except ImportError:
+    CACHE_PATH = None
+    BUNDLE_PATH = None
+
 API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 
+# Caché compartida por todas las instancias (memoria + disco)
+cache = CacheRespuestas(CACHE_PATH)
+
+# Diccionario offline (se mapea al primer uso; si no existe se ignora)
+bundle = DiccionarioOffline(BUNDLE_PATH)
+
 
 class EnglishDictionary:
     """Diccionario de inglés usando Free Dictionary API"""
     
-    def __init__(self):
+    def __init__(self, cache_respuestas=None, diccionario_offline=None):
         self.base_url = "https://api.dictionaryapi.dev/api/v2/entries/en/"
+        self.cache = cache_respuestas or cache
+        self.offline = diccionario_offline or bundle
     
     def lookup(self, word):
         """
         Busca una palabra en el diccionario
         
+        Orden: diccionario offline, caché y por último la API. Los
+        resultados de la API (incluidos los "no encontrado") se guardan en
+        caché, así que repetir una búsqueda no vuelve a consultarla.
+        
         Args:
             word (str): Palabra a buscar
         
         Returns:
             dict: Información completa de la palabra
         """
+        clave = word.strip().lower()
+        result = self.offline.obtener(clave)
+        if result is not None:
+            return result
+        
+        result = self.cache.obtener(clave)
+        if result is not None:
+            return result
+        
         try:
-            response = requests.get(f"{self.base_url}{word.lower()}", timeout=5)
+            response = cliente.get(f"{self.base_url}{clave}")
             
             if response.status_code == 200:
                 data = response.json()[0]
-                return self._parse_response(data)
+                result = self._parse_response(data)
+                self.cache.guardar(clave, result)
+                return result
             elif response.status_code == 404:
-                return {'error': 'Palabra no encontrada'}
+                result = {'error': 'Palabra no encontrada'}
+                self.cache.guardar(clave, result, negativo=True)
+                return result
             else:
                 return {'error': f'Error {response.status_code}'}
         
@@ -128,23 +170,30 @@ class EnglishDictionary:
         return result.get('antonyms', [])
 
 
-# Funciones de conveniencia
+# Funciones de conveniencia (comparten una instancia y su caché)
+_dictionary = None
+
+
+def _instancia():
+    global _dictionary
+    if _dictionary is None:
+        _dictionary = EnglishDictionary()
+    return _dictionary
+
+
 def get_definition(word):
     """Función rápida para obtener definición"""
-    dictionary = EnglishDictionary()
-    return dictionary.lookup(word)
+    return _instancia().lookup(word)
 
 
 def get_synonyms(word):
     """Función rápida para obtener sinónimos"""
-    dictionary = EnglishDictionary()
-    return dictionary.get_synonyms(word)
+    return _instancia().get_synonyms(word)
 
 
 def get_antonyms(word):
     """Función rápida para obtener antónimos"""
-    dictionary = EnglishDictionary()
-    return dictionary.get_antonyms(word)
+    return _instancia().get_antonyms(word)
 
 
 # Ejemplo de uso
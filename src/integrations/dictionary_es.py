@@ -4,7 +4,8 @@ Diccionario de Español - Obtiene definiciones/significados
 API: WordReference y alternativas para obtener definiciones en español
 
 Instalación:
-    pip install requests beautifulsoup4
+    pip install requests
+    pip install lxml  # Opcional: acelera la lectura de páginas HTML
 
 Uso:
     from src.integrations.dictionary_es import SpanishDictionary
@@ -14,8 +15,12 @@ Uso:
     print(result['definitions'])
 """
 
-import requests
-from bs4 import BeautifulSoup
+try:
+    from .extractor_html import extraer_definiciones
+    from .http_client import cliente
+except ImportError:  # Ejecutado como script
+    from extractor_html import extraer_definiciones
+    from http_client import cliente
 
 
 class SpanishDictionary:
@@ -38,7 +43,7 @@ class SpanishDictionary:
             # Intentar con API de diccionario español gratuita
             url = f"https://api.dictionaryapi.dev/api/v2/entries/es/{word.lower()}"
             
-            response = requests.get(url, timeout=5)
+            response = cliente.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -92,11 +97,9 @@ class SpanishDictionary:
             # Usar servicio alternativo
             url = f"https://www.wordreference.com/definicion/{word}"
             headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=5)
+            response = cliente.get(url, headers=headers, stream=True)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
                 result = {
                     'word': word,
                     'phonetic': '',
@@ -104,13 +107,15 @@ class SpanishDictionary:
                     'synonyms': []
                 }
                 
-                # Buscar definiciones
-                definitions_found = []
-                for ol in soup.find_all('ol'):
-                    for li in ol.find_all('li')[:5]:
-                        text = li.get_text(strip=True)
-                        if text and len(text) > 10:
-                            definitions_found.append({'definition': text, 'example': ''})
+                # Buscar definiciones leyendo la página por partes: se deja
+                # de descargar en cuanto se tienen las primeras
+                # Sin charset en la cabecera requests supone ISO-8859-1
+                encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '') else None
+                try:
+                    textos = extraer_definiciones(response.iter_content(8192), encoding)
+                finally:
+                    response.close()
+                definitions_found = [{'definition': text, 'example': ''} for text in textos]
                 
                 if definitions_found:
                     result['meanings'].append({
@@ -119,6 +124,7 @@ class SpanishDictionary:
                     })
                     return result
             
+            response.close()
             return {'error': 'Palabra no encontrada'}
         
         except Exception:
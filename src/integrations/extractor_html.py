@@ -0,0 +1,155 @@
+"""
+Extracción incremental de definiciones de páginas HTML
+
+Lee el HTML por fragmentos (a medida que llega de la red) y devuelve el
+texto de los primeros <li> dentro de <ol>, sin construir el árbol completo
+de la página. En cuanto se tienen las definiciones necesarias se deja de
+leer, así que tampoco se descarga el resto de la página.
+
+Si lxml está instalado se usa su HTMLPullParser (en C); si no, el
+html.parser de la biblioteca estándar.
+
+Uso:
+    from src.integrations.extractor_html import extraer_definiciones
+
+    response = cliente.get(url, stream=True)
+    definiciones = extraer_definiciones(response.iter_content(8192), response.encoding)
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+    BACKEND = 'lxml'
+except ImportError:
+    etree = None
+    BACKEND = 'html.parser'
+
+MAX_DEFINICIONES = 5
+LARGO_MINIMO = 10
+
+_ESPACIOS = re.compile(r'\s+')
+
+
+class _Completo(Exception):
+    """Ya se tienen todas las definiciones"""
+
+
+def extraer_definiciones(fragmentos, encoding=None, maximo=MAX_DEFINICIONES, largo_minimo=LARGO_MINIMO):
+    """
+    Texto de los primeros <li> dentro de <ol>
+
+    Args:
+        fragmentos: Iterable de bytes con el HTML
+        encoding: Codificación de la página (None = UTF-8)
+        maximo: Definiciones a devolver como mucho
+        largo_minimo: Se descartan los textos de este largo o menos
+
+    Returns:
+        Lista de textos con los espacios normalizados
+    """
+    if etree is not None:
+        return _extraer_lxml(fragmentos, encoding, maximo, largo_minimo)
+    return _extraer_html_parser(fragmentos, encoding, maximo, largo_minimo)
+
+
+def _limpiar(texto):
+    return _ESPACIOS.sub(' ', texto).strip()
+
+
+class _ExtractorLista(HTMLParser):
+    """HTMLParser que acumula el texto de los <li> de primer nivel dentro de <ol>"""
+
+    def __init__(self, maximo, largo_minimo):
+        super().__init__(convert_charrefs=True)
+        self.maximo = maximo
+        self.largo_minimo = largo_minimo
+        self.definiciones = []
+        self._ol = 0        # Profundidad de <ol> abiertas
+        self._li = 0        # Profundidad de <li> abiertas dentro de una <ol>
+        self._texto = []
+
+    def handle_starttag(self, tag, attrs):
+        # Los límites de etiqueta separan palabras ("<b>1.</b>Que" -> "1. Que")
+        if self._li:
+            self._texto.append(' ')
+        if tag == 'ol':
+            self._ol += 1
+        elif tag == 'li' and self._ol:
+            self._li += 1
+
+    def handle_endtag(self, tag):
+        if self._li:
+            self._texto.append(' ')
+        if tag == 'ol' and self._ol:
+            self._ol -= 1
+        elif tag == 'li' and self._li:
+            self._cerrar_li()
+
+    def handle_data(self, data):
+        # Un mismo texto puede llegar partido entre dos fragmentos
+        if self._li:
+            self._texto.append(data)
+
+    def _cerrar_li(self):
+        self._li -= 1
+        if self._li:
+            return
+        texto = _limpiar(''.join(self._texto))
+        self._texto = []
+        if len(texto) > self.largo_minimo:
+            self.definiciones.append(texto)
+            if len(self.definiciones) >= self.maximo:
+                raise _Completo()
+
+
+def _extraer_html_parser(fragmentos, encoding, maximo, largo_minimo):
+    parser = _ExtractorLista(maximo, largo_minimo)
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    try:
+        for fragmento in fragmentos:
+            parser.feed(decoder.decode(fragmento))
+        parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+    except _Completo:
+        pass
+    return parser.definiciones
+
+
+def _extraer_lxml(fragmentos, encoding, maximo, largo_minimo):
+    parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+    definiciones = []
+    ol = 0
+    li = 0
+
+    def procesar():
+        nonlocal ol, li
+        for evento, elemento in parser.read_events():
+            tag = elemento.tag
+            if tag == 'ol':
+                ol += 1 if evento == 'start' else -1
+            elif tag == 'li' and ol and (evento == 'start' or li):
+                if evento == 'start':
+                    li += 1
+                    continue
+                li -= 1
+                if li:
+                    continue
+                texto = _limpiar(' '.join(elemento.itertext()))
+                elemento.clear()
+                if len(texto) > largo_minimo:
+                    definiciones.append(texto)
+                    if len(definiciones) >= maximo:
+                        raise _Completo()
+
+    try:
+        for fragmento in fragmentos:
+            parser.feed(fragmento)
+            procesar()
+        parser.close()
+        procesar()
+    except _Completo:
+        pass
+    return definiciones
@@ -0,0 +1,163 @@
+"""
+Cliente HTTP compartido por las integraciones
+
+Mantiene una requests.Session por host con un pool de conexiones keep-alive,
+de modo que las consultas sucesivas a la misma API reutilizan la conexión
+TCP/TLS en lugar de abrir una nueva cada vez. Los reintentos con espera
+exponencial los hace urllib3.
+
+Cada host tiene además un disyuntor: si la API está caída las peticiones
+fallan al instante con CircuitoAbierto en lugar de esperar el timeout. Un
+limitador de tasa compartido acota las peticiones por segundo.
+
+Uso:
+    from src.integrations.http_client import cliente
+
+    response = cliente.get("https://api.dictionaryapi.dev/api/v2/entries/en/hello")
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .resiliencia import CircuitoAbierto, Disyuntor, LimitadorTasa, TasaExcedida
+except ImportError:  # Ejecutado como script
+    from resiliencia import CircuitoAbierto, Disyuntor, LimitadorTasa, TasaExcedida
+
+USER_AGENT = 'EnglishMemory/1.4'
+
+
+class ClienteHTTP:
+    """Sesiones HTTP con pool de conexiones por host"""
+
+    def __init__(self, tamanio_pool=4, timeout=(3.05, 5), reintentos=2, backoff=0.5,
+                 estados_reintento=(429, 500, 502, 503, 504), umbral_fallos=3,
+                 espera_circuito=30, tasa=5, rafaga=10, espera_tasa=2):
+        """
+        Args:
+            tamanio_pool: Conexiones keep-alive por host
+            timeout: Segundos (conexión, lectura) por defecto de cada petición
+            reintentos: Reintentos ante errores de conexión o estados transitorios
+                (los timeouts de lectura no se reintentan)
+            backoff: Factor de espera exponencial entre reintentos (0.5, 1, 2... s)
+            estados_reintento: Códigos HTTP que se reintentan
+            umbral_fallos: Fallos seguidos de un host que abren su circuito
+            espera_circuito: Segundos que un circuito queda abierto
+            tasa: Peticiones por segundo (entre todos los hosts)
+            rafaga: Peticiones que pueden salir seguidas sin esperar
+            espera_tasa: Segundos máximos esperando cupo en el limitador
+        """
+        self.tamanio_pool = tamanio_pool
+        self.timeout = timeout
+        self.reintentos = reintentos
+        self.backoff = backoff
+        self.estados_reintento = tuple(estados_reintento)
+
+        self.umbral_fallos = umbral_fallos
+        self.espera_circuito = espera_circuito
+        self.espera_tasa = espera_tasa
+        self.limitador = LimitadorTasa(tasa, rafaga)
+
+        self._sesiones = {}     # "esquema://host" -> Session
+        self._disyuntores = {}  # "esquema://host" -> Disyuntor
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        """
+        GET reutilizando la sesión del host (acepta los kwargs de requests)
+
+        Raises:
+            CircuitoAbierto: El host falló hace poco (no se envía nada)
+            TasaExcedida: No hubo cupo en el limitador a tiempo
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        origen = _origen(url)
+        disyuntor = self.disyuntor(origen)
+        if not disyuntor.permitir():
+            raise CircuitoAbierto(f"{origen} no disponible, se reintentará en {disyuntor.restante():.0f} s")
+        if not self.limitador.adquirir(timeout=self.espera_tasa):
+            disyuntor.liberar()
+            raise TasaExcedida(f"Demasiadas peticiones a {origen}")
+
+        try:
+            response = self.sesion(url).get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            disyuntor.registrar_fallo()
+            raise
+        except Exception:
+            disyuntor.liberar()
+            raise
+
+        if response.status_code in self.estados_reintento:
+            disyuntor.registrar_fallo()
+        else:
+            disyuntor.registrar_exito()
+        return response
+
+    def disyuntor(self, origen):
+        """Disyuntor (creado la primera vez) de un host"""
+        with self._lock:
+            disyuntor = self._disyuntores.get(origen)
+            if disyuntor is None:
+                disyuntor = Disyuntor(self.umbral_fallos, self.espera_circuito)
+                self._disyuntores[origen] = disyuntor
+            return disyuntor
+
+    def estado_circuitos(self):
+        """Estado del circuito de cada host consultado"""
+        with self._lock:
+            return {origen: d.estado for origen, d in self._disyuntores.items()}
+
+    def sesion(self, url):
+        """Sesión (creada la primera vez) para el host de una URL"""
+        origen = _origen(url)
+        with self._lock:
+            sesion = self._sesiones.get(origen)
+            if sesion is None:
+                sesion = self._crear_sesion(origen)
+                self._sesiones[origen] = sesion
+            return sesion
+
+    def cerrar(self):
+        """Cerrar todas las sesiones y sus conexiones"""
+        with self._lock:
+            sesiones, self._sesiones = self._sesiones, {}
+        for sesion in sesiones.values():
+            sesion.close()
+
+    def _crear_sesion(self, origen):
+        reintentos = Retry(
+            total=self.reintentos,
+            connect=self.reintentos,
+            # Un timeout de lectura no se reintenta: con la API caída cada
+            # reintento costaría otro timeout completo
+            read=0,
+            status=self.reintentos,
+            backoff_factor=self.backoff,
+            status_forcelist=self.estados_reintento,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adaptador = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.tamanio_pool,
+            max_retries=reintentos
+        )
+        sesion = requests.Session()
+        sesion.headers['User-Agent'] = USER_AGENT
+        sesion.mount(origen + '/', adaptador)
+        return sesion
+
+
+def _origen(url):
+    partes = urlsplit(url)
+    return f"{partes.scheme}://{partes.netloc}"
+
+
+# Cliente compartido por todas las integraciones
+cliente = ClienteHTTP()
@@ -0,0 +1,173 @@
+"""
+Memoria de traducción persistente
+
+Guarda en SQLite cada traducción obtenida de la API, indexada por
+(origen, destino, sha1 del texto normalizado). Repetir una frase ya
+traducida no vuelve a consultar la API. El tamaño está acotado: al
+superar la capacidad se eliminan las entradas usadas hace más tiempo (LRU).
+
+Uso:
+    from src.integrations.memoria_traduccion import MemoriaTraduccion
+
+    memoria = MemoriaTraduccion('memoria.db', capacidad=5000)
+    memoria.guardar('Hello world', 'en', 'es', 'Hola mundo')
+    memoria.obtener('hello  world ', 'en', 'es')   # None (distinto texto)
+    memoria.obtener(' Hello world', 'en', 'es')    # 'Hola mundo'
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+_ESPACIOS = re.compile(r'\s+')
+# Fin de oración seguido de espacio; el separador se conserva
+_ORACIONES = re.compile(r'(?<=[.!?…])(\s+)')
+
+
+def normalizar(texto):
+    """Normalizar espacios y forma Unicode (se respetan mayúsculas y acentos)"""
+    return _ESPACIOS.sub(' ', unicodedata.normalize('NFC', texto)).strip()
+
+
+def dividir_segmentos(texto):
+    """
+    Separar un texto en oraciones conservando los separadores:
+    'Hi. How are you?' -> ['Hi.', ' ', 'How are you?']
+    """
+    return [parte for parte in _ORACIONES.split(texto.strip()) if parte]
+
+
+class MemoriaTraduccion:
+    """Traducciones previas en SQLite con expulsión LRU"""
+
+    def __init__(self, ruta=None, capacidad=10000):
+        """
+        Args:
+            ruta: Archivo SQLite (None = solo memoria)
+            capacidad: Traducciones máximas guardadas
+        """
+        self.ruta = Path(ruta) if ruta else None
+        self.capacidad = capacidad
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total = 0
+
+        self.aciertos = 0
+        self.fallos = 0
+
+    @staticmethod
+    def clave(texto, src, dest):
+        """Clave de una traducción"""
+        resumen = hashlib.sha1(normalizar(texto).encode('utf-8')).hexdigest()
+        return f"{src}|{dest}|{resumen}"
+
+    def obtener(self, texto, src, dest):
+        """Traducción guardada (o None)"""
+        clave = self.clave(texto, src, dest)
+        with self._lock:
+            conn = self._conexion()
+            try:
+                row = conn.execute(
+                    "SELECT traduccion FROM traducciones WHERE clave = ?", (clave,)
+                ).fetchone()
+                if row is None:
+                    self.fallos += 1
+                    return None
+                conn.execute("UPDATE traducciones SET usado = ? WHERE clave = ?", (time.time(), clave))
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error al leer memoria de traducción: {e}")
+                return None
+            self.aciertos += 1
+            return row[0]
+
+    def guardar(self, texto, src, dest, traduccion):
+        """Guardar una traducción, expulsando las menos usadas si hace falta"""
+        clave = self.clave(texto, src, dest)
+        with self._lock:
+            conn = self._conexion()
+            try:
+                cursor = conn.execute(
+                    "UPDATE traducciones SET traduccion = ?, usado = ? WHERE clave = ?",
+                    (traduccion, time.time(), clave)
+                )
+                if cursor.rowcount == 0:
+                    conn.execute(
+                        "INSERT INTO traducciones (clave, src, dest, texto, traduccion, usado) VALUES (?, ?, ?, ?, ?, ?)",
+                        (clave, src, dest, normalizar(texto), traduccion, time.time())
+                    )
+                    self._total += 1
+                    if self._total > self.capacidad:
+                        self._expulsar(conn, self._total - self.capacidad)
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error al guardar en memoria de traducción: {e}")
+
+    def estadisticas(self):
+        """Contadores de aciertos y fallos"""
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+                'guardadas': self._total
+            }
+
+    def limpiar(self):
+        """Borrar todas las traducciones"""
+        with self._lock:
+            conn = self._conexion()
+            conn.execute("DELETE FROM traducciones")
+            conn.commit()
+            self._total = 0
+
+    def cerrar(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ========== INTERNOS ==========
+
+    def _expulsar(self, conn, cantidad):
+        """Eliminar las traducciones usadas hace más tiempo"""
+        conn.execute("""
+            DELETE FROM traducciones WHERE clave IN (
+                SELECT clave FROM traducciones ORDER BY usado LIMIT ?
+            )
+        """, (cantidad,))
+        self._total -= cantidad
+
+    def _conexion(self):
+        """Abrir la base de datos la primera vez que se necesita"""
+        if self._conn is None:
+            destino = ':memory:'
+            if self.ruta is not None:
+                self.ruta.parent.mkdir(parents=True, exist_ok=True)
+                destino = str(self.ruta)
+            try:
+                self._conn = sqlite3.connect(destino, timeout=5, check_same_thread=False)
+            except sqlite3.Error as e:
+                print(f"Error al abrir memoria de traducción: {e}")
+                self._conn = sqlite3.connect(':memory:', check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS traducciones (
+                    clave TEXT PRIMARY KEY,
+                    src TEXT NOT NULL,
+                    dest TEXT NOT NULL,
+                    texto TEXT NOT NULL,
+                    traduccion TEXT NOT NULL,
+                    usado REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_traducciones_usado ON traducciones(usado)")
+            self._conn.commit()
+            self._total = self._conn.execute("SELECT COUNT(*) FROM traducciones").fetchone()[0]
+        return self._conn
@@ -0,0 +1,140 @@
+"""
+Protección ante APIs caídas o saturadas
+
+    - Disyuntor (circuit breaker) por host: tras varios fallos seguidos deja
+      de enviar peticiones durante un tiempo y falla al instante. Pasado ese
+      tiempo deja pasar una sola petición de prueba (semiabierto): si
+      funciona se cierra y, si no, vuelve a abrirse.
+    - LimitadorTasa (token bucket): limita las peticiones por segundo,
+      admitiendo ráfagas cortas.
+
+ClienteHTTP (http_client.py) usa ambos, así que las integraciones solo ven
+una excepción de requests cuando el circuito está abierto.
+"""
+
+import threading
+import time
+
+import requests
+
+CERRADO = 'cerrado'
+ABIERTO = 'abierto'
+SEMIABIERTO = 'semiabierto'
+
+
+class CircuitoAbierto(requests.exceptions.ConnectionError):
+    """El host falló hace poco y la petición no se envió"""
+
+
+class TasaExcedida(requests.exceptions.RequestException):
+    """No hubo cupo en el limitador de tasa a tiempo"""
+
+
+class Disyuntor:
+    """Circuit breaker: cerrado -> abierto -> semiabierto -> cerrado"""
+
+    def __init__(self, umbral_fallos=3, espera=30, reloj=time.monotonic):
+        """
+        Args:
+            umbral_fallos: Fallos seguidos que abren el circuito
+            espera: Segundos abierto antes de probar de nuevo
+            reloj: Función que devuelve el tiempo actual (para pruebas)
+        """
+        self.umbral_fallos = umbral_fallos
+        self.espera = espera
+        self.reloj = reloj
+
+        self._estado = CERRADO
+        self._fallos = 0
+        self._abierto_desde = 0.0
+        self._probando = False
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self):
+        with self._lock:
+            return self._estado
+
+    def permitir(self):
+        """Verificar si se puede enviar una petición (reserva la prueba si toca)"""
+        with self._lock:
+            if self._estado == CERRADO:
+                return True
+            if self._estado == ABIERTO:
+                if self.reloj() - self._abierto_desde < self.espera:
+                    return False
+                self._estado = SEMIABIERTO
+            # Semiabierto: una sola petición de prueba a la vez
+            if self._probando:
+                return False
+            self._probando = True
+            return True
+
+    def restante(self):
+        """Segundos hasta la próxima prueba (0 si no está abierto)"""
+        with self._lock:
+            if self._estado != ABIERTO:
+                return 0.0
+            return max(0.0, self.espera - (self.reloj() - self._abierto_desde))
+
+    def registrar_exito(self):
+        with self._lock:
+            self._estado = CERRADO
+            self._fallos = 0
+            self._probando = False
+
+    def registrar_fallo(self):
+        with self._lock:
+            self._fallos += 1
+            if self._estado == SEMIABIERTO or self._fallos >= self.umbral_fallos:
+                self._estado = ABIERTO
+                self._abierto_desde = self.reloj()
+            self._probando = False
+
+    def liberar(self):
+        """Devolver la prueba reservada sin haber enviado la petición"""
+        with self._lock:
+            self._probando = False
+
+
+class LimitadorTasa:
+    """Token bucket: `tasa` peticiones por segundo con ráfagas de `capacidad`"""
+
+    def __init__(self, tasa=5, capacidad=10, reloj=time.monotonic):
+        """
+        Args:
+            tasa: Tokens que se recuperan por segundo
+            capacidad: Tokens máximos acumulados (tamaño de la ráfaga)
+            reloj: Función que devuelve el tiempo actual (para pruebas)
+        """
+        self.tasa = tasa
+        self.capacidad = capacidad
+        self.reloj = reloj
+
+        self._tokens = float(capacidad)
+        self._ultimo = reloj()
+        self._lock = threading.Lock()
+
+    def adquirir(self, timeout=None):
+        """
+        Tomar un token, esperando si hace falta
+
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite)
+
+        Returns:
+            True si se obtuvo el token
+        """
+        limite = None if timeout is None else self.reloj() + timeout
+        while True:
+            with self._lock:
+                ahora = self.reloj()
+                self._tokens = min(self.capacidad, self._tokens + (ahora - self._ultimo) * self.tasa)
+                self._ultimo = ahora
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                espera = (1 - self._tokens) / self.tasa
+            if limite is not None and ahora + espera > limite:
+                return False
+            time.sleep(espera)
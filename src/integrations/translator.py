@@ -11,19 +11,100 @@ Uso:
     print(result)  # "Hola mundo"
 """
 
-import requests
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .http_client import cliente
+    from .memoria_traduccion import MemoriaTraduccion, dividir_segmentos
+except ImportError:  # Ejecutado como script
+    from http_client import cliente
+    from memoria_traduccion import MemoriaTraduccion, dividir_segmentos
+
+try:
+    from src.utils import AppConfig
+    MEMORIA_PATH = AppConfig.APP_DIR / 'memoria_traduccion.db'
+except ImportError:
+    MEMORIA_PATH = None
+
+# MyMemory admite como máximo 500 bytes por consulta
+LIMITE_CONSULTA = 450
+
+_PALABRAS = re.compile(r'\S+')
+
+# Memoria de traducción compartida por todas las instancias
+memoria = MemoriaTraduccion(MEMORIA_PATH)
+
+
+def dividir_consulta(texto, limite=LIMITE_CONSULTA):
+    """
+    Separar un texto en oraciones (conservando los separadores) y trocear
+    por palabras las que superan el límite de la API:
+    'Hi. How are you?' -> ['Hi.', ' ', 'How are you?']
+    
+    Una palabra que por sí sola supera el límite se corta en bytes, sin
+    partir caracteres UTF-8; sus trozos van unidos por separadores vacíos.
+    """
+    partes = []
+    for i, parte in enumerate(dividir_segmentos(texto)):
+        if i % 2 or len(parte.encode('utf-8')) <= limite:
+            partes.append(parte)
+            continue
+        trozo = ''
+        for palabra in _PALABRAS.findall(parte):
+            if len(palabra.encode('utf-8')) > limite:
+                if trozo:
+                    partes.extend([trozo, ' '])
+                *completos, trozo = _cortar_bytes(palabra, limite)
+                for completo in completos:
+                    partes.extend([completo, ''])
+            elif trozo and len((trozo + ' ' + palabra).encode('utf-8')) > limite:
+                partes.extend([trozo, ' '])
+                trozo = palabra
+            else:
+                trozo = f"{trozo} {palabra}" if trozo else palabra
+        partes.append(trozo)
+    return partes
+
+
+def _cortar_bytes(palabra, limite):
+    """Trozos de como mucho `limite` bytes que no parten caracteres UTF-8"""
+    datos = palabra.encode('utf-8')
+    trozos = []
+    while datos:
+        corte = min(limite, len(datos))
+        # Retroceder mientras el corte caiga en un byte de continuación (10xxxxxx)
+        while corte < len(datos) and datos[corte] & 0xC0 == 0x80:
+            corte -= 1
+        trozos.append(datos[:corte].decode('utf-8'))
+        datos = datos[corte:]
+    return trozos
 
 
 class TranslatorService:
     """Servicio de traducción usando MyMemory Translation API gratuita"""
     
-    def __init__(self):
+    def __init__(self, memoria_traduccion=None, segmentos=True, max_workers=4):
+        """
+        Args:
+            memoria_traduccion: MemoriaTraduccion (por defecto la compartida)
+            segmentos: Traducir por oraciones los textos de varias oraciones
+            max_workers: Consultas simultáneas a la API en translate_many
+        """
         self.base_url = "https://api.mymemory.translated.net/get"
+        self.memoria = memoria_traduccion or memoria
+        self.segmentos = segmentos
+        self.max_workers = max_workers
     
     def translate(self, text, src='en', dest='es'):
         """
         Traduce texto entre idiomas
         
+        Primero se busca el texto completo en la memoria de traducción. Los
+        textos de varias oraciones (o demasiado largos para una consulta) se
+        traducen por segmentos con translate_segmentado.
+        
         Args:
             text (str): Texto a traducir
             src (str): Idioma origen ('en', 'es')
@@ -32,19 +113,110 @@ class TranslatorService:
         Returns:
             dict: {'text': texto_traducido, 'src': idioma_origen, 'dest': idioma_destino}
         """
+        traduccion = self.memoria.obtener(text, src, dest)
+        if traduccion is not None:
+            return {'text': traduccion, 'src': src, 'dest': dest}
+        
+        if self.segmentos:
+            partes = dividir_consulta(text)
+            if len(partes) > 1:
+                return self.translate_segmentado(text, src, dest, partes)
+        
+        result = self._consultar(text, src, dest)
+        if 'text' in result:
+            self.memoria.guardar(text, src, dest, result['text'])
+        return result
+    
+    def translate_segmentado(self, text, src='en', dest='es', partes=None):
+        """
+        Traduce un texto largo oración por oración
+        
+        Los segmentos se traducen en paralelo con translate_many y se
+        vuelven a unir en orden con sus separadores originales.
+        
+        Returns:
+            dict: Como translate, más 'segmentos': lista con 'texto',
+            'latencia' (s) y 'memoria' (True si no hizo falta la API)
+        """
+        partes = partes or dividir_consulta(text)
+        oraciones = partes[::2]
+        resultados = self.translate_many(oraciones, src=src, dest=dest)
+        
+        segmentos = [{'texto': oracion, 'latencia': r['latencia'], 'memoria': r['memoria']}
+                     for oracion, r in zip(oraciones, resultados)]
+        errores = [r['error'] for r in resultados if 'error' in r]
+        if errores:
+            return {'error': errores[0], 'segmentos': segmentos}
+        
+        partes[::2] = [r['text'] for r in resultados]
+        traduccion = ''.join(partes)
+        self.memoria.guardar(text, src, dest, traduccion)
+        return {'text': traduccion, 'src': src, 'dest': dest, 'segmentos': segmentos}
+    
+    def translate_many(self, texts, src='en', dest='es'):
+        """
+        Traduce varios textos, consultando la API en paralelo
+        
+        Los textos que ya están en la memoria de traducción no se envían y
+        los repetidos se consultan una sola vez. Como mucho hay
+        max_workers consultas simultáneas.
+        
+        Args:
+            texts (list): Textos a traducir
+        
+        Returns:
+            list: Un dict por texto, en el mismo orden, como translate más
+            'latencia' (s) y 'memoria'
+        """
+        resultados = [None] * len(texts)
+        pendientes = {}   # texto -> índices donde aparece
+        for i, texto in enumerate(texts):
+            inicio = time.perf_counter()
+            traduccion = self.memoria.obtener(texto, src, dest)
+            if traduccion is not None:
+                resultados[i] = {'text': traduccion, 'src': src, 'dest': dest,
+                                 'latencia': time.perf_counter() - inicio, 'memoria': True}
+            else:
+                pendientes.setdefault(texto, []).append(i)
+        
+        if pendientes:
+            workers = min(self.max_workers, len(pendientes))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='Traductor') as pool:
+                consultas = {texto: pool.submit(self._traducir_segmento, texto, src, dest)
+                             for texto in pendientes}
+                for texto, futuro in consultas.items():
+                    result = futuro.result()
+                    for i in pendientes[texto]:
+                        resultados[i] = dict(result)
+        return resultados
+    
+    def _traducir_segmento(self, text, src, dest):
+        """Consultar la API para un segmento y guardarlo en memoria"""
+        inicio = time.perf_counter()
+        result = self._consultar(text, src, dest)
+        result['latencia'] = time.perf_counter() - inicio
+        result['memoria'] = False
+        if 'text' in result:
+            self.memoria.guardar(text, src, dest, result['text'])
+        return result
+    
+    def _consultar(self, text, src, dest):
+        """Traducir con la API"""
         try:
             params = {
                 'q': text,
                 'langpair': f'{src}|{dest}'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=5)
+            response = cliente.get(self.base_url, params=params)
             
             if response.status_code == 200:
                 data = response.json()
-                if data.get('responseStatus') == 200:
+                # Los avisos de cuota llegan como si fueran la traducción
+                texto = data.get('responseData', {}).get('translatedText', '')
+                if data.get('responseStatus') == 200 and not texto.startswith('MYMEMORY WARNING'):
                     return {
-                        'text': data['responseData']['translatedText'],
+                        'text': texto,
                         'src': src,
                         'dest': dest
                     }
@@ -54,11 +226,20 @@ class TranslatorService:
             return {'error': str(e)}
 
 
-# Funciones de conveniencia
+# Funciones de conveniencia (comparten una instancia y su memoria)
+_service = None
+
+
+def _instancia():
+    global _service
+    if _service is None:
+        _service = TranslatorService()
+    return _service
+
+
 def translate_text(text, src='en', dest='es'):
     """Función rápida para traducir texto"""
-    service = TranslatorService()
-    result = service.translate(text, src=src, dest=dest)
+    result = _instancia().translate(text, src=src, dest=dest)
     return result.get('text', result.get('error', 'Error desconocido'))
 
 
@@ -0,0 +1,123 @@
+"""
+Archivado de prácticas
+Mueve las prácticas antiguas a una base de datos adjunta y las resume por
+palabra y mes, para que la tabla principal se mantenga pequeña
+"""
+import threading
+from datetime import datetime, timedelta
+
+# Un lote: las prácticas más antiguas que la fecha límite, hasta un id tope
+SQL_LOTE_ARCHIVO = """
+    SELECT MAX(id) AS tope, COUNT(*) AS cantidad FROM (
+        SELECT id FROM practicas WHERE fecha < ? ORDER BY fecha LIMIT ?
+    )
+"""
+
+SQL_COPIAR_LOTE = """
+    INSERT OR IGNORE INTO archivo.practicas
+        (id, palabra, modo, correcta, respuesta_usuario, tiempo_respuesta, fecha)
+    SELECT id, palabra, modo, correcta, respuesta_usuario, tiempo_respuesta, fecha
+    FROM practicas
+    WHERE fecha < ? AND id <= ?
+"""
+
+SQL_RESUMIR_LOTE = """
+    INSERT INTO resumen_mensual_palabras (mes, palabra, practicas_totales, practicas_correctas, tiempo_total)
+    SELECT strftime('%Y-%m', fecha), palabra, COUNT(*), SUM(correcta), COALESCE(SUM(tiempo_respuesta), 0)
+    FROM practicas
+    WHERE fecha < ? AND id <= ?
+    GROUP BY 1, 2
+    ON CONFLICT(palabra, mes) DO UPDATE SET
+        practicas_totales = practicas_totales + excluded.practicas_totales,
+        practicas_correctas = practicas_correctas + excluded.practicas_correctas,
+        tiempo_total = tiempo_total + excluded.tiempo_total
+"""
+
+SQL_BORRAR_LOTE = "DELETE FROM practicas WHERE fecha < ? AND id <= ?"
+
+
+class ArchivadorPracticas:
+    def __init__(self, db, archivo_path, dias_retencion=90, tamanio_lote=5000,
+                 pausa=0.05, intervalo=3600):
+        """
+        Args:
+            db: Instancia de Database
+            archivo_path: Ruta de la base de datos de archivo
+            dias_retencion: Días que una práctica permanece en la tabla principal
+            tamanio_lote: Prácticas movidas por transacción
+            pausa: Segundos de espera entre lotes (cede el disco a la interfaz)
+            intervalo: Segundos entre pasadas completas
+        """
+        self.db = db
+        self.dias_retencion = dias_retencion
+        self.tamanio_lote = tamanio_lote
+        self.pausa = pausa
+        self.intervalo = intervalo
+        self._detener = threading.Event()
+        self._hilo = None
+
+        db.adjuntar_archivo(archivo_path)
+
+    def iniciar(self):
+        """Archivar en segundo plano, por lotes"""
+        if self._hilo and self._hilo.is_alive():
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._ejecutar, name='ArchivadorPracticas', daemon=True)
+        self._hilo.start()
+
+    def detener(self, timeout=5):
+        """Terminar el lote en curso y finalizar el hilo"""
+        self._detener.set()
+        if self._hilo:
+            self._hilo.join(timeout)
+            self._hilo = None
+
+    def archivar_todo(self):
+        """Archivar de forma síncrona todas las prácticas vencidas"""
+        total = 0
+        while not self._detener.is_set():
+            movidas = self.paso()
+            if not movidas:
+                break
+            total += movidas
+        return total
+
+    def paso(self):
+        """
+        Archivar un lote de prácticas en una transacción
+
+        Las prácticas se copian al archivo (INSERT OR IGNORE por id, de modo
+        que repetir un lote interrumpido es inocuo), se suman al resumen
+        mensual y se borran de la tabla principal. El resumen y el borrado
+        ocurren en la misma base de datos y transacción, así que los totales
+        nunca cuentan una práctica dos veces.
+
+        Returns:
+            Cantidad de prácticas archivadas
+        """
+        limite = datetime.now() - timedelta(days=self.dias_retencion)
+        with self.db.get_connection() as conn:
+            if not self.db.archivo_adjunto():
+                return 0
+            cursor = conn.cursor()
+            cursor.execute(SQL_LOTE_ARCHIVO, (limite, self.tamanio_lote))
+            row = cursor.fetchone()
+            if not row or not row['cantidad']:
+                return 0
+            parametros = (limite, row['tope'])
+
+            cursor.execute(SQL_COPIAR_LOTE, parametros)
+            cursor.execute(SQL_RESUMIR_LOTE, parametros)
+            cursor.execute(SQL_BORRAR_LOTE, parametros)
+            return cursor.rowcount
+
+    def _ejecutar(self):
+        """Bucle del hilo archivador"""
+        while not self._detener.is_set():
+            try:
+                while not self._detener.is_set() and self.paso():
+                    self._detener.wait(self.pausa)
+            except Exception as e:
+                print(f"Error al archivar prácticas: {e}")
+            self._detener.wait(self.intervalo)
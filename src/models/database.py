@@ -3,94 +3,414 @@ Database Manager para English Memory
 Maneja conexiones y operaciones con SQLite
 """
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from .migraciones import aplicar_migraciones, planes_consulta
+from .archivador import SQL_LOTE_ARCHIVO, SQL_COPIAR_LOTE, SQL_RESUMIR_LOTE, SQL_BORRAR_LOTE
+
+NIVELES_SYNCHRONOUS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+# Consultas de lectura (ver verificar_planes)
+SQL_CONFIG = "SELECT valor FROM configuracion WHERE clave = ?"
+
+SQL_TODO_PROGRESO = """
+    SELECT palabra, veces_vista, veces_incorrecta, ultima_practica
+    FROM progreso_palabras
+"""
+
+SQL_REPASOS = """
+    SELECT palabra, repeticiones, intervalo, facilidad, proxima_revision
+    FROM repaso_palabras
+"""
+
+SQL_PROGRESO_PALABRA = """
+    SELECT * FROM progreso_palabras WHERE palabra = ?
+"""
+
+SQL_ESTADISTICAS_PERIODO = """
+    SELECT fecha, practicas_totales, practicas_correctas, tiempo_total
+    FROM estadisticas_diarias
+    WHERE fecha >= DATE('now', 'localtime', '-' || ? || ' days')
+    ORDER BY fecha DESC
+"""
+
+SQL_PALABRAS_DIFICILES = """
+    SELECT palabra
+    FROM progreso_palabras
+    WHERE veces_incorrecta > 0
+    ORDER BY veces_incorrecta DESC, veces_vista DESC
+    LIMIT ?
+"""
+
+SQL_RACHA_ESTUDIO = """
+    WITH dias AS (
+        SELECT fecha,
+               julianday(fecha) - ROW_NUMBER() OVER (ORDER BY fecha) AS isla
+        FROM estadisticas_diarias
+        WHERE practicas_totales > 0
+    )
+    SELECT COUNT(*) AS racha, MAX(fecha) AS ultimo_dia
+    FROM dias
+    GROUP BY isla
+    ORDER BY ultimo_dia DESC
+    LIMIT 1
+"""
+
+SQL_RESUMEN_DIA = """
+    SELECT palabras_practicadas, practicas_totales, practicas_correctas, tiempo_total
+    FROM estadisticas_diarias WHERE fecha = ?
+"""
+
+SQL_RESUMEN_DIA_MODOS = """
+    SELECT modo, practicas_totales, practicas_correctas, tiempo_total
+    FROM estadisticas_modo WHERE fecha = ?
+"""
+
+SQL_ESTADISTICAS_SEMANALES = """
+    SELECT semana, practicas_totales, practicas_correctas, tiempo_total
+    FROM estadisticas_semanales
+    ORDER BY semana DESC
+    LIMIT ?
+"""
+
+SQL_HISTORIAL_PALABRA = """
+    SELECT modo, correcta, respuesta_usuario, tiempo_respuesta, fecha
+    FROM practicas
+    WHERE palabra = ?
+    ORDER BY fecha DESC
+    LIMIT ?
+"""
+
+SQL_HISTORIAL_ARCHIVO = """
+    SELECT modo, correcta, respuesta_usuario, tiempo_respuesta, fecha
+    FROM archivo.practicas
+    WHERE palabra = ?
+    ORDER BY fecha DESC
+    LIMIT ?
+"""
+
+SQL_RESUMEN_MENSUAL = """
+    SELECT mes, practicas_totales, practicas_correctas, tiempo_total
+    FROM resumen_mensual_palabras
+    WHERE palabra = ?
+    ORDER BY mes DESC
+"""
 
 class Database:
-    def __init__(self, db_path):
+    def __init__(self, db_path, synchronous='NORMAL', cached_statements=128):
+        """
+        Args:
+            db_path: Ruta del archivo SQLite
+            synchronous: Nivel de PRAGMA synchronous ('OFF', 'NORMAL', 'FULL', 'EXTRA').
+                En modo WAL, 'NORMAL' evita un fsync por commit sin riesgo de corrupción.
+            cached_statements: Sentencias preparadas que cachea cada conexión
+        """
+        synchronous = str(synchronous).upper()
+        if synchronous not in NIVELES_SYNCHRONOUS:
+            raise ValueError(f"Nivel synchronous inválido: {synchronous}")
+        
         self.db_path = Path(db_path)
+        self.synchronous = synchronous
+        self.cached_statements = cached_statements
+        self.archivo_path = None  # Base de datos de archivo (ver adjuntar_archivo)
+        
+        # Una conexión persistente por hilo
+        self._local = threading.local()
+        self._conexiones = []
+        self._lock = threading.Lock()
+        
         self.init_database()
     
     def init_database(self):
-        """Inicializar base de datos con schema"""
+        """Inicializar base de datos aplicando las migraciones pendientes"""
         if not self.db_path.parent.exists():
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Crear schema si no existe
-        schema_path = Path(__file__).parent / 'schema.sql'
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema_sql = f.read()
-        
         with self.get_connection() as conn:
-            conn.executescript(schema_sql)
+            aplicar_migraciones(conn)
+    
+    def _conectar(self):
+        """Obtener (o abrir) la conexión persistente del hilo actual"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=10,
+                cached_statements=self.cached_statements,
+                check_same_thread=False  # Solo cerrar() la usa desde otro hilo
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            
+            self._local.conn = conn
+            self._local.profundidad = 0
+            self._local.archivo = None
+            with self._lock:
+                self._conexiones.append(conn)
+        
+        if self.archivo_path and self._local.archivo != self.archivo_path and self._local.profundidad == 0:
+            self._adjuntar(conn)
+        return conn
+    
+    def adjuntar_archivo(self, ruta):
+        """Adjuntar (como 'archivo') la base de datos con las prácticas antiguas"""
+        self.archivo_path = Path(ruta)
+    
+    def _adjuntar(self, conn):
+        """ATTACH del archivo en la conexión del hilo actual"""
+        try:
+            if self._local.archivo:
+                conn.execute("DETACH DATABASE archivo")
+            conn.execute("ATTACH DATABASE ? AS archivo", (str(self.archivo_path),))
+            conn.execute("PRAGMA archivo.journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS archivo.practicas (
+                    id INTEGER PRIMARY KEY,
+                    palabra TEXT NOT NULL,
+                    modo TEXT NOT NULL,
+                    correcta BOOLEAN NOT NULL,
+                    respuesta_usuario TEXT,
+                    tiempo_respuesta INTEGER,
+                    fecha TIMESTAMP
+                );
+                CREATE INDEX IF NOT EXISTS archivo.idx_archivo_palabra_fecha ON practicas(palabra, fecha);
+            """)
+            self._local.archivo = self.archivo_path
+        except sqlite3.Error as e:
+            print(f"Error al adjuntar archivo de prácticas: {e}")
+            self._local.archivo = None
+    
+    def archivo_adjunto(self):
+        """Verificar si la conexión del hilo actual tiene el archivo adjunto"""
+        self._conectar()
+        return self._local.archivo is not None
     
     @contextmanager
     def get_connection(self):
-        """Context manager para conexiones SQLite"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager para la conexión SQLite del hilo (commit al salir)"""
+        conn = self._conectar()
+        self._local.profundidad += 1
         try:
             yield conn
-            conn.commit()
+            if self._local.profundidad == 1:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
+            if self._local.profundidad == 1:
+                conn.rollback()
             raise e
         finally:
-            conn.close()
+            self._local.profundidad -= 1
     
-    def registrar_practica(self, palabra, modo, correcta, respuesta_usuario=None, tiempo_respuesta=None):
+    def verificar_planes(self):
+        """
+        Comprobar con EXPLAIN QUERY PLAN que las consultas de lectura usan índices
+        
+        Returns:
+            dict consulta -> (usa_indice, líneas del plan)
+        """
+        hoy = datetime.now().date()
+        corte = datetime.now() - timedelta(days=90)
+        consultas = {
+            # Se cargan completas al iniciar (programador y muestreo)
+            'obtener_repasos': (SQL_REPASOS, (), {'repaso_palabras'}),
+            'obtener_todo_progreso': (SQL_TODO_PROGRESO, (), {'progreso_palabras'}),
+            'obtener_config': (SQL_CONFIG, ('clave',)),
+            'obtener_progreso_palabra': (SQL_PROGRESO_PALABRA, ('palabra',)),
+            'obtener_estadisticas_periodo': (SQL_ESTADISTICAS_PERIODO, (30,)),
+            'obtener_palabras_dificiles': (SQL_PALABRAS_DIFICILES, (10,)),
+            'obtener_racha_estudio': (SQL_RACHA_ESTUDIO, ()),
+            'obtener_resumen_dia': (SQL_RESUMEN_DIA, (hoy,)),
+            'obtener_resumen_dia (modos)': (SQL_RESUMEN_DIA_MODOS, (hoy,)),
+            'obtener_estadisticas_semanales': (SQL_ESTADISTICAS_SEMANALES, (8,)),
+            'obtener_historial_palabra': (SQL_HISTORIAL_PALABRA, ('palabra', 20)),
+            'obtener_resumen_mensual_palabra': (SQL_RESUMEN_MENSUAL, ('palabra',)),
+        }
+        with self.get_connection() as conn:
+            if self._local.archivo:
+                consultas['obtener_historial_palabra (archivo)'] = (SQL_HISTORIAL_ARCHIVO, ('palabra', 20))
+                consultas['archivador (lote)'] = (SQL_LOTE_ARCHIVO, (corte, 5000))
+                consultas['archivador (copia)'] = (SQL_COPIAR_LOTE, (corte, 1))
+                consultas['archivador (resumen)'] = (SQL_RESUMIR_LOTE, (corte, 1))
+                consultas['archivador (borrado)'] = (SQL_BORRAR_LOTE, (corte, 1))
+            return planes_consulta(conn, consultas)
+    
+    def cerrar(self):
+        """Cerrar todas las conexiones abiertas"""
+        with self._lock:
+            conexiones, self._conexiones = self._conexiones, []
+        for conn in conexiones:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+    
+    def registrar_practica(self, palabra, modo, correcta, respuesta_usuario=None, tiempo_respuesta=None,
+                           fecha=None, repaso=None):
         """Registrar una práctica en el historial"""
+        self.registrar_practicas([{
+            'palabra': palabra,
+            'modo': modo,
+            'correcta': correcta,
+            'respuesta_usuario': respuesta_usuario,
+            'tiempo_respuesta': tiempo_respuesta,
+            'fecha': fecha,
+            'repaso': repaso
+        }])
+    
+    def registrar_practicas(self, eventos):
+        """Registrar varias prácticas en una única transacción"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            for evento in eventos:
+                self._insertar_practica(cursor, **evento)
+    
+    def _insertar_practica(self, cursor, palabra, modo, correcta, respuesta_usuario=None,
+                           tiempo_respuesta=None, fecha=None, repaso=None):
+        """Insertar práctica y actualizar progreso, repaso y estadísticas diarias"""
+        fecha = fecha or datetime.now()
+        cursor.execute("""
+            INSERT INTO practicas (palabra, modo, correcta, respuesta_usuario, tiempo_respuesta, fecha)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (palabra, modo, correcta, respuesta_usuario, tiempo_respuesta, fecha))
+        
+        # Actualizar progreso de la palabra
+        cursor.execute("""
+            INSERT INTO progreso_palabras (palabra, veces_vista, veces_correcta, veces_incorrecta, ultima_practica)
+            VALUES (?, 1, ?, ?, ?)
+            ON CONFLICT(palabra) DO UPDATE SET
+                veces_vista = veces_vista + 1,
+                veces_correcta = veces_correcta + ?,
+                veces_incorrecta = veces_incorrecta + ?,
+                ultima_practica = ?
+        """, (
+            palabra,
+            1 if correcta else 0,
+            0 if correcta else 1,
+            fecha,
+            1 if correcta else 0,
+            0 if correcta else 1,
+            fecha
+        ))
+        
+        # Palabras distintas del día: solo la primera práctica inserta fila
+        fecha_dia = fecha.date()
+        cursor.execute("""
+            INSERT OR IGNORE INTO palabras_diarias (fecha, palabra) VALUES (?, ?)
+        """, (fecha_dia, palabra))
+        palabra_nueva = cursor.rowcount
+        
+        acierto = 1 if correcta else 0
+        tiempo = tiempo_respuesta or 0
+        
+        # Actualizar estadísticas diarias
+        cursor.execute("""
+            INSERT INTO estadisticas_diarias (fecha, palabras_practicadas, practicas_totales, practicas_correctas, tiempo_total)
+            VALUES (?, 1, 1, ?, ?)
+            ON CONFLICT(fecha) DO UPDATE SET
+                palabras_practicadas = palabras_practicadas + ?,
+                practicas_totales = practicas_totales + 1,
+                practicas_correctas = practicas_correctas + ?,
+                tiempo_total = tiempo_total + ?
+        """, (fecha_dia, acierto, tiempo, palabra_nueva, acierto, tiempo))
+        
+        # Actualizar estadísticas semanales
+        cursor.execute("""
+            INSERT INTO estadisticas_semanales (semana, practicas_totales, practicas_correctas, tiempo_total)
+            VALUES (?, 1, ?, ?)
+            ON CONFLICT(semana) DO UPDATE SET
+                practicas_totales = practicas_totales + 1,
+                practicas_correctas = practicas_correctas + ?,
+                tiempo_total = tiempo_total + ?
+        """, (fecha_dia - timedelta(days=fecha_dia.weekday()), acierto, tiempo, acierto, tiempo))
+        
+        # Actualizar estadísticas por modo
+        cursor.execute("""
+            INSERT INTO estadisticas_modo (fecha, modo, practicas_totales, practicas_correctas, tiempo_total)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(fecha, modo) DO UPDATE SET
+                practicas_totales = practicas_totales + 1,
+                practicas_correctas = practicas_correctas + ?,
+                tiempo_total = tiempo_total + ?
+        """, (fecha_dia, modo, acierto, tiempo, acierto, tiempo))
+        
+        # Actualizar programación de repaso (SM-2)
+        if repaso:
             cursor.execute("""
-                INSERT INTO practicas (palabra, modo, correcta, respuesta_usuario, tiempo_respuesta)
+                INSERT OR REPLACE INTO repaso_palabras (palabra, repeticiones, intervalo, facilidad, proxima_revision)
                 VALUES (?, ?, ?, ?, ?)
-            """, (palabra, modo, correcta, respuesta_usuario, tiempo_respuesta))
-            
-            # Actualizar progreso de la palabra
+            """, (palabra, repaso['repeticiones'], repaso['intervalo'], repaso['facilidad'],
+                  repaso['proxima_revision']))
             cursor.execute("""
-                INSERT INTO progreso_palabras (palabra, veces_vista, veces_correcta, veces_incorrecta, ultima_practica)
-                VALUES (?, 1, ?, ?, ?)
-                ON CONFLICT(palabra) DO UPDATE SET
-                    veces_vista = veces_vista + 1,
-                    veces_correcta = veces_correcta + ?,
-                    veces_incorrecta = veces_incorrecta + ?,
-                    ultima_practica = ?
-            """, (
-                palabra,
-                1 if correcta else 0,
-                0 if correcta else 1,
-                datetime.now(),
-                1 if correcta else 0,
-                0 if correcta else 1,
-                datetime.now()
-            ))
+                UPDATE progreso_palabras SET nivel_dominio = ? WHERE palabra = ?
+            """, (repaso['repeticiones'], palabra))
+    
+    def renombrar_palabra(self, antigua, nueva):
+        """
+        Trasladar a otra clave el progreso, la programación de repaso, el
+        historial (también el archivado), los resúmenes y las categorías
+        
+        El progreso y el repaso de la clave nueva, si existían, se reemplazan;
+        el historial y los resúmenes de ambas claves se suman.
+        """
+        with self.get_connection() as conn:
+            for tabla in ('progreso_palabras', 'repaso_palabras'):
+                if conn.execute(f"SELECT 1 FROM {tabla} WHERE palabra = ?", (antigua,)).fetchone():
+                    conn.execute(f"DELETE FROM {tabla} WHERE palabra = ?", (nueva,))
+                    conn.execute(f"UPDATE {tabla} SET palabra = ? WHERE palabra = ?", (nueva, antigua))
             
-            # Actualizar estadísticas diarias
-            fecha_hoy = datetime.now().date()
-            cursor.execute("""
-                INSERT INTO estadisticas_diarias (fecha, palabras_practicadas, practicas_totales, practicas_correctas, tiempo_total)
-                VALUES (?, 1, 1, ?, ?)
-                ON CONFLICT(fecha) DO UPDATE SET
-                    practicas_totales = practicas_totales + 1,
-                    practicas_correctas = practicas_correctas + ?,
-                    tiempo_total = tiempo_total + ?
-            """, (
-                fecha_hoy,
-                1 if correcta else 0,
-                tiempo_respuesta or 0,
-                1 if correcta else 0,
-                tiempo_respuesta or 0
-            ))
+            conn.execute("UPDATE practicas SET palabra = ? WHERE palabra = ?", (nueva, antigua))
+            if self._local.archivo:
+                conn.execute("UPDATE archivo.practicas SET palabra = ? WHERE palabra = ?", (nueva, antigua))
+            
+            # Días practicados con ambas claves: pasan a contar una sola palabra
+            conn.execute("""
+                UPDATE estadisticas_diarias SET palabras_practicadas = palabras_practicadas - 1
+                WHERE fecha IN (
+                    SELECT a.fecha FROM palabras_diarias a
+                    JOIN palabras_diarias n ON n.fecha = a.fecha AND n.palabra = ?
+                    WHERE a.palabra = ?
+                )
+            """, (nueva, antigua))
+            conn.execute("UPDATE OR IGNORE palabras_diarias SET palabra = ? WHERE palabra = ?", (nueva, antigua))
+            conn.execute("DELETE FROM palabras_diarias WHERE palabra = ?", (antigua,))
+            
+            conn.execute("""
+                INSERT INTO resumen_mensual_palabras (mes, palabra, practicas_totales, practicas_correctas, tiempo_total)
+                SELECT mes, ?, practicas_totales, practicas_correctas, tiempo_total
+                FROM resumen_mensual_palabras WHERE palabra = ?
+                ON CONFLICT(palabra, mes) DO UPDATE SET
+                    practicas_totales = practicas_totales + excluded.practicas_totales,
+                    practicas_correctas = practicas_correctas + excluded.practicas_correctas,
+                    tiempo_total = tiempo_total + excluded.tiempo_total
+            """, (nueva, antigua))
+            conn.execute("DELETE FROM resumen_mensual_palabras WHERE palabra = ?", (antigua,))
+            
+            conn.execute("UPDATE OR IGNORE palabra_categoria SET palabra = ? WHERE palabra = ?", (nueva, antigua))
+            conn.execute("DELETE FROM palabra_categoria WHERE palabra = ?", (antigua,))
+    
+    def obtener_repasos(self):
+        """Obtener la programación de repaso de todas las palabras"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_REPASOS)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def obtener_todo_progreso(self):
+        """Obtener conteos y última práctica de todas las palabras"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_TODO_PROGRESO)
+            return [dict(row) for row in cursor.fetchall()]
     
     def obtener_progreso_palabra(self, palabra):
         """Obtener progreso de una palabra específica"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM progreso_palabras WHERE palabra = ?
-            """, (palabra,))
+            cursor.execute(SQL_PROGRESO_PALABRA, (palabra,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
@@ -98,50 +418,71 @@ class Database:
         """Obtener estadísticas de los últimos N días"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT fecha, practicas_totales, practicas_correctas, tiempo_total
-                FROM estadisticas_diarias
-                WHERE fecha >= DATE('now', '-' || ? || ' days')
-                ORDER BY fecha DESC
-            """, (dias,))
+            cursor.execute(SQL_ESTADISTICAS_PERIODO, (dias,))
             return [dict(row) for row in cursor.fetchall()]
     
     def obtener_palabras_dificiles(self, limite=10):
         """Obtener las palabras más difíciles (solo nombres)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT palabra
-                FROM progreso_palabras
-                WHERE veces_incorrecta > 0
-                ORDER BY veces_incorrecta DESC, veces_vista DESC
-                LIMIT ?
-            """, (limite,))
+            cursor.execute(SQL_PALABRAS_DIFICILES, (limite,))
             return [row['palabra'] for row in cursor.fetchall()]
     
     def obtener_racha_estudio(self):
-        """Calcular racha de días consecutivos estudiando"""
+        """Calcular racha de días consecutivos estudiando (hasta hoy o ayer)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(DISTINCT fecha) as dias_estudiados
-                FROM estadisticas_diarias
-                WHERE fecha >= DATE('now', '-30 days')
-            """)
+            # Huecos e islas: en días consecutivos, fecha - número de fila es constante
+            cursor.execute(SQL_RACHA_ESTUDIO)
             row = cursor.fetchone()
-            return row['dias_estudiados'] if row else 0
+            if not row:
+                return 0
+            ayer = (datetime.now() - timedelta(days=1)).date().isoformat()
+            return row['racha'] if row['ultimo_dia'] >= ayer else 0
+    
+    def obtener_resumen_dia(self, fecha=None):
+        """Obtener los agregados de un día (hoy por defecto) y su desglose por modo"""
+        fecha = fecha or datetime.now().date()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_RESUMEN_DIA, (fecha,))
+            row = cursor.fetchone()
+            resumen = dict(row) if row else {
+                'palabras_practicadas': 0,
+                'practicas_totales': 0,
+                'practicas_correctas': 0,
+                'tiempo_total': 0
+            }
+            
+            cursor.execute(SQL_RESUMEN_DIA_MODOS, (fecha,))
+            resumen['por_modo'] = {row['modo']: dict(row) for row in cursor.fetchall()}
+            return resumen
+    
+    def obtener_estadisticas_semanales(self, semanas=8):
+        """Obtener los agregados de las últimas N semanas"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_ESTADISTICAS_SEMANALES, (semanas,))
+            return [dict(row) for row in cursor.fetchall()]
     
     def obtener_historial_palabra(self, palabra, limite=20):
-        """Obtener historial de prácticas de una palabra"""
+        """Obtener historial de prácticas de una palabra (recurre al archivo si hace falta)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT modo, correcta, respuesta_usuario, tiempo_respuesta, fecha
-                FROM practicas
-                WHERE palabra = ?
-                ORDER BY fecha DESC
-                LIMIT ?
-            """, (palabra, limite))
+            cursor.execute(SQL_HISTORIAL_PALABRA, (palabra, limite))
+            historial = [dict(row) for row in cursor.fetchall()]
+            
+            # Las prácticas archivadas son siempre anteriores a las de la tabla principal
+            if len(historial) < limite and self._local.archivo:
+                cursor.execute(SQL_HISTORIAL_ARCHIVO, (palabra, limite - len(historial)))
+                historial.extend(dict(row) for row in cursor.fetchall())
+            return historial
+    
+    def obtener_resumen_mensual_palabra(self, palabra):
+        """Obtener el resumen mensual de las prácticas archivadas de una palabra"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_RESUMEN_MENSUAL, (palabra,))
             return [dict(row) for row in cursor.fetchall()]
     
     def agregar_categoria(self, nombre, descripcion=None, color=None):
@@ -176,7 +517,7 @@ class Database:
         """Obtener valor de configuración"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT valor FROM configuracion WHERE clave = ?", (clave,))
+            cursor.execute(SQL_CONFIG, (clave,))
             row = cursor.fetchone()
             return row['valor'] if row else default
     
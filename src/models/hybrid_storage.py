@@ -3,12 +3,20 @@ Hybrid Storage System
 Combina JSON (vocabulario) + SQLite (estadísticas)
 """
 import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from .database import Database
+from .journal import VocabularioJournal, aplicar_registro
+from .indice_busqueda import IndiceBusqueda
+from .practica_writer import PracticaWriter
+from .archivador import ArchivadorPracticas
 from src.utils import BackupManager
 
+_AUSENTE = object()
+
 class HybridStorage:
-    def __init__(self, app_dir):
+    def __init__(self, app_dir, usar_journal=True):
         self.app_dir = Path(app_dir)
         self.json_path = self.app_dir / 'palabras.json'
         self.db_path = self.app_dir / 'statistics.db'
@@ -19,11 +27,36 @@ class HybridStorage:
         # Crear backup inicial si existen archivos
         self._crear_backup_inicial()
         
+        # Journal append-only: cada edición cuesta O(1) en disco
+        self.journal = VocabularioJournal(self.json_path) if usar_journal else None
+        
+        # Funciones notificadas con (palabra, existe) en cada mutación
+        self._observadores = []
+        # Funciones notificadas con (antigua, nueva) al renombrar una palabra
+        self._observadores_renombre = []
+        
+        # Lote activo (ver lote()): registros pendientes, valores previos y
+        # renombres cuyo traslado en SQLite espera a que se guarde el lote
+        self._lote = None
+        self._deshacer = None
+        self._renombres = None
+        
         # Inicializar almacenamiento JSON (vocabulario)
         self.vocabulario = self._load_json()
         
+        # Índice de búsqueda, actualizado por cada mutación
+        self.indice = IndiceBusqueda()
+        self.indice.construir(self.vocabulario)
+        
         # Inicializar base de datos SQLite (estadísticas)
         self.stats_db = Database(self.db_path)
+        
+        # Las prácticas se escriben en segundo plano, por lotes
+        self.practica_writer = PracticaWriter(self.stats_db)
+        
+        # Las prácticas antiguas se archivan en segundo plano
+        self.archivador = ArchivadorPracticas(self.stats_db, self.app_dir / 'statistics_archive.db')
+        self.archivador.iniciar()
     
     def _crear_backup_inicial(self):
         """Crear backup inicial al iniciar la aplicación"""
@@ -34,16 +67,23 @@ class HybridStorage:
             pass  # Ignorar errores en backup inicial
     
     def _load_json(self):
-        """Cargar vocabulario desde JSON"""
+        """Cargar vocabulario desde JSON y reproducir el journal pendiente"""
+        vocabulario = {}
         if self.json_path.exists():
             try:
                 with open(self.json_path, 'r', encoding='utf-8') as f:
                     contenido = f.read().strip()
                     if contenido:
-                        return json.loads(contenido)
+                        vocabulario = json.loads(contenido)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error al cargar JSON: {e}")
-        return {}
+        
+        if self.journal:
+            try:
+                self.journal.reproducir(vocabulario)
+            except IOError as e:
+                print(f"Error al leer journal: {e}")
+        return vocabulario
     
     def _save_json(self):
         """Guardar vocabulario en JSON con backup automático"""
@@ -52,42 +92,195 @@ class HybridStorage:
             if self.json_path.exists():
                 self.backup_manager.crear_backup(str(self.json_path))
             
-            # Guardar archivo
-            with open(self.json_path, 'w', encoding='utf-8') as f:
+            # Guardar en archivo temporal y reemplazar de forma atómica
+            tmp_path = self.json_path.with_name(self.json_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(self.vocabulario, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.json_path)
             return True
         except (IOError, PermissionError) as e:
             print(f"Error al guardar JSON: {e}")
             return False
     
+    def _aplicar(self, registro):
+        """Aplicar una mutación al vocabulario en memoria y al índice"""
+        aplicar_registro(self.vocabulario, registro)
+        palabra = registro['palabra']
+        existe = palabra in self.vocabulario
+        if existe:
+            self.indice.agregar(palabra, self.vocabulario[palabra])
+        else:
+            self.indice.eliminar(palabra)
+        for observador in self._observadores:
+            observador(palabra, existe)
+    
+    def suscribir(self, observador, al_renombrar=None):
+        """
+        Registrar una función observador(palabra, existe) para cada mutación
+        
+        Args:
+            observador: Función llamada tras cada alta, edición o baja
+            al_renombrar: Función (antigua, nueva) llamada antes de renombrar
+                una palabra, para trasladar el estado asociado a la clave nueva
+                (y con los argumentos invertidos si el renombre se deshace)
+        """
+        self._observadores.append(observador)
+        if al_renombrar:
+            self._observadores_renombre.append(al_renombrar)
+    
+    def _registrar(self, registros):
+        """Aplicar mutaciones en memoria y persistirlas"""
+        if self._lote is not None:
+            for registro in registros:
+                palabra = registro['palabra']
+                if palabra not in self._deshacer:
+                    self._deshacer[palabra] = self.vocabulario.get(palabra, _AUSENTE)
+                self._aplicar(registro)
+            # La persistencia se difiere hasta confirmar el lote
+            self._lote.extend(registros)
+            return True
+        
+        for registro in registros:
+            self._aplicar(registro)
+        return self._persistir(registros)
+    
+    @contextmanager
+    def lote(self):
+        """
+        Agrupar mutaciones en una transacción
+        
+        Dentro del bloque las altas, ediciones y bajas se aplican en memoria
+        sin tocar disco. Al salir se persisten de una sola vez (un backup y
+        una escritura); si ocurre una excepción se deshacen y se relanza.
+        
+        Uso:
+            with storage.lote():
+                storage.agregar_palabra("hello", "hola")
+                storage.agregar_palabra("bye", "adiós")
+        """
+        if self._lote is not None:
+            # Lote anidado: forma parte del lote exterior
+            yield self
+            return
+        
+        self._lote = []
+        self._deshacer = {}
+        self._renombres = []
+        try:
+            yield self
+            registros = self._lote
+            if registros and not self._persistir(registros):
+                raise IOError("No se pudo guardar el lote de cambios")
+        except BaseException:
+            self._revertir_lote()
+            raise
+        else:
+            # El vocabulario ya está guardado: trasladar las estadísticas
+            self._trasladar_estadisticas(self._renombres)
+        finally:
+            self._lote = None
+            self._deshacer = None
+            self._renombres = None
+    
+    def _revertir_lote(self):
+        """Restaurar los valores previos al inicio del lote"""
+        for antigua, nueva in reversed(self._renombres):
+            for observador in self._observadores_renombre:
+                observador(nueva, antigua)
+        for palabra, previo in self._deshacer.items():
+            if previo is _AUSENTE:
+                self._aplicar({'op': 'del', 'palabra': palabra})
+            else:
+                self._aplicar({'op': 'set', 'palabra': palabra, 'datos': previo})
+    
+    def _trasladar_estadisticas(self, renombres):
+        """Mover en SQLite las estadísticas de las palabras renombradas"""
+        if not renombres:
+            return
+        # Las prácticas encoladas con la clave antigua también se trasladan
+        self.practica_writer.flush()
+        for antigua, nueva in renombres:
+            try:
+                self.stats_db.renombrar_palabra(antigua, nueva)
+            except Exception as e:
+                print(f"Error al trasladar estadísticas de '{antigua}' a '{nueva}': {e}")
+    
+    def _persistir(self, registros):
+        """Persistir mutaciones en el journal o reescribiendo el snapshot"""
+        if not self.journal:
+            return self._save_json()
+        
+        if not self.journal.agregar(registros):
+            return False
+        if self.journal.necesita_compactar():
+            self.compactar()
+        return True
+    
+    def compactar(self):
+        """Volcar el vocabulario a palabras.json y vaciar el journal"""
+        if not self._save_json():
+            return False
+        if self.journal:
+            self.journal.vaciar()
+        return True
+    
+    def cerrar(self):
+        """Vaciar prácticas y journal pendientes y cerrar la base de datos"""
+        self.practica_writer.detener()
+        self.archivador.detener()
+        if self.journal and self.journal.existe():
+            self.compactar()
+        self.stats_db.cerrar()
+    
+    @staticmethod
+    def _datos_palabra(significado, pronunciacion=None, notas=None):
+        """Construir el registro de datos de una palabra"""
+        datos = {'significado': significado}
+        if pronunciacion:
+            datos['pronunciacion'] = pronunciacion
+        if notas:
+            datos['notas'] = notas
+        return datos
+    
     # ========== OPERACIONES DE VOCABULARIO (JSON) ==========
     
     def agregar_palabra(self, palabra, significado, pronunciacion=None, notas=None):
         """Agregar palabra al vocabulario"""
-        self.vocabulario[palabra] = {'significado': significado}
-        if pronunciacion:
-            self.vocabulario[palabra]['pronunciacion'] = pronunciacion
-        if notas:
-            self.vocabulario[palabra]['notas'] = notas
-        return self._save_json()
+        datos = self._datos_palabra(significado, pronunciacion, notas)
+        return self._registrar([{'op': 'set', 'palabra': palabra, 'datos': datos}])
     
     def editar_palabra(self, palabra_antigua, palabra_nueva, significado, pronunciacion=None, notas=None):
-        """Editar palabra existente"""
-        if palabra_antigua in self.vocabulario:
-            del self.vocabulario[palabra_antigua]
+        """
+        Editar palabra existente
         
-        self.vocabulario[palabra_nueva] = {'significado': significado}
-        if pronunciacion:
-            self.vocabulario[palabra_nueva]['pronunciacion'] = pronunciacion
-        if notas:
-            self.vocabulario[palabra_nueva]['notas'] = notas
-        return self._save_json()
+        Si la palabra no cambia se reescriben solo sus datos, sin baja y
+        alta, para conservar su progreso. Si se renombra, el estado de
+        repaso pasa a la clave nueva y, una vez guardado el vocabulario,
+        también sus estadísticas e historial en SQLite.
+        """
+        datos = self._datos_palabra(significado, pronunciacion, notas)
+        if palabra_antigua == palabra_nueva or palabra_antigua not in self.vocabulario:
+            return self._registrar([{'op': 'set', 'palabra': palabra_nueva, 'datos': datos}])
+        
+        # Como lote, para que un fallo al guardar deshaga también el renombre
+        try:
+            with self.lote():
+                for observador in self._observadores_renombre:
+                    observador(palabra_antigua, palabra_nueva)
+                self._renombres.append((palabra_antigua, palabra_nueva))
+                self._registrar([
+                    {'op': 'del', 'palabra': palabra_antigua},
+                    {'op': 'set', 'palabra': palabra_nueva, 'datos': datos}
+                ])
+        except IOError as e:
+            print(f"Error al renombrar palabra: {e}")
+            return False
+        return True
     
     def eliminar_palabra(self, palabra):
         """Eliminar palabra del vocabulario"""
         if palabra in self.vocabulario:
-            del self.vocabulario[palabra]
-            self._save_json()
+            self._registrar([{'op': 'del', 'palabra': palabra}])
             return True
         return False
     
@@ -99,45 +292,78 @@ class HybridStorage:
         """Obtener todo el vocabulario"""
         return self.vocabulario
     
+    def obtener_normalizado(self, palabra):
+        """Obtener (palabra, significado) normalizados, calculados al cargar o editar"""
+        return self.indice.formas(palabra)
+    
+    def coincide_palabra(self, palabra, consulta):
+        """Verificar si una palabra coincide con una consulta ya normalizada"""
+        return self.indice.coincide(palabra, consulta)
+    
     def existe_palabra(self, palabra):
         """Verificar si una palabra existe"""
         return palabra in self.vocabulario
     
     def buscar_palabras(self, query):
-        """Buscar palabras por texto"""
-        query = query.lower()
-        resultados = {}
-        for palabra, datos in self.vocabulario.items():
-            if query in palabra.lower() or query in datos.get('significado', '').lower():
-                resultados[palabra] = datos
-        return resultados
+        """Buscar palabras por texto (palabra o significado) usando el índice"""
+        return {palabra: self.vocabulario[palabra] for palabra in self.indice.buscar(query)}
     
     # ========== OPERACIONES DE ESTADÍSTICAS (SQLite) ==========
     
-    def registrar_practica(self, palabra, modo, correcta, respuesta_usuario=None, tiempo_respuesta=None):
-        """Registrar práctica en base de datos"""
-        return self.stats_db.registrar_practica(palabra, modo, correcta, respuesta_usuario, tiempo_respuesta)
+    def registrar_practica(self, palabra, modo, correcta, respuesta_usuario=None, tiempo_respuesta=None,
+                           repaso=None):
+        """Registrar práctica (se escribe en segundo plano)"""
+        self.practica_writer.registrar(palabra, modo, correcta, respuesta_usuario, tiempo_respuesta, repaso)
     
     def obtener_progreso_palabra(self, palabra):
         """Obtener progreso de una palabra"""
+        self.practica_writer.flush()
         return self.stats_db.obtener_progreso_palabra(palabra)
     
+    def obtener_todo_progreso(self):
+        """Obtener el progreso de todas las palabras"""
+        self.practica_writer.flush()
+        return self.stats_db.obtener_todo_progreso()
+    
     def obtener_estadisticas_periodo(self, dias=30):
         """Obtener estadísticas de período"""
+        self.practica_writer.flush()
         return self.stats_db.obtener_estadisticas_periodo(dias)
     
     def obtener_palabras_dificiles(self, limite=10):
         """Obtener palabras más difíciles"""
+        self.practica_writer.flush()
         return self.stats_db.obtener_palabras_dificiles(limite)
     
     def obtener_racha_estudio(self):
         """Obtener racha de estudio"""
+        self.practica_writer.flush()
         return self.stats_db.obtener_racha_estudio()
     
+    def obtener_resumen_dia(self, fecha=None):
+        """Obtener los agregados de un día (hoy por defecto)"""
+        self.practica_writer.flush()
+        return self.stats_db.obtener_resumen_dia(fecha)
+    
+    def obtener_estadisticas_semanales(self, semanas=8):
+        """Obtener los agregados de las últimas semanas"""
+        self.practica_writer.flush()
+        return self.stats_db.obtener_estadisticas_semanales(semanas)
+    
     def obtener_historial_palabra(self, palabra, limite=20):
         """Obtener historial de prácticas de una palabra"""
+        self.practica_writer.flush()
         return self.stats_db.obtener_historial_palabra(palabra, limite)
     
+    def obtener_resumen_mensual_palabra(self, palabra):
+        """Obtener el resumen mensual de las prácticas archivadas de una palabra"""
+        return self.stats_db.obtener_resumen_mensual_palabra(palabra)
+    
+    def obtener_repasos(self):
+        """Obtener la programación de repaso espaciado"""
+        self.practica_writer.flush()
+        return self.stats_db.obtener_repasos()
+    
     # ========== CATEGORÍAS ==========
     
     def agregar_categoria(self, nombre, descripcion=None, color=None):
@@ -190,26 +416,19 @@ class HybridStorage:
         import csv
         try:
             count = 0
-            with open(archivo, 'r', encoding='utf-8') as f:
+            with self.lote(), open(archivo, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     palabra = row.get('Inglés', '').strip().lower()
                     significado = row.get('Español', '').strip()
                     
                     if palabra and significado:
-                        self.vocabulario[palabra] = {'significado': significado}
-                        
-                        pronunciacion = row.get('Pronunciación', '').strip()
-                        if pronunciacion:
-                            self.vocabulario[palabra]['pronunciacion'] = pronunciacion
-                        
-                        notas = row.get('Notas', '').strip()
-                        if notas:
-                            self.vocabulario[palabra]['notas'] = notas
-                        
+                        self.agregar_palabra(
+                            palabra, significado,
+                            row.get('Pronunciación', '').strip(),
+                            row.get('Notas', '').strip()
+                        )
                         count += 1
-            
-            self._save_json()
             return count
         except Exception as e:
             print(f"Error al importar CSV: {e}")
@@ -0,0 +1,119 @@
+"""
+Índice de búsqueda del vocabulario
+Índice invertido de tokens + índice de trigramas para búsqueda por subcadena
+"""
+from src.utils.normalizacion import normalizar_texto
+
+
+def _trigramas(texto):
+    """Conjunto de trigramas de un texto"""
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceBusqueda:
+    """
+    Índice mantenido de forma incremental por HybridStorage.
+
+    Una palabra coincide con la consulta si la consulta es subcadena de la
+    palabra o de su significado. Las consultas de 3 o más caracteres solo
+    revisan las entradas que contienen todos sus trigramas; las más cortas
+    recorren los tokens distintos en lugar de todas las entradas.
+    """
+
+    def __init__(self):
+        self._textos = {}      # palabra -> (palabra normalizada, significado normalizado)
+        self._tokens = {}      # token -> set(palabras)
+        self._trigramas = {}   # trigrama -> set(palabras)
+
+    @staticmethod
+    def plegar(texto):
+        """Forma comparable de un texto (sin mayúsculas ni acentos)"""
+        return normalizar_texto(texto)
+
+    def construir(self, vocabulario):
+        """Reconstruir el índice completo"""
+        self._textos.clear()
+        self._tokens.clear()
+        self._trigramas.clear()
+        for palabra, datos in vocabulario.items():
+            self.agregar(palabra, datos)
+
+    def agregar(self, palabra, datos):
+        """Indexar (o reindexar) una palabra"""
+        if palabra in self._textos:
+            self.eliminar(palabra)
+
+        campos = (self.plegar(palabra), self.plegar(datos.get('significado', '')))
+        self._textos[palabra] = campos
+        for campo in campos:
+            for token in campo.split():
+                self._tokens.setdefault(token, set()).add(palabra)
+            for trigrama in _trigramas(campo):
+                self._trigramas.setdefault(trigrama, set()).add(palabra)
+
+    def eliminar(self, palabra):
+        """Quitar una palabra del índice"""
+        campos = self._textos.pop(palabra, None)
+        if campos is None:
+            return
+        for campo in campos:
+            for token in campo.split():
+                self._descartar(self._tokens, token, palabra)
+            for trigrama in _trigramas(campo):
+                self._descartar(self._trigramas, trigrama, palabra)
+
+    @staticmethod
+    def _descartar(indice, termino, palabra):
+        """Quitar una palabra de una lista de apariciones"""
+        apariciones = indice.get(termino)
+        if apariciones is not None:
+            apariciones.discard(palabra)
+            if not apariciones:
+                del indice[termino]
+
+    def formas(self, palabra):
+        """Formas normalizadas (palabra, significado) precalculadas de una entrada"""
+        return self._textos.get(palabra)
+
+    def coincide(self, palabra, consulta):
+        """Verificar si una palabra coincide con una consulta ya plegada"""
+        campos = self._textos.get(palabra)
+        if campos is None:
+            return False
+        return consulta in campos[0] or consulta in campos[1]
+
+    def buscar(self, query):
+        """
+        Buscar palabras que contengan la consulta
+
+        Returns:
+            Conjunto de palabras coincidentes
+        """
+        consulta = self.plegar(query)
+        if not consulta:
+            return set(self._textos)
+
+        if len(consulta) >= 3:
+            listas = []
+            for trigrama in _trigramas(consulta):
+                apariciones = self._trigramas.get(trigrama)
+                if not apariciones:
+                    return set()
+                listas.append(apariciones)
+            listas.sort(key=len)
+            candidatos = set(listas[0])
+            for apariciones in listas[1:]:
+                candidatos &= apariciones
+                if not candidatos:
+                    return candidatos
+            return {p for p in candidatos if self.coincide(p, consulta)}
+
+        if not any(c.isspace() for c in consulta):
+            # Toda subcadena sin espacios está contenida en algún token
+            resultados = set()
+            for token, apariciones in self._tokens.items():
+                if consulta in token:
+                    resultados |= apariciones
+            return resultados
+
+        return {p for p in self._textos if self.coincide(p, consulta)}
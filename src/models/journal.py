@@ -0,0 +1,119 @@
+"""
+Journal de Vocabulario
+Registro append-only de mutaciones sobre palabras.json
+"""
+import json
+import os
+from pathlib import Path
+
+
+class VocabularioJournal:
+    """
+    Log de mutaciones en formato JSON Lines junto al snapshot.
+
+    Cada línea es un registro:
+        {"op": "set", "palabra": "hello", "datos": {"significado": "hola"}}
+        {"op": "del", "palabra": "hello"}
+    """
+
+    def __init__(self, json_path, max_registros=1000):
+        """
+        Args:
+            json_path: Ruta del snapshot (palabras.json)
+            max_registros: Registros acumulados antes de sugerir compactación
+        """
+        json_path = Path(json_path)
+        self.path = json_path.with_name(json_path.stem + '.journal')
+        self.max_registros = max_registros
+        self.registros = 0
+
+    def existe(self):
+        """Verificar si hay un journal pendiente de compactar"""
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def reproducir(self, vocabulario):
+        """
+        Aplicar los registros del journal sobre el vocabulario cargado
+
+        Si la última línea quedó truncada por un cierre inesperado, el
+        archivo se recorta tras el último registro válido para que las
+        escrituras siguientes empiecen en una línea nueva.
+
+        Returns:
+            Número de registros aplicados
+        """
+        self.registros = 0
+        if not self.path.exists():
+            return 0
+
+        with open(self.path, 'rb') as f:
+            datos = f.read()
+
+        valido = 0   # Byte siguiente al último registro válido
+        for linea in datos.splitlines(keepends=True):
+            texto = linea.strip()
+            if texto:
+                try:
+                    registro = json.loads(texto.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    break
+                aplicar_registro(vocabulario, registro)
+                self.registros += 1
+            valido += len(linea)
+
+        if datos and (valido < len(datos) or not datos.endswith(b'\n')):
+            self._reparar(valido, datos[:valido].endswith(b'\n'))
+        return self.registros
+
+    def _reparar(self, valido, termina_en_linea):
+        """Recortar el journal tras el último registro válido"""
+        with open(self.path, 'r+b') as f:
+            f.truncate(valido)
+            # Registro completo al que solo le faltaba el salto de línea
+            if valido and not termina_en_linea:
+                f.seek(valido)
+                f.write(b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def agregar(self, registros):
+        """Añadir registros al final del journal (una sola escritura + fsync)"""
+        if not registros:
+            return True
+        try:
+            bloque = ''.join(
+                json.dumps(r, ensure_ascii=False, separators=(',', ':')) + '\n'
+                for r in registros
+            )
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(bloque)
+                f.flush()
+                os.fsync(f.fileno())
+            self.registros += len(registros)
+            return True
+        except (IOError, PermissionError) as e:
+            print(f"Error al escribir journal: {e}")
+            return False
+
+    def necesita_compactar(self):
+        """Verificar si el journal superó el umbral de compactación"""
+        return self.registros >= self.max_registros
+
+    def vaciar(self):
+        """Eliminar el journal tras volcarlo al snapshot"""
+        try:
+            if self.path.exists():
+                self.path.unlink()
+        except (IOError, PermissionError) as e:
+            print(f"Error al vaciar journal: {e}")
+        self.registros = 0
+
+
+def aplicar_registro(vocabulario, registro):
+    """Aplicar un registro de mutación sobre el diccionario de vocabulario"""
+    op = registro.get('op')
+    palabra = registro.get('palabra')
+    if op == 'set':
+        vocabulario[palabra] = registro.get('datos', {})
+    elif op == 'del':
+        vocabulario.pop(palabra, None)
@@ -0,0 +1,215 @@
+"""
+Migraciones del esquema de estadísticas
+Cada migración se aplica una sola vez, en orden. La versión del esquema se
+guarda en PRAGMA user_version, de modo que abrir una base de datos al día
+cuesta una sola lectura, y el detalle queda en la tabla migraciones_aplicadas
+"""
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+SCHEMA_PATH = Path(__file__).parent / 'schema.sql'
+
+
+def _sentencias(script):
+    """Separar un script SQL en sentencias completas"""
+    actual = ''
+    for linea in script.splitlines(keepends=True):
+        if not actual and (not linea.strip() or linea.lstrip().startswith('--')):
+            continue
+        actual += linea
+        if sqlite3.complete_statement(actual):
+            yield actual.strip()
+            actual = ''
+
+
+def _esquema_base(conn):
+    """Tablas e índices originales (schema.sql)"""
+    with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
+        for sentencia in _sentencias(f.read()):
+            conn.execute(sentencia)
+
+
+def _rellenar_agregados(conn):
+    """Calcular los agregados a partir del historial existente"""
+    conn.execute("""
+        INSERT OR IGNORE INTO palabras_diarias (fecha, palabra)
+        SELECT DISTINCT DATE(fecha), palabra FROM practicas
+    """)
+    conn.execute("""
+        UPDATE estadisticas_diarias SET palabras_practicadas = (
+            SELECT COUNT(*) FROM palabras_diarias p WHERE p.fecha = estadisticas_diarias.fecha
+        )
+        WHERE fecha IN (SELECT DISTINCT fecha FROM palabras_diarias)
+    """)
+    conn.execute("DELETE FROM estadisticas_semanales")
+    conn.execute("""
+        INSERT INTO estadisticas_semanales (semana, practicas_totales, practicas_correctas, tiempo_total)
+        SELECT DATE(fecha, '-6 days', 'weekday 1'), SUM(practicas_totales),
+               SUM(practicas_correctas), SUM(tiempo_total)
+        FROM estadisticas_diarias
+        GROUP BY 1
+    """)
+    conn.execute("DELETE FROM estadisticas_modo")
+    conn.execute("""
+        INSERT INTO estadisticas_modo (fecha, modo, practicas_totales, practicas_correctas, tiempo_total)
+        SELECT DATE(fecha), modo, COUNT(*), SUM(correcta), COALESCE(SUM(tiempo_respuesta), 0)
+        FROM practicas
+        GROUP BY 1, 2
+    """)
+
+
+def _fechas_locales(conn):
+    """
+    Pasar a hora local las prácticas guardadas con CURRENT_TIMESTAMP (UTC)
+
+    Las prácticas se guardan en hora local, como los días de
+    estadisticas_diarias y progreso_palabras.ultima_practica. Las anteriores
+    a PracticaWriter tomaban la fecha por defecto en UTC. El corte es el
+    mayor id al actualizar: todas las prácticas existentes son de antes de
+    esta versión (el formato de la fecha no sirve, porque sqlite3 omite la
+    fracción de segundo cuando vale 0). Se convierten y se recalculan los
+    agregados de los días afectados, que la migración 3 contó con la fecha UTC.
+    """
+    tope = conn.execute("SELECT COALESCE(MAX(id), 0) FROM practicas").fetchone()[0]
+    conn.execute("CREATE TEMP TABLE dias_afectados (fecha DATE PRIMARY KEY)")
+    conn.execute("""
+        INSERT OR IGNORE INTO dias_afectados
+        SELECT DATE(fecha) FROM practicas WHERE id <= :tope
+        UNION SELECT DATE(fecha, 'localtime') FROM practicas WHERE id <= :tope
+    """, {'tope': tope})
+    conn.execute("UPDATE practicas SET fecha = datetime(fecha, 'localtime') WHERE id <= ?", (tope,))
+
+    conn.execute("DELETE FROM palabras_diarias WHERE fecha IN (SELECT fecha FROM dias_afectados)")
+    conn.execute("""
+        INSERT OR IGNORE INTO palabras_diarias (fecha, palabra)
+        SELECT DISTINCT DATE(fecha), palabra FROM practicas
+        WHERE DATE(fecha) IN (SELECT fecha FROM dias_afectados)
+    """)
+    conn.execute("""
+        UPDATE estadisticas_diarias SET palabras_practicadas = (
+            SELECT COUNT(*) FROM palabras_diarias p WHERE p.fecha = estadisticas_diarias.fecha
+        )
+        WHERE fecha IN (SELECT fecha FROM dias_afectados)
+    """)
+    conn.execute("DELETE FROM estadisticas_modo WHERE fecha IN (SELECT fecha FROM dias_afectados)")
+    conn.execute("""
+        INSERT INTO estadisticas_modo (fecha, modo, practicas_totales, practicas_correctas, tiempo_total)
+        SELECT DATE(fecha), modo, COUNT(*), SUM(correcta), COALESCE(SUM(tiempo_respuesta), 0)
+        FROM practicas
+        WHERE DATE(fecha) IN (SELECT fecha FROM dias_afectados)
+        GROUP BY 1, 2
+    """)
+    conn.execute("DROP TABLE dias_afectados")
+
+
+# (versión, descripción, sentencias SQL o función que recibe la conexión)
+MIGRACIONES = [
+    (1, 'Esquema base', _esquema_base),
+    (2, 'Índices compuestos y cubrientes para las consultas de Database', [
+        # Booleano de baja selectividad que ninguna consulta usa por sí solo
+        "DROP INDEX IF EXISTS idx_practicas_correcta",
+        # El historial filtra por palabra y ordena por fecha
+        "DROP INDEX IF EXISTS idx_practicas_palabra",
+        "CREATE INDEX IF NOT EXISTS idx_practicas_palabra_fecha ON practicas(palabra, fecha)",
+        # Duplican la clave primaria de su tabla
+        "DROP INDEX IF EXISTS idx_estadisticas_fecha",
+        "DROP INDEX IF EXISTS idx_palabra_categoria",
+        # Cubre obtener_palabras_dificiles (filtro, orden y columna devuelta)
+        """CREATE INDEX IF NOT EXISTS idx_progreso_dificultad
+           ON progreso_palabras(veces_incorrecta DESC, veces_vista DESC, palabra)""",
+    ]),
+    (3, 'Agregados diarios, semanales y por modo del historial existente', _rellenar_agregados),
+    (4, 'Fechas de prácticas en hora local', _fechas_locales),
+]
+
+VERSION_ACTUAL = MIGRACIONES[-1][0]
+
+
+def version_esquema(conn):
+    """Versión del esquema guardada en la base de datos"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def aplicar_migraciones(conn):
+    """
+    Aplicar las migraciones pendientes
+
+    Si el esquema está al día solo se lee PRAGMA user_version: no se abre
+    schema.sql ni se toma el bloqueo de escritura.
+
+    Args:
+        conn: Conexión sqlite3 sin transacción abierta
+
+    Returns:
+        Lista de versiones aplicadas
+    """
+    actual = version_esquema(conn)
+    if actual >= VERSION_ACTUAL:
+        return []
+
+    nuevas = []
+    for version, descripcion, migracion in MIGRACIONES:
+        if version <= actual:
+            continue
+        # BEGIN IMMEDIATE serializa a los procesos que arrancan a la vez:
+        # el que llega segundo ve la migración ya aplicada y la salta
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS migraciones_aplicadas (
+                    version INTEGER PRIMARY KEY,
+                    descripcion TEXT,
+                    fecha TIMESTAMP
+                )
+            """)
+            aplicada = conn.execute(
+                "SELECT 1 FROM migraciones_aplicadas WHERE version = ?", (version,)
+            ).fetchone()
+            if not aplicada:
+                if callable(migracion):
+                    migracion(conn)
+                else:
+                    for sentencia in migracion:
+                        conn.execute(sentencia)
+                conn.execute("""
+                    INSERT INTO migraciones_aplicadas (version, descripcion, fecha) VALUES (?, ?, ?)
+                """, (version, descripcion, datetime.now()))
+                nuevas.append(version)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return nuevas
+
+
+def planes_consulta(conn, consultas):
+    """
+    Obtener el plan (EXPLAIN QUERY PLAN) de cada consulta
+
+    Args:
+        conn: Conexión sqlite3
+        consultas: dict nombre -> (sql, parámetros) o (sql, parámetros, tablas
+            que la consulta lee completas a propósito)
+
+    Returns:
+        dict nombre -> (usa_indice, líneas del plan)
+    """
+    tablas = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    resultado = {}
+    for nombre, (sql, parametros, *completas) in consultas.items():
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, parametros)]
+        permitidas = set(completas[0]) if completas else set()
+        resultado[nombre] = (_usa_indice(plan, tablas - permitidas), plan)
+    return resultado
+
+
+def _usa_indice(plan, tablas):
+    """Un plan es aceptable si ninguna tabla se recorre completa sin índice"""
+    for linea in plan:
+        partes = linea.split()
+        # Las tablas de bases adjuntas aparecen como "archivo.practicas"
+        if len(partes) >= 2 and partes[0] == 'SCAN' and partes[1].split('.')[-1] in tablas and ' USING ' not in linea:
+            return False
+    return True
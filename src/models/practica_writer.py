@@ -0,0 +1,123 @@
+"""
+Escritura diferida de prácticas
+Agrupa los eventos de práctica en memoria y los escribe en SQLite
+desde un hilo de fondo, sin bloquear el hilo de la interfaz
+"""
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+
+_EXPIRADO = object()
+
+
+class PracticaWriter:
+    def __init__(self, db, max_eventos=20, intervalo_ms=500):
+        """
+        Args:
+            db: Instancia de Database
+            max_eventos: Eventos acumulados que fuerzan una escritura
+            intervalo_ms: Tiempo máximo que un evento espera en memoria
+        """
+        self.db = db
+        self.max_eventos = max_eventos
+        self.intervalo = intervalo_ms / 1000
+        self._cola = queue.Queue()
+        self._pendientes = []      # Eventos aún no escritos (incluye los fallidos)
+        self._detenido = False
+
+        self._hilo = threading.Thread(target=self._ejecutar, name='PracticaWriter', daemon=True)
+        self._hilo.start()
+
+        # Garantizar el vaciado aunque no se llame a detener()
+        atexit.register(self.detener)
+
+    def registrar(self, palabra, modo, correcta, respuesta_usuario=None, tiempo_respuesta=None, repaso=None):
+        """Encolar una práctica (no toca disco)"""
+        if self._detenido:
+            # Tras el cierre se escribe de forma síncrona para no perder datos
+            self.db.registrar_practica(palabra, modo, correcta, respuesta_usuario, tiempo_respuesta,
+                                       repaso=repaso)
+            return
+
+        self._cola.put({
+            'palabra': palabra,
+            'modo': modo,
+            'correcta': correcta,
+            'respuesta_usuario': respuesta_usuario,
+            'tiempo_respuesta': tiempo_respuesta,
+            'fecha': datetime.now(),
+            'repaso': repaso
+        })
+
+    def flush(self, timeout=5):
+        """Esperar a que se escriban todos los eventos encolados hasta ahora"""
+        if self._detenido or not self._hilo.is_alive():
+            return
+        listo = threading.Event()
+        self._cola.put(listo)
+        listo.wait(timeout)
+
+    def detener(self, timeout=15):
+        """
+        Escribir los eventos pendientes y finalizar el hilo
+
+        El timeout por defecto supera la espera por bloqueo de la conexión
+        (10 s), para que un "database is locked" no corte la última escritura.
+        """
+        if self._detenido:
+            return
+        self._detenido = True
+        self._cola.put(None)
+        self._hilo.join(timeout)
+        # Último intento, en este hilo, con lo que el escritor no pudo guardar
+        if not self._hilo.is_alive() and self._pendientes:
+            self._escribir(self._pendientes)
+        atexit.unregister(self.detener)
+
+    def _ejecutar(self):
+        """Bucle del hilo escritor"""
+        pendientes = self._pendientes
+        limite = None
+        while True:
+            espera = max(0, limite - time.monotonic()) if pendientes else None
+            try:
+                item = self._cola.get(timeout=espera)
+            except queue.Empty:
+                item = _EXPIRADO
+
+            if item is None:
+                self._escribir(pendientes)
+                return
+            if item is _EXPIRADO:
+                self._escribir(pendientes)
+            elif isinstance(item, threading.Event):
+                self._escribir(pendientes)
+                item.set()
+            else:
+                pendientes.append(item)
+                if len(pendientes) == 1:
+                    limite = time.monotonic() + self.intervalo
+                if len(pendientes) >= self.max_eventos:
+                    self._escribir(pendientes)
+            # Lo que falló se reintenta en el siguiente intervalo
+            if pendientes and limite <= time.monotonic():
+                limite = time.monotonic() + self.intervalo
+
+    def _escribir(self, pendientes):
+        """
+        Escribir los eventos acumulados en una sola transacción
+
+        Si la escritura falla (p. ej. "database is locked") los eventos se
+        conservan para reintentarlos; la transacción se revierte completa,
+        así que reintentar no duplica prácticas.
+        """
+        if not pendientes:
+            return
+        try:
+            self.db.registrar_practicas(pendientes)
+        except Exception as e:
+            print(f"Error al registrar prácticas (se reintentará): {e}")
+            return
+        pendientes.clear()
@@ -9,7 +9,8 @@ CREATE TABLE IF NOT EXISTS practicas (
     correcta BOOLEAN NOT NULL,
     respuesta_usuario TEXT,
     tiempo_respuesta INTEGER,
-    fecha TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    -- Hora local, como los días de las estadísticas (ver migración 4)
+    fecha TIMESTAMP DEFAULT (datetime('now', 'localtime'))
 );
 
 -- Progreso por palabra
@@ -23,6 +24,15 @@ CREATE TABLE IF NOT EXISTS progreso_palabras (
     fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Repetición espaciada (SM-2) por palabra
+CREATE TABLE IF NOT EXISTS repaso_palabras (
+    palabra TEXT PRIMARY KEY,
+    repeticiones INTEGER DEFAULT 0,
+    intervalo REAL DEFAULT 0,
+    facilidad REAL DEFAULT 2.5,
+    proxima_revision TIMESTAMP
+);
+
 -- Estadísticas diarias
 CREATE TABLE IF NOT EXISTS estadisticas_diarias (
     fecha DATE PRIMARY KEY,
@@ -32,6 +42,41 @@ CREATE TABLE IF NOT EXISTS estadisticas_diarias (
     tiempo_total INTEGER DEFAULT 0
 );
 
+-- Palabras distintas practicadas cada día
+CREATE TABLE IF NOT EXISTS palabras_diarias (
+    fecha DATE NOT NULL,
+    palabra TEXT NOT NULL,
+    PRIMARY KEY (fecha, palabra)
+) WITHOUT ROWID;
+
+-- Estadísticas semanales (semana = lunes de la semana)
+CREATE TABLE IF NOT EXISTS estadisticas_semanales (
+    semana DATE PRIMARY KEY,
+    practicas_totales INTEGER DEFAULT 0,
+    practicas_correctas INTEGER DEFAULT 0,
+    tiempo_total INTEGER DEFAULT 0
+);
+
+-- Estadísticas diarias por modo de práctica
+CREATE TABLE IF NOT EXISTS estadisticas_modo (
+    fecha DATE NOT NULL,
+    modo TEXT NOT NULL,
+    practicas_totales INTEGER DEFAULT 0,
+    practicas_correctas INTEGER DEFAULT 0,
+    tiempo_total INTEGER DEFAULT 0,
+    PRIMARY KEY (fecha, modo)
+) WITHOUT ROWID;
+
+-- Resumen mensual por palabra de las prácticas archivadas
+CREATE TABLE IF NOT EXISTS resumen_mensual_palabras (
+    mes TEXT NOT NULL,
+    palabra TEXT NOT NULL,
+    practicas_totales INTEGER DEFAULT 0,
+    practicas_correctas INTEGER DEFAULT 0,
+    tiempo_total INTEGER DEFAULT 0,
+    PRIMARY KEY (palabra, mes)
+) WITHOUT ROWID;
+
 -- Categorías
 CREATE TABLE IF NOT EXISTS categorias (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -65,8 +110,10 @@ CREATE TABLE IF NOT EXISTS configuracion (
 );
 
 -- Índices para mejorar performance
+-- (esquema base: los cambios posteriores se aplican en migraciones.py)
 CREATE INDEX IF NOT EXISTS idx_practicas_palabra ON practicas(palabra);
 CREATE INDEX IF NOT EXISTS idx_practicas_fecha ON practicas(fecha);
 CREATE INDEX IF NOT EXISTS idx_practicas_correcta ON practicas(correcta);
+CREATE INDEX IF NOT EXISTS idx_repaso_proxima ON repaso_palabras(proxima_revision);
 CREATE INDEX IF NOT EXISTS idx_estadisticas_fecha ON estadisticas_diarias(fecha);
 CREATE INDEX IF NOT EXISTS idx_palabra_categoria ON palabra_categoria(palabra);
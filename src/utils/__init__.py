@@ -4,5 +4,7 @@ from .tts_helper import TTSHelper
 from .styles import AppStyles
 from .validators import Validator
 from .backup import BackupManager
+from .normalizacion import normalizar_texto
+from .fechas import a_timestamp
 
-__all__ = ['AppConfig', 'TTSHelper', 'AppStyles', 'Validator', 'BackupManager']
+__all__ = ['AppConfig', 'TTSHelper', 'AppStyles', 'Validator', 'BackupManager', 'normalizar_texto', 'a_timestamp']
@@ -0,0 +1,13 @@
+"""Conversión de fechas guardadas en SQLite"""
+from datetime import datetime
+
+def a_timestamp(valor):
+    """Convertir una fecha guardada en SQLite a timestamp (0 si no hay o no es válida)"""
+    if not valor:
+        return 0
+    if isinstance(valor, datetime):
+        return valor.timestamp()
+    try:
+        return datetime.fromisoformat(str(valor)).timestamp()
+    except ValueError:
+        return 0
@@ -0,0 +1,12 @@
+"""Normalización de texto para búsquedas y comparación de respuestas"""
+import unicodedata
+
+def normalizar_texto(texto):
+    """
+    Plegar mayúsculas y acentos: 'Árbol ' -> 'arbol'
+    
+    Se usa casefold() + descomposición NFKD eliminando las marcas
+    diacríticas, de modo que "arbol" coincide con "árbol".
+    """
+    texto = unicodedata.normalize('NFKD', str(texto).casefold())
+    return ''.join(c for c in texto if not unicodedata.combining(c)).strip()
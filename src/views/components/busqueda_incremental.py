@@ -0,0 +1,73 @@
+"""Búsqueda Incremental - Controlador compartido para cajas de búsqueda"""
+from src.utils import normalizar_texto
+
+class BusquedaIncremental:
+    """
+    Conecta un Entry con una búsqueda diferida y cancelable.
+
+    - Espera `retardo_ms` sin teclear antes de buscar (debounce con after()).
+    - Una nueva pulsación cancela la búsqueda pendiente.
+    - Las teclas que no cambian el texto (flechas, Shift, Ctrl...) se ignoran.
+    - Si la consulta nueva contiene a la anterior ("ab" -> "abc"), se filtran
+      los resultados anteriores en lugar de buscar en todos los datos.
+    """
+
+    def __init__(self, entry, buscar, filtrar, mostrar, retardo_ms=150):
+        """
+        Args:
+            entry: Widget Entry con el texto de búsqueda
+            buscar: Función consulta -> lista de claves (búsqueda completa)
+            filtrar: Función (consulta, claves) -> claves que siguen coincidiendo
+            mostrar: Función (consulta, claves) que actualiza la vista
+            retardo_ms: Espera tras la última tecla
+        """
+        self.entry = entry
+        self.buscar = buscar
+        self.filtrar = filtrar
+        self.mostrar = mostrar
+        self.retardo_ms = retardo_ms
+
+        self._pendiente = None     # Consulta programada
+        self._job = None           # Id de after() pendiente
+        self._ultima = None        # Última consulta ejecutada
+        self._resultados = None    # Claves de la última consulta
+
+        entry.bind('<KeyRelease>', self._on_tecla)
+
+    def _on_tecla(self, event=None):
+        """Programar la búsqueda si el texto cambió"""
+        consulta = normalizar_texto(self.entry.get())
+        if consulta == self._pendiente:
+            return
+        self._pendiente = consulta
+        self.cancelar()
+        self._job = self.entry.after(self.retardo_ms, self._ejecutar_pendiente)
+
+    def cancelar(self):
+        """Cancelar la búsqueda programada"""
+        if self._job:
+            self.entry.after_cancel(self._job)
+            self._job = None
+
+    def invalidar(self):
+        """Descartar resultados previos (los datos cambiaron)"""
+        self._ultima = None
+        self._resultados = None
+
+    def ejecutar(self):
+        """Buscar de inmediato con el texto actual"""
+        self.cancelar()
+        self._pendiente = normalizar_texto(self.entry.get())
+        self._ejecutar_pendiente()
+
+    def _ejecutar_pendiente(self):
+        self._job = None
+        consulta = self._pendiente
+        if self._resultados is not None and self._ultima and self._ultima in consulta:
+            claves = self.filtrar(consulta, self._resultados)
+        else:
+            claves = self.buscar(consulta)
+
+        self._ultima = consulta
+        self._resultados = claves
+        self.mostrar(consulta, claves)
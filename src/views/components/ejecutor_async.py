@@ -0,0 +1,147 @@
+"""Ejecutor Asíncrono - Llamadas bloqueantes fuera del hilo de Tk"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+class EjecutorAsync:
+    """
+    Ejecuta funciones bloqueantes (HTTP) en un pool de hilos y entrega
+    los resultados en el hilo de Tk mediante after().
+
+    - Consultas idénticas en vuelo (misma clave) comparten un único Future.
+    - Dentro de un mismo canal, una consulta nueva reemplaza a la anterior:
+      si aún no empezó se cancela y, si ya empezó, su resultado se descarta.
+    - Solo se sondea la cola de resultados mientras hay trabajo pendiente.
+    """
+
+    def __init__(self, widget, max_workers=4, intervalo_ms=50):
+        """
+        Args:
+            widget: Widget de Tk usado para programar after()
+            max_workers: Hilos del pool
+            intervalo_ms: Cada cuánto se revisan los resultados terminados
+        """
+        self.widget = widget
+        self.intervalo_ms = intervalo_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EjecutorAsync')
+        self._resultados = queue.Queue()
+
+        self._en_vuelo = {}        # clave -> Future
+        self._suscriptores = {}    # clave -> [(canal, generación, al_terminar, al_fallar)]
+        self._canales = {}         # canal -> (generación vigente, clave)
+        self._generacion = 0
+        self._sondeo = None
+
+    def enviar(self, clave, funcion, *args, al_terminar=None, al_fallar=None, canal=None):
+        """
+        Ejecutar funcion(*args) en segundo plano
+
+        Args:
+            clave: Identifica la consulta (las iguales en vuelo se unifican)
+            funcion: Función bloqueante a ejecutar
+            al_terminar: Callback(resultado) en el hilo de Tk
+            al_fallar: Callback(excepción) en el hilo de Tk
+            canal: Grupo de consultas donde solo importa la última
+
+        Returns:
+            concurrent.futures.Future
+        """
+        self._generacion += 1
+        generacion = self._generacion
+
+        if canal is not None:
+            anterior = self._canales.get(canal)
+            self._canales[canal] = (generacion, clave)
+            if anterior and anterior[1] != clave:
+                self._descartar(anterior[1], canal)
+
+        futuro = self._en_vuelo.get(clave)
+        # Un Future cancelado nunca entregaría a nuevos suscriptores
+        if futuro is None or futuro.cancelled():
+            futuro = self._pool.submit(funcion, *args)
+            self._en_vuelo[clave] = futuro
+            self._suscriptores[clave] = []
+            futuro.add_done_callback(lambda f, clave=clave: self._resultados.put((clave, f)))
+        self._suscriptores[clave].append((canal, generacion, al_terminar, al_fallar))
+
+        self._programar_sondeo()
+        return futuro
+
+    def cancelar(self, canal):
+        """Descartar la consulta vigente de un canal"""
+        vigente = self._canales.pop(canal, None)
+        if vigente:
+            self._descartar(vigente[1], canal)
+
+    def ocupado(self, canal=None):
+        """Verificar si hay consultas en vuelo (de un canal o en total)"""
+        if canal is None:
+            return bool(self._en_vuelo)
+        vigente = self._canales.get(canal)
+        return bool(vigente and vigente[1] in self._en_vuelo)
+
+    def cerrar(self):
+        """Cancelar lo pendiente y liberar el pool sin esperar"""
+        if self._sondeo:
+            try:
+                self.widget.after_cancel(self._sondeo)
+            except Exception:
+                pass
+            self._sondeo = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ========== INTERNOS ==========
+
+    def _descartar(self, clave, canal):
+        """Quitar los suscriptores de un canal y cancelar si nadie más espera"""
+        suscriptores = self._suscriptores.get(clave)
+        if suscriptores is None:
+            return
+        suscriptores[:] = [s for s in suscriptores if s[0] != canal]
+        if not suscriptores and self._en_vuelo[clave].cancel():
+            del self._en_vuelo[clave]
+            del self._suscriptores[clave]
+
+    def _programar_sondeo(self):
+        if self._sondeo is None:
+            self._sondeo = self.widget.after(self.intervalo_ms, self._sondear)
+
+    def _sondear(self):
+        """Entregar en el hilo de Tk los resultados terminados"""
+        self._sondeo = None
+        while True:
+            try:
+                clave, futuro = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            self._entregar(clave, futuro)
+
+        if self._en_vuelo:
+            self._programar_sondeo()
+
+    def _entregar(self, clave, futuro):
+        # Reemplazado por un envío posterior de la misma clave
+        if self._en_vuelo.get(clave) is not futuro:
+            return
+        del self._en_vuelo[clave]
+        suscriptores = self._suscriptores.pop(clave, [])
+        if futuro.cancelled():
+            return
+
+        error = futuro.exception()
+        resultado = None if error else futuro.result()
+        for canal, generacion, al_terminar, al_fallar in suscriptores:
+            # Una consulta más reciente del mismo canal ya tomó el relevo
+            if canal is not None and self._canales.get(canal, (None,))[0] != generacion:
+                continue
+            if canal is not None:
+                del self._canales[canal]
+            try:
+                if error is None:
+                    if al_terminar:
+                        al_terminar(resultado)
+                elif al_fallar:
+                    al_fallar(error)
+                else:
+                    print(f"Error en tarea asíncrona: {error}")
+            except Exception as e:
+                print(f"Error al procesar resultado asíncrono: {e}")
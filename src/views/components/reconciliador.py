@@ -0,0 +1,96 @@
+"""Reconciliador de Treeview - Aplica solo las diferencias entre filas"""
+import bisect
+
+class ReconciliadorTabla:
+    """
+    Sincroniza un ttk.Treeview con una lista ordenada de filas.
+
+    Mantiene un mapa clave -> item del Treeview y, en cada sincronización,
+    calcula la diferencia con las filas deseadas: borra las que sobran,
+    inserta las nuevas, mueve solo las que cambiaron de orden relativo y
+    actualiza los valores modificados. Editar una fila cuesta O(1) llamadas
+    a Tk en lugar de recrear toda la tabla.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.items = {}     # clave -> iid
+        self.valores = {}   # clave -> tupla de valores mostrada
+        self.orden = []     # claves en el orden actual del Treeview
+
+    def sincronizar(self, filas):
+        """
+        Llevar el Treeview al estado deseado
+
+        Args:
+            filas: Iterable ordenado de (clave, valores)
+        """
+        deseadas = [(clave, tuple(valores)) for clave, valores in filas]
+        claves_deseadas = {clave for clave, _ in deseadas}
+
+        # 1. Borrar las filas que ya no están
+        sobrantes = [clave for clave in self.orden if clave not in claves_deseadas]
+        if sobrantes:
+            self.tree.delete(*[self.items.pop(clave) for clave in sobrantes])
+            for clave in sobrantes:
+                del self.valores[clave]
+
+        # 2. Filas conservadas que no necesitan moverse (subsecuencia creciente más larga)
+        actuales = [clave for clave in self.orden if clave in claves_deseadas]
+        posicion = {clave: i for i, clave in enumerate(actuales)}
+        estables = self._subsecuencia_estable(
+            [clave for clave, _ in deseadas if clave in posicion], posicion)
+
+        # 3. Insertar, mover y actualizar recorriendo el orden deseado
+        pendientes = len(actuales)
+        anterior = None
+        for clave, valores in deseadas:
+            iid = self.items.get(clave)
+            if iid is None:
+                iid = self.tree.insert('', self._indice_tras(anterior, pendientes), values=valores)
+                self.items[clave] = iid
+            else:
+                pendientes -= 1
+                if clave not in estables:
+                    # Desvincular primero para que el índice no dependa de su posición actual
+                    self.tree.detach(iid)
+                    self.tree.move(iid, '', self._indice_tras(anterior, pendientes))
+                if self.valores.get(clave) != valores:
+                    self.tree.item(iid, values=valores)
+            self.valores[clave] = valores
+            anterior = iid
+
+        self.orden = [clave for clave, _ in deseadas]
+
+    def _indice_tras(self, anterior, pendientes):
+        """Índice para colocar un item justo después de 'anterior'"""
+        if anterior is None:
+            return 0
+        if pendientes == 0:
+            # Ya no quedan filas conservadas sin procesar: va al final
+            return len(self.items)
+        return self.tree.index(anterior) + 1
+
+    @staticmethod
+    def _subsecuencia_estable(claves, posicion):
+        """Claves que forman la subsecuencia creciente más larga de posiciones actuales"""
+        colas = []        # menor posición final de cada longitud
+        indices = []      # índice en 'claves' de esa cola
+        previo = [-1] * len(claves)
+        for i, clave in enumerate(claves):
+            p = posicion[clave]
+            j = bisect.bisect_left(colas, p)
+            if j == len(colas):
+                colas.append(p)
+                indices.append(i)
+            else:
+                colas[j] = p
+                indices[j] = i
+            previo[i] = indices[j - 1] if j > 0 else -1
+
+        estables = set()
+        i = indices[-1] if indices else -1
+        while i != -1:
+            estables.add(claves[i])
+            i = previo[i]
+        return estables
@@ -0,0 +1,208 @@
+"""Tabla Virtual - Treeview que solo materializa las filas visibles"""
+from tkinter import ttk
+
+class TablaVirtual(ttk.Frame):
+    """
+    Lista virtualizada sobre ttk.Treeview.
+
+    La tabla mantiene un número fijo de filas (las que caben en pantalla) y,
+    al desplazarse, solo reasigna sus valores a partir de una lista ordenada
+    de claves. La cantidad de widgets no depende del tamaño de los datos.
+    """
+
+    ALTO_FILA = 20
+    ALTO_ENCABEZADO = 25
+
+    def __init__(self, parent, columnas, obtener_valores, height=15):
+        """
+        Args:
+            parent: Widget contenedor
+            columnas: Identificadores de columnas del Treeview
+            obtener_valores: Función clave -> tupla de valores a mostrar
+            height: Filas visibles iniciales
+        """
+        super().__init__(parent)
+        self.obtener_valores = obtener_valores
+        self.claves = []
+        self.inicio = 0
+        self.visibles = height
+        self.seleccionada = None
+        self._item_clave = {}  # iid de la fila -> clave mostrada
+
+        self.tree = ttk.Treeview(self, columns=columnas, show='headings', height=height,
+                                 selectmode='browse')
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+
+        alto = ttk.Style().lookup('Treeview', 'rowheight')
+        if alto:
+            self.alto_fila = int(alto)
+        else:
+            self.alto_fila = self.ALTO_FILA
+
+        self._filas = []
+        self._desvinculadas = set()
+        self._ajustar_filas(height)
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.desplazar(-3))
+        self.tree.bind('<Button-5>', lambda e: self.desplazar(3))
+        self.tree.bind('<Up>', self._on_flecha)
+        self.tree.bind('<Down>', self._on_flecha)
+        self.tree.bind('<Prior>', lambda e: self._desplazar_evento(-self.visibles))
+        self.tree.bind('<Next>', lambda e: self._desplazar_evento(self.visibles))
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+
+    # ========== API ==========
+
+    def set_claves(self, claves):
+        """Reemplazar la lista ordenada de claves a mostrar"""
+        self.claves = claves
+        # La clave seleccionada pudo borrarse o quedar fuera del filtro
+        if self.seleccionada is not None and self.seleccionada not in claves:
+            self.seleccionada = None
+        self.inicio = min(self.inicio, self._inicio_maximo())
+        self.refrescar()
+
+    def refrescar(self):
+        """Volver a pintar las filas visibles"""
+        fin = min(self.inicio + self.visibles, len(self.claves))
+        self._item_clave.clear()
+        seleccion = ()
+
+        for i, iid in enumerate(self._filas):
+            indice = self.inicio + i
+            if indice < fin:
+                clave = self.claves[indice]
+                self._item_clave[iid] = clave
+                self.tree.item(iid, values=self.obtener_valores(clave))
+                if iid in self._desvinculadas:
+                    self.tree.move(iid, '', i)
+                    self._desvinculadas.discard(iid)
+                if clave == self.seleccionada:
+                    seleccion = (iid,)
+            elif iid not in self._desvinculadas:
+                self.tree.detach(iid)
+                self._desvinculadas.add(iid)
+
+        # Mantener la selección solo si la clave está a la vista
+        if tuple(self.tree.selection()) != seleccion:
+            self.tree.selection_set(seleccion)
+        self._actualizar_scrollbar()
+
+    def clave_seleccionada(self):
+        """
+        Clave de la fila seleccionada (o None)
+
+        Si la fila quedó fuera de la vista al desplazarse, se vuelve a
+        mostrar: una acción nunca opera sobre una palabra que no se ve.
+        """
+        clave = self.seleccionada
+        if clave is None:
+            return None
+        try:
+            indice = self.claves.index(clave)
+        except ValueError:
+            self.seleccionada = None
+            return None
+        if not self.inicio <= indice < self.inicio + self.visibles:
+            self.mostrar_clave(clave, indice)
+        return clave
+
+    def mostrar_clave(self, clave, indice=None):
+        """
+        Desplazar hasta una clave y seleccionarla
+
+        Args:
+            clave: Clave a mostrar
+            indice: Posición de la clave en la lista, si ya se conoce
+        """
+        if indice is None:
+            try:
+                indice = self.claves.index(clave)
+            except ValueError:
+                return
+        self.seleccionada = clave
+        if indice < self.inicio:
+            self.inicio = indice
+        elif indice >= self.inicio + self.visibles:
+            self.inicio = min(indice - self.visibles + 1, self._inicio_maximo())
+        self.refrescar()
+
+    def desplazar(self, filas):
+        """Desplazar la ventana visible N filas"""
+        nuevo = min(max(0, self.inicio + filas), self._inicio_maximo())
+        if nuevo != self.inicio:
+            self.inicio = nuevo
+            self.refrescar()
+
+    def heading(self, columna, **kwargs):
+        self.tree.heading(columna, **kwargs)
+
+    def column(self, columna, **kwargs):
+        self.tree.column(columna, **kwargs)
+
+    def bind_tabla(self, secuencia, funcion):
+        self.tree.bind(secuencia, funcion)
+
+    # ========== INTERNOS ==========
+
+    def _inicio_maximo(self):
+        return max(0, len(self.claves) - self.visibles)
+
+    def _ajustar_filas(self, cantidad):
+        """Crear las filas que falten para cubrir la altura visible"""
+        while len(self._filas) < cantidad:
+            self._filas.append(self.tree.insert('', 'end', values=()))
+
+    def _actualizar_scrollbar(self):
+        total = len(self.claves)
+        if total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        self.scrollbar.set(self.inicio / total, min(1, (self.inicio + self.visibles) / total))
+
+    def _on_configure(self, event):
+        visibles = max(1, (event.height - self.ALTO_ENCABEZADO) // self.alto_fila)
+        if visibles != self.visibles:
+            self.visibles = visibles
+            self._ajustar_filas(visibles)
+            self.inicio = min(self.inicio, self._inicio_maximo())
+            self.refrescar()
+
+    def _on_scrollbar(self, accion, cantidad, unidad=None):
+        if accion == 'moveto':
+            self.inicio = min(max(0, int(float(cantidad) * len(self.claves))), self._inicio_maximo())
+            self.refrescar()
+        elif accion == 'scroll':
+            paso = self.visibles if unidad == 'pages' else 1
+            self.desplazar(int(cantidad) * paso)
+
+    def _on_mousewheel(self, event):
+        self.desplazar(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _desplazar_evento(self, filas):
+        self.desplazar(filas)
+        return 'break'
+
+    def _on_flecha(self, event):
+        """Mover la selección y desplazar al llegar a los bordes"""
+        if not self.claves:
+            return 'break'
+        paso = -1 if event.keysym == 'Up' else 1
+        seleccion = self.tree.selection()
+        if seleccion:
+            indice = self.inicio + self._filas.index(seleccion[0]) + paso
+        else:
+            indice = self.inicio
+        indice = min(max(0, indice), len(self.claves) - 1)
+        self.mostrar_clave(self.claves[indice], indice)
+        return 'break'
+
+    def _on_select(self, event):
+        seleccion = self.tree.selection()
+        if seleccion:
+            self.seleccionada = self._item_clave.get(seleccion[0])
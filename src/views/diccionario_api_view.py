@@ -2,6 +2,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from ..utils import AppConfig
+from .components.ejecutor_async import EjecutorAsync
 
 class DiccionarioAPIView(ttk.Frame):
     def __init__(self, parent, tts=None):
@@ -9,6 +10,7 @@ class DiccionarioAPIView(ttk.Frame):
         self.tts = tts
         self.dict_en = None
         self.dict_es = None
+        self.ejecutor = EjecutorAsync(self, max_workers=2)
         self.crear_ui()
         self.cargar_diccionarios()
     
@@ -95,10 +97,6 @@ class DiccionarioAPIView(ttk.Frame):
                                  "Los diccionarios requieren conexión a internet.\nAsegúrate de estar conectado.")
             return
         
-        # Limpiar resultados anteriores
-        for widget in self.result_frame.winfo_children():
-            widget.destroy()
-        
         lang = self.language.get()
         
         if lang == 'en':
@@ -111,7 +109,14 @@ class DiccionarioAPIView(ttk.Frame):
             messagebox.showerror("Error", "Diccionario no disponible")
             return
         
-        result = self.dict_en.lookup(palabra)
+        self._mostrar_buscando(palabra)
+        self.ejecutor.enviar(('en', palabra.lower()), self.dict_en.lookup, palabra,
+                             al_terminar=self._mostrar_ingles,
+                             al_fallar=self._mostrar_error, canal='busqueda')
+    
+    def _mostrar_ingles(self, result):
+        """Dibuja el resultado del diccionario inglés"""
+        self._limpiar_resultados()
         
         if 'error' in result:
             lbl = tk.Label(self.result_frame, text=f"❌ {result['error']}", 
@@ -184,7 +189,14 @@ class DiccionarioAPIView(ttk.Frame):
             messagebox.showerror("Error", "Diccionario no disponible")
             return
         
-        result = self.dict_es.lookup(palabra)
+        self._mostrar_buscando(palabra)
+        self.ejecutor.enviar(('es', palabra.lower()), self.dict_es.lookup, palabra,
+                             al_terminar=self._mostrar_espanol,
+                             al_fallar=self._mostrar_error, canal='busqueda')
+    
+    def _mostrar_espanol(self, result):
+        """Dibuja el resultado del diccionario español"""
+        self._limpiar_resultados()
         
         if 'error' in result:
             txt = self._create_selectable_text(self.result_frame, f"❌ {result['error']}",
@@ -250,10 +262,31 @@ class DiccionarioAPIView(ttk.Frame):
     
     def limpiar(self):
         """Limpia el campo de búsqueda y los resultados"""
+        self.ejecutor.cancelar('busqueda')
         self.entry_word.delete(0, 'end')
+        self._limpiar_resultados()
+    
+    def _limpiar_resultados(self):
         for widget in self.result_frame.winfo_children():
             widget.destroy()
     
+    def _mostrar_buscando(self, palabra):
+        """Indicador mientras la consulta está en curso"""
+        self._limpiar_resultados()
+        tk.Label(self.result_frame, text=f"⏳ Buscando \"{palabra}\"...",
+                font=(AppConfig.FONT_FAMILY, 12), bg=AppConfig.COLOR_BG,
+                fg=AppConfig.COLOR_FG).pack(pady=20)
+    
+    def _mostrar_error(self, error):
+        self._limpiar_resultados()
+        tk.Label(self.result_frame, text=f"❌ Error al buscar: {error}",
+                font=(AppConfig.FONT_FAMILY, 12), bg=AppConfig.COLOR_BG,
+                fg=AppConfig.COLOR_ERROR).pack(pady=20)
+    
+    def destroy(self):
+        self.ejecutor.cerrar()
+        super().destroy()
+    
     def _enable_text_selection(self, label):
         """Habilita selección y copia de texto en un Label"""
         # Menú contextual
@@ -38,11 +38,18 @@ class EstadisticasView(ttk.Frame):
         
         stats = self.vocab_controller.obtener_estadisticas()
         
+        # Agregados precalculados: no se recorre el historial de prácticas
+        hoy = self.storage.obtener_resumen_dia()
+        racha = self.storage.obtener_racha_estudio()
+        
         datos = [
             ("📚 Total de palabras", stats['total'], AppConfig.COLOR_ACCENT),
             ("🔊 Con pronunciación", stats['con_pronunciacion'], AppConfig.COLOR_SUCCESS),
             ("❌ Sin pronunciación", stats['sin_pronunciacion'], AppConfig.COLOR_ERROR),
-            ("📝 Con notas", stats['con_notas'], AppConfig.COLOR_FG)
+            ("📝 Con notas", stats['con_notas'], AppConfig.COLOR_FG),
+            ("🔥 Racha de estudio (días)", racha, AppConfig.COLOR_ACCENT),
+            ("📅 Palabras practicadas hoy", hoy['palabras_practicadas'], AppConfig.COLOR_FG),
+            ("✅ Aciertos hoy", f"{hoy['practicas_correctas']}/{hoy['practicas_totales']}", AppConfig.COLOR_SUCCESS)
         ]
         
         for texto, valor, color in datos:
@@ -84,23 +91,7 @@ class EstadisticasView(ttk.Frame):
         
         if archivo:
             try:
-                count = 0
-                with open(archivo, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        palabra = row.get('Inglés', '').strip()
-                        significado = row.get('Español', '').strip()
-                        
-                        if palabra and significado:
-                            try:
-                                self.vocab_controller.agregar_palabra(
-                                    palabra, significado,
-                                    row.get('Pronunciación', '').strip() or None,
-                                    row.get('Notas', '').strip() or None
-                                )
-                                count += 1
-                            except:
-                                pass
+                count = self.vocab_controller.importar_csv(archivo)
                 
                 self.actualizar()
                 messagebox.showinfo("Éxito", f"{count} palabras importadas correctamente")
@@ -1,7 +1,9 @@
 """Generic Table View - Para tabs con tablas simples"""
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.utils import AppConfig
+from src.utils import AppConfig, normalizar_texto
+from .components.reconciliador import ReconciliadorTabla
+from .components.busqueda_incremental import BusquedaIncremental
 
 class GenericTableView(ttk.Frame):
     def __init__(self, parent, title, columns, data, tts=None):
@@ -11,6 +13,9 @@ class GenericTableView(ttk.Frame):
         self.data = data
         self.tts = tts
         
+        # Texto normalizado de cada fila, calculado una sola vez
+        self.textos_busqueda = ['\n'.join(normalizar_texto(val) for val in row) for row in data]
+        
         self.crear_ui()
         self.cargar_datos()
     
@@ -22,7 +27,6 @@ class GenericTableView(ttk.Frame):
         ttk.Label(frame_buscar, text="🔍", font=(AppConfig.FONT_FAMILY, 14)).pack(side='left', padx=(0,5))
         self.entry_buscar = ttk.Entry(frame_buscar, width=30, font=(AppConfig.FONT_FAMILY, 11))
         self.entry_buscar.pack(side='left', padx=5, ipady=5)
-        self.entry_buscar.bind('<KeyRelease>', lambda e: self.buscar())
         
         ttk.Button(frame_buscar, text="🔍 Buscar", command=self.buscar).pack(side='left', padx=5)
         ttk.Button(frame_buscar, text="🧹 Limpiar", command=self.limpiar).pack(side='left', padx=5)
@@ -46,31 +50,32 @@ class GenericTableView(ttk.Frame):
         
         self.tree.pack(side='left', fill='both', expand=True, padx=(20,0), pady=(0,20))
         scrollbar.pack(side='right', fill='y', pady=(0,20), padx=(0,20))
+        
+        # Las filas se identifican por su posición en self.data
+        self.reconciliador = ReconciliadorTabla(self.tree)
+        self.busqueda = BusquedaIncremental(self.entry_buscar, self._buscar_indices,
+                                            self._filtrar_indices, self._mostrar_indices)
     
     def cargar_datos(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        for row in self.data:
-            self.tree.insert('', 'end', values=row)
+        self.reconciliador.sincronizar(enumerate(self.data))
+    
+    def _buscar_indices(self, query):
+        """Índices de las filas que contienen la consulta"""
+        return [i for i, texto in enumerate(self.textos_busqueda) if query in texto]
+    
+    def _filtrar_indices(self, query, indices):
+        """Refinar resultados previos con una consulta más larga"""
+        return [i for i in indices if query in self.textos_busqueda[i]]
+    
+    def _mostrar_indices(self, query, indices):
+        self.reconciliador.sincronizar((i, self.data[i]) for i in indices)
     
     def buscar(self):
-        query = self.entry_buscar.get().strip().lower()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not query:
-            self.cargar_datos()
-            return
-        
-        for row in self.data:
-            if any(query in str(val).lower() for val in row):
-                self.tree.insert('', 'end', values=row)
+        self.busqueda.ejecutar()
     
     def limpiar(self):
         self.entry_buscar.delete(0, 'end')
-        self.cargar_datos()
+        self.busqueda.ejecutar()
     
     def pronunciar(self):
         if not self.tts or not self.tts.esta_disponible():
@@ -12,6 +12,10 @@ class PracticaView(ttk.Frame):
         self.practica_palabra = tk.StringVar()
         self.practica_respuesta = tk.StringVar()
         self.practica_modo = tk.StringVar(value='ingles')
+        self.practica_estrategia = tk.StringVar(value='repaso')
+        
+        # Rellenar la cola de preguntas cuando la interfaz quede ociosa
+        self.practica_controller.sesion.programar = self.after_idle
         
         self.crear_ui()
         self.nueva_palabra()
@@ -33,6 +37,16 @@ class PracticaView(ttk.Frame):
                       value='espanol', bg=AppConfig.COLOR_BG, fg=AppConfig.COLOR_FG, 
                       selectcolor=AppConfig.COLOR_BUTTON, font=(AppConfig.FONT_FAMILY, 10)).pack(side='left', padx=10)
         
+        # Selector de estrategia
+        frame_estrategia = tk.Frame(container, bg=AppConfig.COLOR_BG)
+        frame_estrategia.pack(pady=(0,20))
+        tk.Radiobutton(frame_estrategia, text="Repaso espaciado", variable=self.practica_estrategia, 
+                      value='repaso', bg=AppConfig.COLOR_BG, fg=AppConfig.COLOR_FG, 
+                      selectcolor=AppConfig.COLOR_BUTTON, font=(AppConfig.FONT_FAMILY, 10)).pack(side='left', padx=10)
+        tk.Radiobutton(frame_estrategia, text="Dificultad", variable=self.practica_estrategia, 
+                      value='dificultad', bg=AppConfig.COLOR_BG, fg=AppConfig.COLOR_FG, 
+                      selectcolor=AppConfig.COLOR_BUTTON, font=(AppConfig.FONT_FAMILY, 10)).pack(side='left', padx=10)
+        
         # Palabra
         self.label_practica = tk.Label(container, textvariable=self.practica_palabra, 
                                        font=(AppConfig.FONT_FAMILY, 24, 'bold'), bg=AppConfig.COLOR_BG, 
@@ -61,7 +75,8 @@ class PracticaView(ttk.Frame):
     
     def nueva_palabra(self):
         self.practica_controller.cambiar_modo(self.practica_modo.get())
-        palabra = self.practica_controller.obtener_palabra_aleatoria()
+        self.practica_controller.cambiar_estrategia(self.practica_estrategia.get())
+        palabra = self.practica_controller.obtener_siguiente_palabra()
         if not palabra:
             self.practica_palabra.set("No hay palabras")
             return
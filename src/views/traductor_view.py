@@ -2,12 +2,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from ..utils import AppConfig
+from .components.ejecutor_async import EjecutorAsync
 
 class TraductorView(ttk.Frame):
     def __init__(self, parent, tts=None):
         super().__init__(parent)
         self.tts = tts
         self.translator = None
+        self.ejecutor = EjecutorAsync(self, max_workers=2)
         self.crear_ui()
         self.cargar_traductor()
     
@@ -56,6 +58,10 @@ class TraductorView(ttk.Frame):
         ttk.Button(btn_frame, text="🔄 Traducir", command=self.traducir).pack(side='left', padx=5)
         ttk.Button(btn_frame, text="🗑️ Limpiar", command=self.limpiar).pack(side='left', padx=5)
         
+        self.label_estado = tk.Label(container, text="", font=(AppConfig.FONT_FAMILY, 10, 'italic'),
+                                    bg=AppConfig.COLOR_BG, fg=AppConfig.COLOR_FG)
+        self.label_estado.pack()
+        
         # Resultado
         tk.Label(container, text="Traducción:", font=(AppConfig.FONT_FAMILY, 12, 'bold'),
                 bg=AppConfig.COLOR_BG, fg=AppConfig.COLOR_FG).pack(anchor='w', pady=(20,5))
@@ -86,22 +92,49 @@ class TraductorView(ttk.Frame):
         direction = self.direction.get()
         src, dest = direction.split('-')
         
-        try:
-            result = self.translator.translate(texto, src=src, dest=dest)
-            
-            self.text_output.config(state='normal')
-            self.text_output.delete("1.0", "end")
-            self.text_output.insert("1.0", result['text'])
-            self.text_output.config(state='disabled')
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al traducir: {str(e)}")
+        # Una traducción nueva reemplaza a la que siga en curso
+        self.label_estado.config(text="⏳ Traduciendo...")
+        self.ejecutor.enviar((texto, src, dest), self.translator.translate, texto, src, dest,
+                             al_terminar=self._mostrar_traduccion,
+                             al_fallar=self._mostrar_error, canal='traduccion')
+    
+    def _mostrar_traduccion(self, result):
+        self.label_estado.config(text=self._resumen_segmentos(result.get('segmentos')))
+        if 'error' in result:
+            messagebox.showerror("Error", f"Error al traducir: {result['error']}")
+            return
+        
+        self.text_output.config(state='normal')
+        self.text_output.delete("1.0", "end")
+        self.text_output.insert("1.0", result['text'])
+        self.text_output.config(state='disabled')
+    
+    def _resumen_segmentos(self, segmentos):
+        """Texto con los segmentos traducidos y la latencia de la API"""
+        if not segmentos:
+            return ""
+        de_api = [s['latencia'] for s in segmentos if not s['memoria']]
+        resumen = f"{len(segmentos)} segmentos, {len(segmentos) - len(de_api)} desde memoria"
+        if de_api:
+            resumen += f" · API: máx {max(de_api):.2f} s, media {sum(de_api) / len(de_api):.2f} s"
+        return resumen
+    
+    def _mostrar_error(self, error):
+        self.label_estado.config(text="")
+        messagebox.showerror("Error", f"Error al traducir: {str(error)}")
     
     def limpiar(self):
+        self.ejecutor.cancelar('traduccion')
+        self.label_estado.config(text="")
         self.text_input.delete("1.0", "end")
         self.text_output.config(state='normal')
         self.text_output.delete("1.0", "end")
         self.text_output.config(state='disabled')
     
+    def destroy(self):
+        self.ejecutor.cerrar()
+        super().destroy()
+    
     def pronunciar(self):
         if not self.tts:
             messagebox.showinfo("TTS no disponible", "Pronunciación no disponible")
@@ -1,7 +1,10 @@
 """Vocabulario View - Tab de gestión de vocabulario"""
+import bisect
 import tkinter as tk
 from tkinter import ttk, messagebox
 from src.utils import AppConfig
+from .components.tabla_virtual import TablaVirtual
+from .components.busqueda_incremental import BusquedaIncremental
 
 class VocabularioView(ttk.Frame):
     def __init__(self, parent, vocab_controller, tts):
@@ -10,6 +13,10 @@ class VocabularioView(ttk.Frame):
         self.tts = tts
         self.configure(style='TFrame')
         
+        # La tabla es virtual: solo existen las filas visibles
+        self.orden = []          # Palabras ordenadas alfabéticamente
+        self.claves_orden = []   # Clave de orden de cada palabra (paralela)
+        
         self.crear_ui()
         self.cargar_datos()
     
@@ -41,11 +48,14 @@ class VocabularioView(ttk.Frame):
         self.entry_buscar = ttk.Entry(frame_search, width=25, 
                                       font=(AppConfig.FONT_FAMILY, 11))
         self.entry_buscar.pack(side='right', padx=5, ipady=5)
-        self.entry_buscar.bind('<KeyRelease>', lambda e: self.buscar())
+        self.busqueda = BusquedaIncremental(self.entry_buscar, self._buscar_claves,
+                                            self._filtrar_claves, self._mostrar_claves)
         
         # Tabla
         columns = ('Inglés', 'Español', 'Pronunciación', 'Notas')
-        self.tree = ttk.Treeview(self, columns=columns, show='headings', height=15)
+        self.tabla = TablaVirtual(self, columns, self._valores_fila, height=15)
+        self.tree = self.tabla.tree
+        self.tabla.pack(fill='both', expand=True, padx=20, pady=(0,20))
         
         self.tree.heading('Inglés', text='🇬🇧 Inglés')
         self.tree.heading('Español', text='🇪🇸 Español')
@@ -57,53 +67,97 @@ class VocabularioView(ttk.Frame):
         self.tree.column('Pronunciación', width=200)
         self.tree.column('Notas', width=300)
         
-        scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side='left', fill='both', expand=True, padx=(20,0), pady=(0,20))
-        scrollbar.pack(side='right', fill='y', pady=(0,20), padx=(0,20))
-        
         self.tree.bind('<Double-Button-1>', lambda e: self.editar_palabra())
     
     def cargar_datos(self):
         """Cargar datos en la tabla"""
         self.mostrar_todas()
     
+    @staticmethod
+    def _clave_orden(palabra):
+        """Clave de ordenación alfabética"""
+        return str(palabra).lower()
+    
+    def _valores_fila(self, palabra):
+        """Valores a mostrar en la fila de una palabra"""
+        datos = self.vocab_controller.obtener_todas().get(palabra, {})
+        return (
+            palabra,
+            datos.get('significado', ''),
+            datos.get('pronunciacion', '-'),
+            datos.get('notas', '-')
+        )
+    
+    def _reconstruir_orden(self):
+        """Recalcular el índice ordenado de todas las palabras"""
+        self.orden = sorted(self.vocab_controller.obtener_todas().keys(), key=self._clave_orden)
+        self.claves_orden = [self._clave_orden(p) for p in self.orden]
+    
+    def _insertar_orden(self, palabra):
+        """Insertar una palabra en el índice ordenado"""
+        clave = self._clave_orden(palabra)
+        i = bisect.bisect_left(self.claves_orden, clave)
+        while i < len(self.orden) and self.claves_orden[i] == clave:
+            if self.orden[i] == palabra:
+                return i
+            i += 1
+        self.orden.insert(i, palabra)
+        self.claves_orden.insert(i, clave)
+        return i
+    
+    def _quitar_orden(self, palabra):
+        """Quitar una palabra del índice ordenado"""
+        clave = self._clave_orden(palabra)
+        i = bisect.bisect_left(self.claves_orden, clave)
+        while i < len(self.orden) and self.claves_orden[i] == clave:
+            if self.orden[i] == palabra:
+                del self.orden[i]
+                del self.claves_orden[i]
+                return
+            i += 1
+    
+    def _refrescar_tras_cambio(self, eliminada=None, agregada=None):
+        """Actualizar la tabla después de agregar, editar o eliminar"""
+        self.busqueda.invalidar()
+        if eliminada is not None:
+            self._quitar_orden(eliminada)
+        indice = self._insertar_orden(agregada) if agregada is not None else None
+        
+        if self.entry_buscar.get().strip():
+            self.buscar()
+        else:
+            self.tabla.set_claves(self.orden)
+            if agregada is not None:
+                self.tabla.mostrar_clave(agregada, indice)
+    
+    def _palabra_seleccionada(self):
+        """Palabra de la fila seleccionada (o None)"""
+        return self.tabla.clave_seleccionada()
+    
     def mostrar_todas(self):
         """Mostrar todas las palabras"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        palabras = self.vocab_controller.obtener_todas()
-        for palabra in sorted(palabras.keys(), key=lambda x: str(x).lower()):
-            datos = palabras[palabra]
-            self.tree.insert('', 'end', values=(
-                palabra,
-                datos.get('significado', ''),
-                datos.get('pronunciacion', '-'),
-                datos.get('notas', '-')
-            ))
+        self.busqueda.invalidar()
+        self._reconstruir_orden()
+        self.tabla.set_claves(self.orden)
     
     def buscar(self):
-        """Buscar palabras"""
-        query = self.entry_buscar.get().strip()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
+        """Buscar palabras con el texto actual (sin esperar al debounce)"""
+        self.busqueda.ejecutar()
+    
+    def _buscar_claves(self, query):
+        """Búsqueda completa: palabras ordenadas que coinciden"""
         if not query:
-            self.mostrar_todas()
-            return
+            return self.orden
         
         resultados = self.vocab_controller.buscar_palabras(query)
-        for palabra in sorted(resultados.keys()):
-            datos = resultados[palabra]
-            self.tree.insert('', 'end', values=(
-                palabra,
-                datos.get('significado', ''),
-                datos.get('pronunciacion', '-'),
-                datos.get('notas', '-')
-            ))
+        return sorted(resultados.keys(), key=self._clave_orden)
+    
+    def _filtrar_claves(self, query, palabras):
+        """Refinar resultados previos con una consulta más larga"""
+        return [p for p in palabras if self.vocab_controller.coincide_palabra(p, query)]
+    
+    def _mostrar_claves(self, query, palabras):
+        self.tabla.set_claves(palabras)
     
     def agregar_palabra(self):
         """Abrir modal para agregar palabra"""
@@ -135,15 +189,16 @@ class VocabularioView(ttk.Frame):
         
         def guardar():
             try:
+                palabra = entry_palabra.get().strip()
                 self.vocab_controller.agregar_palabra(
-                    entry_palabra.get().strip(),
+                    palabra,
                     entry_significado.get().strip(),
                     entry_pronunciacion.get().strip() or None,
                     entry_notas.get().strip() or None
                 )
                 messagebox.showinfo("Éxito", "Palabra guardada")
                 ventana.destroy()
-                self.mostrar_todas()
+                self._refrescar_tras_cambio(agregada=palabra)
             except ValueError as e:
                 messagebox.showwarning("Advertencia", str(e))
         
@@ -154,13 +209,11 @@ class VocabularioView(ttk.Frame):
     
     def editar_palabra(self):
         """Editar palabra seleccionada"""
-        seleccion = self.tree.selection()
-        if not seleccion:
+        palabra_actual = self._palabra_seleccionada()
+        if palabra_actual is None:
             messagebox.showwarning("Advertencia", "Selecciona una palabra")
             return
         
-        item = self.tree.item(seleccion[0])
-        palabra_actual = item['values'][0]
         datos_actuales = self.vocab_controller.obtener_todas().get(palabra_actual, {})
         
         ventana = tk.Toplevel(self)
@@ -195,16 +248,17 @@ class VocabularioView(ttk.Frame):
         
         def guardar():
             try:
+                nueva_palabra = entry_palabra.get().strip()
                 self.vocab_controller.editar_palabra(
                     palabra_actual,
-                    entry_palabra.get().strip(),
+                    nueva_palabra,
                     entry_significado.get().strip(),
                     entry_pronunciacion.get().strip() or None,
                     entry_notas.get().strip() or None
                 )
                 messagebox.showinfo("Éxito", "Palabra actualizada")
                 ventana.destroy()
-                self.mostrar_todas()
+                self._refrescar_tras_cambio(eliminada=palabra_actual, agregada=nueva_palabra)
             except ValueError as e:
                 messagebox.showwarning("Advertencia", str(e))
         
@@ -215,31 +269,25 @@ class VocabularioView(ttk.Frame):
     
     def eliminar_palabra(self):
         """Eliminar palabra seleccionada"""
-        seleccion = self.tree.selection()
-        if not seleccion:
+        palabra = self._palabra_seleccionada()
+        if palabra is None:
             messagebox.showwarning("Advertencia", "Selecciona una palabra")
             return
         
-        item = self.tree.item(seleccion[0])
-        palabra = str(item['values'][0])  # Convertir a string explícitamente
-        
         if messagebox.askyesno("Confirmar", f"¿Eliminar '{palabra}'?"):
             resultado = self.vocab_controller.eliminar_palabra(palabra)
             if resultado:
-                self.mostrar_todas()
+                self._refrescar_tras_cambio(eliminada=palabra)
             else:
                 messagebox.showerror("Error", f"No se pudo eliminar '{palabra}'")
     
     def pronunciar_seleccionada(self):
         """Pronunciar palabra seleccionada"""
-        seleccion = self.tree.selection()
-        if not seleccion:
+        palabra = self._palabra_seleccionada()
+        if palabra is None:
             messagebox.showwarning("Advertencia", "Selecciona una palabra")
             return
         
-        item = self.tree.item(seleccion[0])
-        palabra = item['values'][0]
-        
         if not self.tts.esta_disponible():
             messagebox.showinfo("TTS no disponible", 
                               "Instala pyttsx3: pip install pyttsx3")
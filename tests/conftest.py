@@ -0,0 +1,5 @@
+"""Configuración común de las pruebas"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,33 @@
+"""Pruebas de CacheRespuestas"""
+import sqlite3
+
+from src.integrations.cache import CacheRespuestas
+
+
+def _claves_en_disco(ruta):
+    conn = sqlite3.connect(ruta)
+    claves = {row[0] for row in conn.execute("SELECT clave FROM respuestas")}
+    conn.close()
+    return claves
+
+
+def test_abrir_purga_expirados(tmp_path):
+    ruta = tmp_path / 'cache.db'
+    cache = CacheRespuestas(ruta, ttl=3600, ttl_negativo=-1)
+    cache.guardar('hello', {'definicion': 'hola'})
+    cache.guardar('xyzzy', None, negativo=True)
+    cache.cerrar()
+    assert _claves_en_disco(ruta) == {'hello', 'xyzzy'}
+
+    cache = CacheRespuestas(ruta)
+    assert cache.obtener('hello') == {'definicion': 'hola'}
+    cache.cerrar()
+    assert _claves_en_disco(ruta) == {'hello'}
+
+
+def test_limpiar_expirados(tmp_path):
+    cache = CacheRespuestas(tmp_path / 'cache.db', ttl=-1)
+    cache.guardar('hello', 'hola')
+    assert cache.limpiar_expirados() == 1
+    assert cache.obtener('hello') is None
+    cache.cerrar()
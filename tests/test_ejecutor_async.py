@@ -0,0 +1,79 @@
+"""Pruebas del ejecutor asíncrono (sin Tk: after() se simula)"""
+import threading
+import time
+
+from src.views.components.ejecutor_async import EjecutorAsync
+
+
+class WidgetFalso:
+    """Sustituto de un widget de Tk que ejecuta after() al llamar a correr()"""
+
+    def __init__(self):
+        self.pendientes = []
+
+    def after(self, ms, funcion):
+        self.pendientes.append(funcion)
+        return len(self.pendientes)
+
+    def after_cancel(self, identificador):
+        pass
+
+    def correr(self, hasta, timeout=2):
+        limite = time.time() + timeout
+        while not hasta() and time.time() < limite:
+            if self.pendientes:
+                self.pendientes.pop(0)()
+            time.sleep(0.005)
+
+
+def test_unifica_consultas_iguales():
+    widget = WidgetFalso()
+    ejecutor = EjecutorAsync(widget, max_workers=2)
+    llamadas = []
+    resultados = []
+
+    def lenta(x):
+        llamadas.append(x)
+        time.sleep(0.05)
+        return x * 2
+
+    a = ejecutor.enviar('k', lenta, 1, al_terminar=resultados.append)
+    b = ejecutor.enviar('k', lenta, 1, al_terminar=resultados.append)
+    assert a is b
+    widget.correr(lambda: len(resultados) == 2)
+    assert resultados == [2, 2] and llamadas == [1]
+    ejecutor.cerrar()
+
+
+def test_reenviar_clave_cancelada_entrega_resultado():
+    widget = WidgetFalso()
+    ejecutor = EjecutorAsync(widget, max_workers=1)
+    liberar = threading.Event()
+    entregados = []
+
+    def tarea(nombre):
+        if nombre == 'A':
+            liberar.wait(2)
+        return nombre
+
+    ejecutor.enviar('A', tarea, 'A', al_terminar=entregados.append, canal='c')   # En curso
+    ejecutor.enviar('B', tarea, 'B', al_terminar=entregados.append, canal='c')   # Pendiente
+    ejecutor.enviar('C', tarea, 'C', al_terminar=entregados.append, canal='c')   # Cancela B
+    ejecutor.enviar('B', tarea, 'B', al_terminar=entregados.append, canal='c')   # B otra vez
+    liberar.set()
+
+    widget.correr(lambda: entregados)
+    widget.correr(lambda: False, timeout=0.2)
+    assert entregados == ['B']
+    assert not ejecutor.ocupado()
+    ejecutor.cerrar()
+
+
+def test_error_llega_a_al_fallar():
+    widget = WidgetFalso()
+    ejecutor = EjecutorAsync(widget)
+    errores = []
+    ejecutor.enviar('x', lambda: 1 / 0, al_fallar=errores.append)
+    widget.correr(lambda: errores)
+    assert isinstance(errores[0], ZeroDivisionError)
+    ejecutor.cerrar()
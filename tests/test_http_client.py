@@ -0,0 +1,85 @@
+"""Pruebas del cliente HTTP contra un servidor local"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.integrations.http_client import ClienteHTTP
+
+
+class Servidor:
+    """Servidor HTTP local que responde según 'respuestas' y anota cada petición"""
+
+    def __init__(self):
+        self.respuestas = []    # Códigos a devolver en orden (después, 200)
+        self.demora = 0
+        self.peticiones = 0
+        self.conexiones = set()
+        servidor = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                servidor.peticiones += 1
+                servidor.conexiones.add(self.client_address)
+                time.sleep(servidor.demora)
+                codigo = servidor.respuestas.pop(0) if servidor.respuestas else 200
+                cuerpo = b'{"ok": true}'
+                self.send_response(codigo)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(cuerpo)))
+                try:
+                    self.end_headers()
+                    self.wfile.write(cuerpo)
+                except OSError:
+                    pass    # El cliente abandonó la petición por timeout
+
+            def log_message(self, *args):
+                pass
+
+        self._http = ThreadingHTTPServer(('127.0.0.1', 0), Manejador)
+        self.url = f'http://127.0.0.1:{self._http.server_port}/api'
+        threading.Thread(target=self._http.serve_forever, daemon=True).start()
+
+    def cerrar(self):
+        self._http.shutdown()
+        self._http.server_close()
+
+
+@pytest.fixture
+def servidor():
+    servidor = Servidor()
+    yield servidor
+    servidor.cerrar()
+
+
+def test_reutiliza_la_conexion(servidor):
+    cliente = ClienteHTTP(backoff=0)
+    for _ in range(5):
+        assert cliente.get(servidor.url).status_code == 200
+    assert servidor.peticiones == 5
+    assert len(servidor.conexiones) == 1
+    cliente.cerrar()
+
+
+def test_reintenta_estados_transitorios(servidor):
+    servidor.respuestas = [503, 502]
+    cliente = ClienteHTTP(backoff=0)
+    assert cliente.get(servidor.url).status_code == 200
+    assert servidor.peticiones == 3
+    cliente.cerrar()
+
+
+def test_no_reintenta_timeout_de_lectura(servidor):
+    servidor.demora = 0.5
+    cliente = ClienteHTTP(timeout=(1, 0.2), backoff=0)
+    inicio = time.perf_counter()
+    with pytest.raises(requests.exceptions.RequestException):
+        cliente.get(servidor.url)
+    assert time.perf_counter() - inicio < 0.45
+    assert servidor.peticiones == 1
+    cliente.cerrar()
+
@@ -0,0 +1,60 @@
+"""Pruebas del journal de vocabulario"""
+from src.models.hybrid_storage import HybridStorage
+from src.models.journal import VocabularioJournal
+
+
+def _abrir(tmp_path):
+    storage = HybridStorage(tmp_path)
+    storage.archivador.detener()
+    return storage
+
+
+def test_reproduce_registros(tmp_path):
+    journal = VocabularioJournal(tmp_path / 'palabras.json')
+    journal.agregar([
+        {'op': 'set', 'palabra': 'a', 'datos': {'significado': 'uno'}},
+        {'op': 'set', 'palabra': 'b', 'datos': {'significado': 'dos'}},
+        {'op': 'del', 'palabra': 'a'},
+    ])
+
+    vocabulario = {}
+    assert VocabularioJournal(tmp_path / 'palabras.json').reproducir(vocabulario) == 3
+    assert vocabulario == {'b': {'significado': 'dos'}}
+
+
+def test_recupera_linea_truncada(tmp_path):
+    storage = _abrir(tmp_path)
+    storage.agregar_palabra('a', 'uno')
+    storage.agregar_palabra('b', 'dos')
+    journal = tmp_path / 'palabras.journal'
+    storage.practica_writer.detener()
+    storage.stats_db.cerrar()
+
+    # Cierre inesperado a mitad de escribir el último registro
+    datos = journal.read_bytes()
+    journal.write_bytes(datos[:-10])
+
+    storage = _abrir(tmp_path)
+    assert set(storage.obtener_todas_palabras()) == {'a'}
+    storage.agregar_palabra('c', 'tres')
+    storage.agregar_palabra('d', 'cuatro')
+    storage.practica_writer.detener()
+    storage.stats_db.cerrar()
+
+    storage = _abrir(tmp_path)
+    assert set(storage.obtener_todas_palabras()) == {'a', 'c', 'd'}
+    assert storage.obtener_palabra('d')['significado'] == 'cuatro'
+    storage.cerrar()
+
+
+def test_registro_sin_salto_de_linea(tmp_path):
+    journal = VocabularioJournal(tmp_path / 'palabras.json')
+    journal.path.write_text('{"op":"set","palabra":"a","datos":{}}', encoding='utf-8')
+
+    vocabulario = {}
+    journal.reproducir(vocabulario)
+    journal.agregar([{'op': 'set', 'palabra': 'b', 'datos': {}}])
+
+    vocabulario = {}
+    assert VocabularioJournal(tmp_path / 'palabras.json').reproducir(vocabulario) == 2
+    assert set(vocabulario) == {'a', 'b'}
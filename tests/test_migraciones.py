@@ -0,0 +1,89 @@
+"""Pruebas de las migraciones del esquema"""
+import sqlite3
+import time
+from datetime import datetime
+
+import pytest
+
+from src.models.database import Database
+
+
+solo_posix = pytest.mark.skipif(not hasattr(time, 'tzset'), reason='time.tzset solo existe en POSIX')
+
+
+@pytest.fixture
+def bogota(monkeypatch):
+    """Zona horaria fija (UTC-5, sin horario de verano)"""
+    monkeypatch.setenv('TZ', 'America/Bogota')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _base_anterior(ruta):
+    """Base de datos de antes de las migraciones 3 y 4, con prácticas en UTC"""
+    Database(ruta).cerrar()
+    conn = sqlite3.connect(ruta)
+    conn.executescript("""
+        DELETE FROM migraciones_aplicadas WHERE version = 4;
+        PRAGMA user_version = 2;
+        DELETE FROM migraciones_aplicadas WHERE version = 3;
+        INSERT INTO practicas (palabra, modo, correcta, fecha)
+        VALUES ('apple', 'ingles_espanol', 1, '2024-03-10 02:00:00'),
+               ('pear', 'ingles_espanol', 0, '2024-03-10 15:00:00.250000');
+        INSERT INTO estadisticas_diarias (fecha, palabras_practicadas, practicas_totales, practicas_correctas, tiempo_total)
+        VALUES ('2024-03-09', 0, 1, 1, 0), ('2024-03-10', 0, 1, 0, 0);
+    """)
+    conn.commit()
+    conn.close()
+
+
+@solo_posix
+def test_practicas_antiguas_pasan_a_hora_local(tmp_path, bogota):
+    ruta = tmp_path / 'statistics.db'
+    _base_anterior(ruta)
+
+    db = Database(ruta)
+    with db.get_connection() as conn:
+        fechas = dict(conn.execute("SELECT palabra, fecha FROM practicas").fetchall())
+        palabras = conn.execute("SELECT fecha, palabra FROM palabras_diarias ORDER BY fecha").fetchall()
+        modos = conn.execute("SELECT fecha, practicas_totales FROM estadisticas_modo ORDER BY fecha").fetchall()
+        dias = conn.execute("SELECT fecha, palabras_practicadas FROM estadisticas_diarias ORDER BY fecha").fetchall()
+    db.cerrar()
+
+    # Todas las filas anteriores a la migración se convierten, tengan o no fracción
+    assert fechas == {'apple': '2024-03-09 21:00:00', 'pear': '2024-03-10 10:00:00'}
+    assert [tuple(r) for r in palabras] == [('2024-03-09', 'apple'), ('2024-03-10', 'pear')]
+    assert [tuple(r) for r in modos] == [('2024-03-09', 1), ('2024-03-10', 1)]
+    assert [tuple(r) for r in dias] == [('2024-03-09', 1), ('2024-03-10', 1)]
+
+
+@solo_posix
+def test_practicas_nuevas_no_se_convierten(tmp_path, bogota):
+    ruta = tmp_path / 'statistics.db'
+    _base_anterior(ruta)
+    Database(ruta).cerrar()
+
+    # Escrita tras la migración, con microsegundo 0 (sin fracción en el texto)
+    db = Database(ruta)
+    db.registrar_practica('plum', 'ingles_espanol', True, fecha=datetime(2024, 3, 11, 12, 0, 0))
+    db.cerrar()
+
+    db = Database(ruta)
+    with db.get_connection() as conn:
+        fecha = conn.execute("SELECT fecha FROM practicas WHERE palabra = 'plum'").fetchone()[0]
+    db.cerrar()
+    assert fecha == '2024-03-11 12:00:00'
+
+
+def test_practica_nueva_en_hora_local(tmp_path):
+    db = Database(tmp_path / 'statistics.db')
+    antes = time.strftime('%Y-%m-%d %H:%M:%S')
+    db.registrar_practica('apple', 'ingles_espanol', True)
+    with db.get_connection() as conn:
+        fecha = conn.execute("SELECT fecha FROM practicas").fetchone()[0]
+    db.cerrar()
+
+    assert fecha[:19] >= antes
+    assert fecha[:10] == time.strftime('%Y-%m-%d')
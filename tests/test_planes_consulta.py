@@ -0,0 +1,41 @@
+"""Pruebas de los planes de consulta de Database"""
+from src.models.database import Database
+from src.models.migraciones import planes_consulta
+
+
+def _sin_indice(planes):
+    return {nombre: plan for nombre, (usa_indice, plan) in planes.items() if not usa_indice}
+
+
+def test_consultas_usan_indices(tmp_path):
+    db = Database(tmp_path / 'statistics.db')
+    planes = db.verificar_planes()
+    db.cerrar()
+
+    assert 'obtener_repasos' in planes
+    assert 'obtener_todo_progreso' in planes
+    assert _sin_indice(planes) == {}
+
+
+def test_consultas_del_archivo_usan_indices(tmp_path):
+    db = Database(tmp_path / 'statistics.db')
+    db.adjuntar_archivo(tmp_path / 'statistics_archive.db')
+    planes = db.verificar_planes()
+    db.cerrar()
+
+    assert 'obtener_historial_palabra (archivo)' in planes
+    assert 'archivador (lote)' in planes
+    assert _sin_indice(planes) == {}
+
+
+def test_detecta_recorrido_completo(tmp_path):
+    db = Database(tmp_path / 'statistics.db')
+    with db.get_connection() as conn:
+        planes = planes_consulta(conn, {
+            'sin_indice': ("SELECT * FROM practicas WHERE modo = ?", ('escrito',)),
+            'permitida': ("SELECT * FROM practicas", (), {'practicas'}),
+        })
+    db.cerrar()
+
+    assert planes['sin_indice'][0] is False
+    assert planes['permitida'][0] is True
@@ -0,0 +1,26 @@
+"""Pruebas de PracticaController"""
+import pytest
+
+from src.controllers.practica_controller import PracticaController
+from src.models.hybrid_storage import HybridStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = HybridStorage(tmp_path)
+    storage.archivador.detener()
+    storage.agregar_palabra('song', 'canción')
+    yield storage
+    storage.cerrar()
+
+
+def test_historial_guarda_la_respuesta_escrita(storage):
+    practica = PracticaController(storage)
+    practica.palabra_actual = 'song'
+
+    assert practica.verificar_respuesta('  Canción ')
+    assert practica.verificar_respuesta('cancion')
+
+    storage.practica_writer.flush()
+    respuestas = [p['respuesta_usuario'] for p in storage.obtener_historial_palabra('song')]
+    assert sorted(respuestas) == ['Canción', 'cancion']
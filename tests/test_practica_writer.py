@@ -0,0 +1,40 @@
+"""Pruebas de PracticaWriter"""
+import sqlite3
+
+from src.models.practica_writer import PracticaWriter
+
+
+class DatabaseFalsa:
+    """Falla las primeras escrituras como una base de datos bloqueada"""
+
+    def __init__(self, fallos):
+        self.fallos = fallos
+        self.escritas = []
+
+    def registrar_practicas(self, eventos):
+        if self.fallos:
+            self.fallos -= 1
+            raise sqlite3.OperationalError('database is locked')
+        self.escritas.extend(e['palabra'] for e in eventos)
+
+
+def test_reintenta_tras_un_fallo():
+    db = DatabaseFalsa(fallos=1)
+    writer = PracticaWriter(db, intervalo_ms=10)
+    writer.registrar('apple', 'ingles_espanol', True)
+    writer.registrar('pear', 'ingles_espanol', False)
+    writer.flush()
+    writer.flush()
+    writer.detener()
+
+    assert db.escritas == ['apple', 'pear']
+
+
+def test_detener_escribe_lo_que_fallo():
+    db = DatabaseFalsa(fallos=2)
+    writer = PracticaWriter(db, intervalo_ms=60000)
+    writer.registrar('apple', 'ingles_espanol', True)
+    writer.flush()       # Primer fallo
+    writer.detener()     # Falla en el hilo y se reintenta al detener
+
+    assert db.escritas == ['apple']
@@ -0,0 +1,96 @@
+"""Pruebas de la conservación del progreso al editar palabras"""
+import pytest
+
+from src.controllers.practica_controller import PracticaController
+from src.controllers.vocabulario_controller import VocabularioController
+from src.models.hybrid_storage import HybridStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = HybridStorage(tmp_path)
+    storage.archivador.detener()
+    storage.agregar_palabra('hello', 'hola')
+    storage.agregar_palabra('bye', 'adiós')
+    yield storage
+    storage.cerrar()
+
+
+def _responder_bien(practica, palabra, veces):
+    for _ in range(veces):
+        practica.palabra_actual = palabra
+        practica.respondida = False
+        practica.pregunta_actual = None
+        assert practica.verificar_respuesta('hola')
+
+
+def test_editar_notas_conserva_estado(storage):
+    practica = PracticaController(storage)
+    _responder_bien(practica, 'hello', 2)
+    estado = dict(practica.programador.estados['hello'])
+    conteos = list(practica.muestreo.conteos['hello'])
+
+    VocabularioController(storage).editar_palabra('hello', 'hello', 'hola', nuevas_notas='saludo')
+
+    assert practica.programador.estados['hello'] == estado
+    assert estado['repeticiones'] == 2 and estado['proxima'] > 0
+    assert practica.muestreo.conteos['hello'] == conteos == [2, 0, conteos[2]]
+    assert storage.obtener_palabra('hello')['notas'] == 'saludo'
+
+
+def test_renombrar_traslada_estado(storage):
+    practica = PracticaController(storage)
+    _responder_bien(practica, 'hello', 2)
+    estado = dict(practica.programador.estados['hello'])
+
+    VocabularioController(storage).editar_palabra('hello', 'hi', 'hola')
+
+    assert 'hello' not in practica.programador.estados
+    assert practica.programador.estados['hi'] == estado
+    assert practica.muestreo.conteos['hi'][:2] == [2, 0]
+    assert 'hello' not in practica.muestreo.conteos
+
+    # También tras reiniciar, desde la base de datos
+    repasos = {r['palabra']: r for r in storage.obtener_repasos()}
+    assert 'hello' not in repasos and repasos['hi']['repeticiones'] == 2
+    assert storage.obtener_progreso_palabra('hi')['veces_vista'] == 2
+
+
+def test_renombrar_traslada_historial(storage):
+    practica = PracticaController(storage)
+    _responder_bien(practica, 'hello', 2)
+
+    VocabularioController(storage).editar_palabra('hello', 'hi', 'hola')
+
+    assert len(storage.obtener_historial_palabra('hi')) == 2
+    assert storage.obtener_historial_palabra('hello') == []
+    assert storage.obtener_resumen_dia()['palabras_practicadas'] == 1
+
+
+def test_lote_revertido_deshace_renombre(storage):
+    practica = PracticaController(storage)
+    _responder_bien(practica, 'hello', 2)
+    estado = dict(practica.programador.estados['hello'])
+
+    with pytest.raises(RuntimeError):
+        with storage.lote():
+            storage.editar_palabra('hello', 'hi', 'hola')
+            raise RuntimeError('cancelado')
+
+    assert storage.existe_palabra('hello') and not storage.existe_palabra('hi')
+    assert practica.programador.estados['hello'] == estado
+    assert practica.muestreo.conteos['hello'][:2] == [2, 0]
+    assert storage.obtener_progreso_palabra('hello')['veces_vista'] == 2
+    assert storage.obtener_progreso_palabra('hi') is None
+
+
+def test_fallo_al_guardar_deshace_renombre(storage, monkeypatch):
+    practica = PracticaController(storage)
+    _responder_bien(practica, 'hello', 1)
+    monkeypatch.setattr(storage.journal, 'agregar', lambda registros: False)
+
+    assert storage.editar_palabra('hello', 'hi', 'hola') is False
+
+    assert storage.existe_palabra('hello') and not storage.existe_palabra('hi')
+    assert practica.programador.estados['hello']['repeticiones'] == 1
+    assert storage.obtener_progreso_palabra('hello')['veces_vista'] == 1
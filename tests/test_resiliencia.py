@@ -0,0 +1,99 @@
+"""Pruebas del disyuntor y del limitador de tasa con un reloj falso"""
+from src.integrations import resiliencia
+from src.integrations.resiliencia import (
+    ABIERTO, CERRADO, SEMIABIERTO, Disyuntor, LimitadorTasa
+)
+
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 1000.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def test_disyuntor_abre_tras_el_umbral():
+    reloj = Reloj()
+    disyuntor = Disyuntor(umbral_fallos=3, espera=30, reloj=reloj)
+
+    for _ in range(2):
+        assert disyuntor.permitir()
+        disyuntor.registrar_fallo()
+    assert disyuntor.estado == CERRADO
+
+    disyuntor.registrar_fallo()
+    assert disyuntor.estado == ABIERTO
+    assert not disyuntor.permitir()
+    reloj.ahora += 10
+    assert disyuntor.restante() == 20
+
+
+def test_disyuntor_semiabierto_una_sola_prueba():
+    reloj = Reloj()
+    disyuntor = Disyuntor(umbral_fallos=1, espera=30, reloj=reloj)
+    disyuntor.registrar_fallo()
+
+    reloj.ahora += 30
+    assert disyuntor.permitir()
+    assert disyuntor.estado == SEMIABIERTO
+    assert not disyuntor.permitir()
+
+    disyuntor.registrar_exito()
+    assert disyuntor.estado == CERRADO
+    assert disyuntor.permitir()
+
+
+def test_disyuntor_reabre_si_falla_la_prueba():
+    reloj = Reloj()
+    disyuntor = Disyuntor(umbral_fallos=3, espera=30, reloj=reloj)
+    for _ in range(3):
+        disyuntor.registrar_fallo()
+
+    reloj.ahora += 31
+    assert disyuntor.permitir()
+    disyuntor.registrar_fallo()
+    assert disyuntor.estado == ABIERTO
+    assert disyuntor.restante() == 30
+
+    # liberar() devuelve la prueba sin contar un fallo
+    reloj.ahora += 30
+    assert disyuntor.permitir()
+    disyuntor.liberar()
+    assert disyuntor.permitir()
+
+
+def test_limitador_rafaga_y_recarga(monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(resiliencia.time, 'sleep', lambda segundos: None)
+    limitador = LimitadorTasa(tasa=2, capacidad=3, reloj=reloj)
+
+    assert all(limitador.adquirir(timeout=0) for _ in range(3))
+    assert not limitador.adquirir(timeout=0)
+
+    # 2 tokens por segundo: en 0,25 s se recupera medio token
+    reloj.ahora += 0.25
+    assert not limitador.adquirir(timeout=0.1)
+    reloj.ahora += 0.25
+    assert limitador.adquirir(timeout=0)
+
+    # La recarga no supera la capacidad
+    reloj.ahora += 100
+    assert all(limitador.adquirir(timeout=0) for _ in range(3))
+    assert not limitador.adquirir(timeout=0)
+
+
+def test_limitador_espera_lo_necesario(monkeypatch):
+    reloj = Reloj()
+    esperas = []
+
+    def dormir(segundos):
+        esperas.append(segundos)
+        reloj.ahora += segundos
+
+    monkeypatch.setattr(resiliencia.time, 'sleep', dormir)
+    limitador = LimitadorTasa(tasa=4, capacidad=1, reloj=reloj)
+
+    assert limitador.adquirir()
+    assert limitador.adquirir()
+    assert esperas == [0.25]
@@ -0,0 +1,50 @@
+"""Pruebas de la selección de TablaVirtual (sin pantalla)"""
+from src.views.components.tabla_virtual import TablaVirtual
+
+
+def _tabla(claves):
+    # Sin Tk: solo interesa el estado de la selección, no el pintado
+    tabla = TablaVirtual.__new__(TablaVirtual)
+    tabla.claves = claves
+    tabla.inicio = 0
+    tabla.visibles = 15
+    tabla.seleccionada = None
+    tabla.refrescar = lambda: None
+    return tabla
+
+
+def test_filtro_descarta_seleccion():
+    tabla = _tabla(['apple', 'banana', 'cherry'])
+    tabla.mostrar_clave('banana')
+    assert tabla.clave_seleccionada() == 'banana'
+
+    tabla.set_claves(['apple', 'cherry'])
+    assert tabla.clave_seleccionada() is None
+
+
+def test_filtro_conserva_seleccion_visible():
+    tabla = _tabla(['apple', 'banana', 'cherry'])
+    tabla.mostrar_clave('banana')
+
+    tabla.set_claves(['banana'])
+    assert tabla.clave_seleccionada() == 'banana'
+
+
+def test_borrado_en_la_lista_actual():
+    claves = ['apple', 'banana', 'cherry']
+    tabla = _tabla(claves)
+    tabla.mostrar_clave('cherry')
+
+    # La vista quita la palabra de su lista antes de volver a filtrar
+    claves.remove('cherry')
+    assert tabla.clave_seleccionada() is None
+
+
+def test_seleccion_fuera_de_vista_vuelve_a_mostrarse():
+    tabla = _tabla([f'palabra{i:03d}' for i in range(100)])
+    tabla.mostrar_clave('palabra002')
+    tabla.desplazar(50)
+    assert tabla.inicio == 50
+
+    assert tabla.clave_seleccionada() == 'palabra002'
+    assert tabla.inicio <= 2 < tabla.inicio + tabla.visibles
@@ -0,0 +1,30 @@
+"""Pruebas de la división de consultas de TranslatorService"""
+from src.integrations.translator import dividir_consulta
+
+
+def _bytes(partes):
+    return [len(p.encode('utf-8')) for p in partes[::2]]
+
+
+def test_oraciones_cortas_no_se_dividen():
+    assert dividir_consulta('Hi. How are you?') == ['Hi.', ' ', 'How are you?']
+
+
+def test_oracion_larga_se_trocea_por_palabras():
+    texto = ' '.join(['palabra'] * 100)
+    partes = dividir_consulta(texto, limite=50)
+
+    assert max(_bytes(partes)) <= 50
+    assert set(partes[1::2]) == {' '}
+    assert ''.join(partes) == texto
+
+
+def test_palabra_mas_larga_que_el_limite():
+    palabra = 'ñ' * 300   # 600 bytes en UTF-8
+    texto = f"Una {palabra} larga"
+    partes = dividir_consulta(texto, limite=451)
+
+    assert max(_bytes(partes)) <= 451
+    # Ningún trozo parte un carácter y se recompone el texto original
+    assert ''.join(partes) == texto
+    assert partes[::2] == ['Una', 'ñ' * 225, 'ñ' * 75 + ' larga']